@@ -0,0 +1,60 @@
+"""benchmark loading a long list into an AutoArray with `extend` (widgets created with
+their value, children set once, one value change) vs. `add_row` per item followed by
+setting each widget value. counts the messages sent to the frontend."""
+
+import collections
+import contextlib
+
+import ipywidgets as w
+from ipywidgets.widgets.tests.utils import setup_test_comm
+from ipyautoui.custom.iterable import AutoArray
+from wide_models import report, timeit
+
+ITEMS = {"type": "integer", "default": 0}
+
+
+@contextlib.contextmanager
+def count_messages():
+    sent = collections.Counter()
+    _send = w.Widget._send
+
+    def send(self, msg, buffers=None):
+        sent[id(self)] += 1
+        return _send(self, msg, buffers=buffers)
+
+    w.Widget._send = send
+    try:
+        yield sent
+    finally:
+        w.Widget._send = _send
+
+
+def row_by_row(values):
+    ui = AutoArray(items=ITEMS)
+    for _ in values:
+        ui.add_row(update_value=False)
+    for bx, v in zip(ui.boxes, values):
+        bx.widget.value = v
+    return ui
+
+
+def bulk(values):
+    ui = AutoArray(items=ITEMS)
+    ui.extend(values)
+    return ui
+
+
+if __name__ == "__main__":
+    setup_test_comm()
+    for n_rows in [1000, 5000]:
+        values = list(range(n_rows))
+        before = timeit(lambda: row_by_row(values), repeat=1)
+        after = timeit(lambda: bulk(values), repeat=1)
+        report(f"load list x {n_rows} items", before, after)
+        for fn in [row_by_row, bulk]:
+            with count_messages() as sent:
+                ui = fn(values)
+            print(
+                f"{'':<45} {fn.__name__}: bx_boxes messages={sent[id(ui.bx_boxes)]}"
+                f" total={sum(sent.values())}"
+            )
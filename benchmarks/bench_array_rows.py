@@ -0,0 +1,56 @@
+"""benchmark building and editing a large AutoArray with the key -> box index
+(`Array.di_boxes`) vs. the previous linear `_get_attribute` scans, with a full
+`_sort_boxes` and `bx_boxes.children` update on every inserted row."""
+
+from ipyautoui.custom.iterable import AutoArray
+from wide_models import report, timeit
+
+ITEMS = {"type": "integer", "default": 0}
+
+
+class LinearArray(AutoArray):
+    """emulates the previous O(n) per row behaviour"""
+
+    def _get_attribute(self, key, get):
+        return [getattr(bx, get) for bx in self.boxes if bx.key == key][0]
+
+    def _insert_box(self, bx, position: int):
+        self._boxes.insert(position, bx)
+        self._sort_boxes()
+
+    def _insert_row(self, **kwargs):
+        bx = super()._insert_row(**kwargs)
+        self._update_boxes()
+        return bx
+
+    def _insert_rows(self, values):
+        boxes = [self._insert_row() for _ in values]
+        for bx, v in zip(boxes, values):
+            bx.widget.value = v
+        return boxes
+
+
+def build(cls, n_rows):
+    ui = cls(items=ITEMS, fn_remove=lambda box: None)
+    ui.value = list(range(n_rows))
+    return ui
+
+
+def edit(ui, n_edits=50):
+    for n in range(n_edits):
+        key = ui.boxes[len(ui.boxes) // 2].key
+        ui.add_row(key=key)
+        ui.remove_row(key=key)
+        ui.boxes[n].widget.value = -n
+
+
+if __name__ == "__main__":
+    for n_rows in [500, 1000, 2000]:
+        before = timeit(lambda: build(LinearArray, n_rows), repeat=1)
+        after = timeit(lambda: build(AutoArray, n_rows), repeat=1)
+        report(f"build array x {n_rows} rows", before, after)
+
+        linear, keyed = build(LinearArray, n_rows), build(AutoArray, n_rows)
+        before = timeit(lambda: edit(linear), repeat=1)
+        after = timeit(lambda: edit(keyed), repeat=1)
+        report(f"insert/remove/edit x 50 ({n_rows} rows)", before, after)
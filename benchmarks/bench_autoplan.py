@@ -0,0 +1,39 @@
+"""benchmark the mapping stage of `AutoUi` for a nested model, loading a saved UI plan
+vs. mapping the schema with cold caches (as on a kernel start)."""
+
+import tempfile
+import pathlib
+
+import ipyautoui._utils as utils
+import ipyautoui.automapschema as aumap
+from ipyautoui.autoplan import compile_plan, get_plan, load_plan
+from wide_models import create_nested_model, create_wide_model, report, timeit
+
+
+def clear_caches():
+    utils.RESOLVED_SCHEMA_CACHE.clear()
+    aumap.MAP_WIDGET_CACHE.clear()
+
+
+def map_schema(model):
+    """maps the root and all nested objects (as happens when the ui is created)"""
+    clear_caches()
+    return compile_plan(model)
+
+
+def from_plan(path):
+    clear_caches()
+    return aumap.callers_from_plan(load_plan(path, path.stem)["callers"])
+
+
+if __name__ == "__main__":
+    fdir = pathlib.Path(tempfile.mkdtemp())
+    for name, model in {
+        "wide (300 fields)": create_wide_model(300),
+        "nested (depth=3, width=5)": create_nested_model(3, 5),
+    }.items():
+        plan = get_plan(model, fdir=fdir)
+        path = fdir / f"{plan['schema_hash']}.json"
+        before = timeit(lambda: map_schema(model))
+        after = timeit(lambda: from_plan(path))
+        report(f"map schema vs. load plan {name}", before, after)
@@ -0,0 +1,28 @@
+"""benchmark `AutoUi(Model)` construction latency on a 200 field model, with cold
+(cleared) and warm schema / widget caller caches."""
+
+import ipyautoui._utils as utils
+import ipyautoui.automapschema as aumap
+from ipyautoui import AutoUi
+from ipyautoui.autoui import get_autoui
+from wide_models import create_wide_model, report, timeit
+
+
+def clear_caches():
+    utils.RESOLVED_SCHEMA_CACHE.clear()
+    aumap.MAP_WIDGET_CACHE.clear()
+
+
+def cold(fn, model):
+    clear_caches()
+    return fn(model)
+
+
+if __name__ == "__main__":
+    model = create_wide_model(200)
+    before = timeit(lambda: cold(get_autoui, model))
+    after = timeit(lambda: get_autoui(model))
+    report("get_autoui x 200 fields (cold vs. warm)", before, after)
+    before = timeit(lambda: cold(AutoUi, model), repeat=3)
+    after = timeit(lambda: AutoUi(model), repeat=3)
+    report("AutoUi x 200 fields (cold vs. warm)", before, after)
@@ -0,0 +1,66 @@
+"""benchmark loading a value into a wide form with a (dummy) frontend comm, sending
+every trait change as it happens vs. batched with `bulk_update` (one message per
+changed widget)."""
+
+import contextlib
+
+import ipywidgets as w
+from ipywidgets.widgets.tests.utils import setup_test_comm, teardown_test_comm
+
+import ipyautoui.watch_validate as wv
+from ipyautoui.autoobject import AutoObject
+from wide_models import create_wide_model, report, timeit
+
+
+@contextlib.contextmanager
+def no_hold_sync(*widgets):
+    yield {"messages": 0}
+
+
+def count_messages(fn) -> int:
+    count = 0
+    _send = w.Widget._send
+
+    def send(self, msg, buffers=None):
+        nonlocal count
+        count += 1
+        return _send(self, msg, buffers=buffers)
+
+    w.Widget._send = send
+    try:
+        fn()
+    finally:
+        w.Widget._send = _send
+    return count
+
+
+def get_values(ui):
+    """the default value and a value with the numbers and nulls changed"""
+    a = ui.value
+    number = lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+    b = a | {k: v + 1 for k, v in a.items() if number(v)}
+    b = b | {k: "1" for k, v in a.items() if v is None}
+    return a, b
+
+
+def reload(ui, values):
+    for v in values:
+        ui.value = v
+
+
+if __name__ == "__main__":
+    setup_test_comm()
+    hold_sync_all = wv.hold_sync_all
+    for n_fields in [100, 300]:
+        model = create_wide_model(n_fields)
+        ui = AutoObject.from_pydantic_model(model)
+        values = get_values(ui)
+        wv.hold_sync_all = no_hold_sync
+        before = timeit(lambda: reload(ui, values))
+        n_before = count_messages(lambda: reload(ui, values))
+        wv.hold_sync_all = hold_sync_all
+        after = timeit(lambda: reload(ui, values))
+        n_after = count_messages(lambda: reload(ui, values))
+        report(f"2 value loads {n_fields} fields", before, after)
+        print(f"{'':<45} messages: before={n_before} after={n_after}")
+    teardown_test_comm()
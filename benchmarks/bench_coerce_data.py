@@ -0,0 +1,95 @@
+"""benchmark `GridSchema.coerce_data` (column-wise fills, 1no reindex) vs. the previous
+per-cell `apply` and `reindex` / `rename` copies, for 10k, 100k and 1M rows."""
+
+import typing as ty
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field, RootModel
+from ipyautoui.automapschema import get_resolved_schema
+from ipyautoui.custom.autogrid import GridSchema
+from wide_models import report, timeit
+
+
+class Row(BaseModel):
+    a: int = Field(1, title="A")
+    b: float = Field(1.5, title="B")
+    c: str = Field("c", title="C")
+    d: bool = Field(True, title="D")
+    e: list[int] = Field([1], title="E")
+    f: ty.Optional[str] = Field(None, title="F")
+
+
+class Rows(RootModel):
+    root: list[Row]
+
+
+def legacy_coerce_data(self, data, order=None, transposed=False):
+    """the previous implementation"""
+
+    def fill_with_default(col):
+        default_value = self._get_default_row().get(col.name)
+        if default_value is None:
+            return col
+        else:
+            return col.apply(
+                lambda x: (
+                    default_value
+                    if (pd.isna(x).all() if isinstance(x, list) else pd.isna(x))
+                    else x
+                )
+            )
+
+    if order is None:
+        order = self.default_order
+    col_names = list(data.columns)
+    bykeys = set(col_names) <= set(self.map_name_index.keys())
+    if len(col_names) > len(order):
+        if bykeys:
+            drop = [l for l in col_names if l not in order]
+        else:
+            drop = [l for l in col_names if l not in self.get_order_titles(order)]
+        data = data.drop(drop, axis=1)
+    if len(col_names) < len(order):
+        if bykeys:
+            data = data.reindex(columns=order)
+        else:
+            data = data.reindex(columns=[self.map_name_index[x] for x in order])
+    data = data.apply(fill_with_default)
+    if bykeys:
+        data = data.rename(
+            columns={k: v for k, v in self.map_name_index.items() if k in data.columns}
+        )
+    data = data.reindex(self.get_index(order), axis=1)
+    data.index = pd.RangeIndex(len(data))
+    if transposed:
+        data = data.T
+    return data
+
+
+def create_data(n_rows: int) -> pd.DataFrame:
+    """rows with ~10% missing values in each column"""
+    rng = np.random.default_rng(0)
+    missing = lambda: rng.random(n_rows) < 0.1
+    b = rng.random(n_rows)
+    b[missing()] = np.nan
+    c = pd.Series(["x"] * n_rows, dtype=object)
+    c[missing()] = None
+    e = pd.Series([[1, 2]] * n_rows, dtype=object)
+    e[missing()] = None
+    return pd.DataFrame(
+        {"a": rng.integers(0, 10, n_rows), "b": b, "c": c, "e": e}
+    )  # "d" and "f" missing
+
+
+if __name__ == "__main__":
+    gridschema = GridSchema(get_resolved_schema(Rows))
+    for n_rows in [10_000, 100_000, 1_000_000]:
+        data = create_data(n_rows)
+        pd.testing.assert_frame_equal(
+            legacy_coerce_data(gridschema, data), gridschema.coerce_data(data)
+        )
+        repeat = 1 if n_rows > 100_000 else 3
+        before = timeit(lambda: legacy_coerce_data(gridschema, data), repeat=repeat)
+        after = timeit(lambda: gridschema.coerce_data(data), repeat=repeat)
+        report(f"coerce_data x {n_rows} rows", before, after)
@@ -0,0 +1,51 @@
+"""benchmark adding and deleting a row of a large EditGrid with `AutoGrid.append_rows` /
+`delete_rows` (only new rows coerced, backing frame updated in place) vs. assigning the
+whole value (`pd.DataFrame(value)`, `coerce_data` and a new data schema)."""
+
+import typing as ty
+
+from pydantic import BaseModel, Field, RootModel
+from ipyautoui.custom.editgrid import EditGrid
+from wide_models import report, timeit
+
+
+class Row(BaseModel):
+    string: str = "a"
+    inty: int = 1
+    floaty: float = 1.5
+    booly: bool = True
+    listy: ty.List[int] = [1]
+
+
+class Grid(RootModel):
+    root: ty.List[Row] = Field(json_schema_extra=dict(format="dataframe"))
+
+
+def add_whole_value(egrid):
+    egrid.value = tuple(list(egrid.value) + [Row().model_dump()])
+
+
+def add_in_place(egrid):
+    egrid.grid.append_rows([Row().model_dump()])
+    egrid._reset_transforms()
+
+
+def delete_whole_value(egrid):
+    egrid.value = [v for n, v in enumerate(egrid.value) if n != 0]
+
+
+def delete_in_place(egrid):
+    egrid.grid.delete_rows([0])
+    egrid._reset_transforms()
+
+
+if __name__ == "__main__":
+    for n_rows in [1_000, 10_000, 50_000]:
+        value = [Row(inty=n).model_dump() for n in range(n_rows)]
+        egrid = EditGrid(schema=Grid, value=value)
+        before = timeit(lambda: add_whole_value(egrid), repeat=3)
+        after = timeit(lambda: add_in_place(egrid), repeat=3)
+        report(f"add row x {n_rows} rows", before, after)
+        before = timeit(lambda: delete_whole_value(egrid), repeat=3)
+        after = timeit(lambda: delete_in_place(egrid), repeat=3)
+        report(f"delete row x {n_rows} rows", before, after)
@@ -0,0 +1,35 @@
+"""benchmark `remove_non_present_kwargs` with the per-class accepted kwargs cache vs.
+uncached `inspect`/`traits` introspection, and `map_widget` on a wide model."""
+
+import ipyautoui._utils as utils
+import ipyautoui.automapschema as aumap
+from ipyautoui.autobox import AutoBox
+from bench_map_widget import map_all
+from wide_models import create_wide_model, report, timeit
+
+
+def uncached(call, di):
+    argspec = {k: v for k, v in di.items() if k in utils._argspec_names(call)}
+    traits = {k: v for k, v in di.items() if k in utils._trait_names(call)}
+    return {**argspec, **traits}
+
+
+if __name__ == "__main__":
+    di = {"title": "a", "description": "b", "nullable": True, "value": 1}
+    before = timeit(lambda: [uncached(AutoBox, di) for _ in range(1000)])
+    after = timeit(
+        lambda: [utils.remove_non_present_kwargs(AutoBox, di) for _ in range(1000)]
+    )
+    report("remove_non_present_kwargs(AutoBox) x 1000", before, after)
+
+    model, schema = aumap._init_model_schema(create_wide_model(300))
+    properties, index = schema["properties"], aumap.get_widgets_map_index()
+    aumap.MAP_WIDGET_CACHE.resize(0)  # isolate introspection cost
+    after = timeit(lambda: map_all(index, properties))
+    get_accepted_kwargs = utils.get_accepted_kwargs
+    utils.get_accepted_kwargs = lambda call: utils._argspec_names(
+        call
+    ) | utils._trait_names(call)
+    before = timeit(lambda: map_all(index, properties))
+    utils.get_accepted_kwargs = get_accepted_kwargs
+    report("map_widget (uncached) x 300 properties", before, after)
@@ -0,0 +1,26 @@
+"""benchmark time-to-first-render of an AutoObject with many nested sub-objects,
+creating every nested widget up front vs. `lazy_nested=True` (nested widgets created
+when first opened)."""
+
+from ipyautoui.autoobject import AutoObject
+from wide_models import create_nested_model, report, timeit
+
+
+def build(model, lazy_nested):
+    return AutoObject.from_pydantic_model(model, lazy_nested=lazy_nested)
+
+
+def open_one(model):
+    ui = build(model, True)
+    ui.di_boxes["nested_0"].tgl.value = True
+
+
+if __name__ == "__main__":
+    for depth, width in [(1, 40), (2, 8), (3, 5)]:
+        model = create_nested_model(depth, width)
+        name = f"depth={depth}, width={width}"
+        before = timeit(lambda: build(model, False), repeat=3)
+        after = timeit(lambda: build(model, True), repeat=3)
+        report(f"first render {name}", before, after)
+        after = timeit(lambda: open_one(model), repeat=3)
+        report(f"first render + open 1 {name}", before, after)
@@ -0,0 +1,76 @@
+"""benchmark `map_widget` with the compiled dispatch index vs. a linear scan of every
+`fn_filt` predicate on a wide schema, and with a warm `MAP_WIDGET_CACHE` vs. no cache.
+"""
+
+import contextlib
+import functools
+import io
+
+import ipyautoui.automapschema as aumap
+from wide_models import create_wide_model, report, timeit
+
+
+def count_predicate_calls(index, properties) -> int:
+    calls = 0
+
+    def counted(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    index.filters = tuple((k, counted(fn), t) for k, fn, t in index.filters)
+    index.buckets = {}
+    map_all(index, properties)
+    return calls
+
+
+def match(index, di):
+    return [n for n, fn in index.candidates(di) if fn(di)[0]]
+
+
+def match_all(index, properties):
+    """only the predicate stage of `map_widget`"""
+    return {k: match(index, dict(v)) for k, v in properties.items()}
+
+
+def map_all(index, properties):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return {
+            k: aumap.map_widget(dict(v), widgets_map=index)
+            for k, v in properties.items()
+        }
+
+
+if __name__ == "__main__":
+    maxsize = aumap.MAP_WIDGET_CACHE.maxsize
+    for n_fields in [100, 300, 1000]:
+        model, schema = aumap._init_model_schema(create_wide_model(n_fields))
+        properties = schema["properties"]
+        widgets_map = aumap.get_widgets_map()
+        aumap.MAP_WIDGET_CACHE.resize(0)  # compare dispatch only
+        linear = aumap.WidgetsMapIndex(widgets_map, dispatch=False)
+        compiled = aumap.WidgetsMapIndex(widgets_map)
+
+        before = timeit(lambda: match_all(linear, properties))
+        after = timeit(lambda: match_all(compiled, properties))
+        report(f"fn_filt matching x {n_fields} properties", before, after)
+        before = timeit(lambda: map_all(linear, properties))
+        after = timeit(lambda: map_all(compiled, properties))
+        report(f"map_widget x {n_fields} properties", before, after)
+
+        n_linear = count_predicate_calls(
+            aumap.WidgetsMapIndex(widgets_map, dispatch=False), properties
+        )
+        n_compiled = count_predicate_calls(
+            aumap.WidgetsMapIndex(widgets_map), properties
+        )
+        print(f"{'':<45} fn_filt calls: linear={n_linear} compiled={n_compiled}")
+
+        before = timeit(lambda: map_all(compiled, properties))
+        aumap.MAP_WIDGET_CACHE.resize(maxsize)
+        after = timeit(lambda: map_all(compiled, properties))
+        report(f"map_widget (cached) x {n_fields} properties", before, after)
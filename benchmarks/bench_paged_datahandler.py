@@ -0,0 +1,71 @@
+"""benchmark posting a row to a database backed EditGrid with a PagedDataHandler (only
+the window of pages shown is fetched again) vs. a DataHandler (all data is fetched
+again with `fn_get_all_data`)."""
+
+import sqlite3
+import typing as ty
+
+from pydantic import BaseModel, Field, RootModel
+from ipyautoui.custom.editgrid import DataHandler, EditGrid, PagedDataHandler
+from wide_models import report, timeit
+
+
+class Row(BaseModel):
+    string: str = "a"
+    inty: int = 1
+    floaty: float = 1.5
+
+
+class Grid(RootModel):
+    root: ty.List[Row] = Field(json_schema_extra=dict(format="dataframe"))
+
+
+def create_db(n_rows: int) -> sqlite3.Connection:
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE row (string TEXT, inty INTEGER, floaty REAL)")
+    con.executemany(
+        "INSERT INTO row VALUES (?, ?, ?)", [(f"s{n}", n, n / 2) for n in range(n_rows)]
+    )
+    return con
+
+
+def select(con, sql="", params=()):
+    rows = con.execute(f"SELECT string, inty, floaty FROM row{sql}", params)
+    return [dict(string=s, inty=i, floaty=f) for s, i, f in rows]
+
+
+def handlers(con) -> dict:
+    return dict(
+        fn_post=lambda v: con.execute(
+            "INSERT INTO row VALUES (?, ?, ?)", tuple(v.values())
+        ),
+        fn_patch=lambda v: v,
+        fn_delete=lambda v: v,
+        fn_copy=lambda v: v,
+    )
+
+
+def post(egrid):
+    egrid._post()
+    egrid._save_add_to_grid()
+
+
+if __name__ == "__main__":
+    for n_rows in [10_000, 100_000, 500_000]:
+        con = create_db(n_rows)
+        all_data = DataHandler(fn_get_all_data=lambda: select(con), **handlers(con))
+        paged = PagedDataHandler(
+            fn_get_page=lambda offset, limit, sort, filter: select(
+                con, " ORDER BY rowid LIMIT ? OFFSET ?", (limit, offset)
+            ),
+            fn_count=lambda filter: con.execute("SELECT COUNT(*) FROM row").fetchone()[
+                0
+            ],
+            **handlers(con),
+        )
+        egrid_all = EditGrid(schema=Grid, datahandler=all_data)
+        egrid_all._reload_all_data()
+        egrid_paged = EditGrid(schema=Grid, datahandler=paged)
+        before = timeit(lambda: post(egrid_all), repeat=3)
+        after = timeit(lambda: post(egrid_paged), repeat=3)
+        report(f"post + reload, {n_rows} rows", before, after)
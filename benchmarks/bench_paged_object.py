@@ -0,0 +1,27 @@
+"""benchmark time-to-first-render of a very wide AutoObject, creating a widget for
+every field vs. `page_size=50` (widgets only created for the visible page), and the
+time to change page (recycling the row boxes)."""
+
+from ipyautoui.autoobject import AutoObject
+from wide_models import create_wide_model, report, timeit
+
+
+def build(model, page_size):
+    return AutoObject.from_pydantic_model(model, page_size=page_size)
+
+
+def next_page(ui):
+    ui.page = (ui.page + 1) % ui.n_pages
+
+
+if __name__ == "__main__":
+    for n_fields in [200, 500]:
+        model = create_wide_model(n_fields)
+        before = timeit(lambda: build(model, None), repeat=3)
+        after = timeit(lambda: build(model, 50), repeat=3)
+        report(f"first render x {n_fields} fields", before, after)
+
+        ui = build(model, 50)
+        print(f"{'':<45} widgets: paged={len(ui.di_widgets)} full={n_fields}")
+        after = timeit(lambda: next_page(ui), repeat=5)
+        report(f"change page x {n_fields} fields", before, after)
@@ -0,0 +1,37 @@
+"""benchmark refreshing `AutoGrid.records()` after a cell edit (as `EditGrid` does on
+every `count_changes`) with the records cache (only the edited row is rebuilt) vs. a
+full rebuild of the records from the dataframe."""
+
+import typing as ty
+
+import pandas as pd
+from pydantic import Field, RootModel
+from ipyautoui.custom.autogrid import AutoGrid
+from wide_models import FIELD_TYPES, create_wide_model, report, timeit
+
+N_COLUMNS = 20
+
+
+def create_grid(n_rows: int) -> AutoGrid:
+    row = create_wide_model(N_COLUMNS, field_types=FIELD_TYPES[:4], name="Row")
+
+    class Grid(RootModel):
+        root: ty.List[row] = Field(json_schema_extra=dict(format="dataframe"))
+
+    return AutoGrid(schema=Grid, data=pd.DataFrame([row().model_dump()] * n_rows))
+
+
+def edit(grid, records, n):
+    column = grid.column_names[1]
+    grid.set_cell_value(column, n % len(grid._data["data"]), n)
+    return records()
+
+
+if __name__ == "__main__":
+    for n_rows in [1_000, 10_000, 50_000]:
+        grid = create_grid(n_rows)
+        grid.comm.send = lambda data, **kwargs: None
+        edits = iter(range(1000))
+        before = timeit(lambda: edit(grid, grid._records, next(edits)))
+        after = timeit(lambda: edit(grid, grid.records, next(edits)))
+        report(f"edit cell + records, {N_COLUMNS} cols x {n_rows} rows", before, after)
@@ -0,0 +1,17 @@
+"""benchmark resolving model schemas with a warm `RESOLVED_SCHEMA_CACHE` vs.
+`model_json_schema` + `replace_refs` on every call."""
+
+import ipyautoui._utils as utils
+from wide_models import create_nested_model, create_wide_model, report, timeit
+
+if __name__ == "__main__":
+    models = {
+        "wide (300 fields)": create_wide_model(300),
+        "nested (depth=3, width=5)": create_nested_model(3, 5),
+    }
+    for name, model in models.items():
+        before = timeit(lambda: utils._replace_refs(model.model_json_schema()))
+        utils.get_resolved_schema(model)
+        after = timeit(lambda: utils.get_resolved_schema(model))
+        report(f"resolve schema {name}", before, after)
+    print(utils.RESOLVED_SCHEMA_CACHE.info())
@@ -0,0 +1,36 @@
+"""benchmark swapping the schema (`properties`) of a wide AutoObject where only a few
+fields are added / removed, rebuilding every widget vs. diffing the properties."""
+
+import ipyautoui.automapschema as aumap
+from ipyautoui.autoobject import AutoObject, map_properties
+from wide_models import create_wide_model, report, timeit
+
+
+def rebuild(ui, schemas):
+    """what setting `properties` did before: remap everything and re-init the ui"""
+    properties = schemas[ui.n % 2]
+    ui.di_callers = map_properties(properties, ui.widgets_map, ui.nested_widgets)
+    ui._init_ui()
+    ui._value = ui._get_value()
+    ui.n += 1
+
+
+def swap(ui, schemas):
+    ui.properties = schemas[ui.n % 2]
+    ui.n += 1
+
+
+if __name__ == "__main__":
+    for n_fields in [100, 300]:
+        _, s0 = aumap._init_model_schema(create_wide_model(n_fields))
+        _, s1 = aumap._init_model_schema(create_wide_model(n_fields + 5))
+        schemas = [s0["properties"], s1["properties"]]
+
+        ui = AutoObject.from_jsonschema(s0)
+        ui.n = 1
+        before = timeit(lambda: rebuild(ui, schemas), repeat=3)
+
+        ui = AutoObject.from_jsonschema(s0)
+        ui.n = 1
+        after = timeit(lambda: swap(ui, schemas), repeat=3)
+        report(f"swap schema (+/- 5 fields) x {n_fields}", before, after)
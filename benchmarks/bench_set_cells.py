@@ -0,0 +1,48 @@
+"""benchmark saving an edited row of a 60 column grid with `DataGrid.set_cells` (1no
+comparison, 1no frontend message per row) vs. `set_cell_value_if_different` per cell
+(a primary key lookup and a frontend message per cell)."""
+
+import typing as ty
+
+import pandas as pd
+from pydantic import Field, RootModel
+from ipyautoui.custom.autogrid import AutoGrid
+from wide_models import FIELD_TYPES, create_wide_model, report, timeit
+
+N_COLUMNS = 60
+
+
+def create_grid(n_rows: int) -> AutoGrid:
+    row = create_wide_model(N_COLUMNS, field_types=FIELD_TYPES[:4], name="Row")
+
+    class Grid(RootModel):
+        root: ty.List[row] = Field(json_schema_extra=dict(format="dataframe"))
+
+    return AutoGrid(schema=Grid, data=pd.DataFrame([row().model_dump()] * n_rows))
+
+
+def edited_row(row: dict, n: int) -> dict:
+    edit = lambda v: v if isinstance(v, bool) else v * n
+    return {k: edit(v) for k, v in row.items()}
+
+
+def per_cell(grid, index, value):
+    value = {grid.map_name_index[k]: v for k, v in value.items()}
+    changes = [grid.set_cell_value_if_different(k, index, v) for k, v in value.items()]
+    return [c for c in changes if c is not None]
+
+
+if __name__ == "__main__":
+    for n_rows in [1_000, 10_000, 50_000]:
+        grid = create_grid(n_rows)
+        row = grid.records()[0]
+        messages = []
+        grid.comm.send = lambda data, **kwargs: messages.append(data)
+        rows = iter(range(2, 1000))
+        before = timeit(lambda: per_cell(grid, 0, edited_row(row, next(rows))))
+        n_before = len(messages) // 5
+        messages.clear()
+        after = timeit(lambda: grid.set_row_value(0, edited_row(row, next(rows))))
+        n_after = len(messages) // 5
+        report(f"save row, {N_COLUMNS} cols x {n_rows} rows", before, after)
+        print(f"{'':<45} frontend messages: before={n_before} after={n_after}")
@@ -0,0 +1,44 @@
+"""benchmark a single child widget change ("keystroke") in an AutoObject with a
+pydantic model with `validation_mode="model"` (whole model validated on every change)
+vs. `validation_mode="field"` (only the changed field validated)."""
+
+import time
+
+from pydantic import model_validator
+
+from ipyautoui.autoobject import AutoObject
+from wide_models import create_wide_model, report, timeit
+
+
+def create_heavy_model(n_fields: int, cost: float = 1e-3):
+    """wide model with a model validator that takes `cost` seconds"""
+
+    class Heavy(create_wide_model(n_fields)):
+        @model_validator(mode="after")
+        def check(self):
+            time.sleep(cost)
+            return self
+
+    return Heavy
+
+
+def keystrokes(widget, n=100):
+    for i in range(n):
+        widget.value = float(i)
+
+
+if __name__ == "__main__":
+    for n_fields in [30, 300]:
+        for name, model in {
+            "": create_wide_model(n_fields),
+            " heavy validator": create_heavy_model(n_fields),
+        }.items():
+            uis = {
+                mode: AutoObject.from_pydantic_model(model, validation_mode=mode)
+                for mode in ["model", "field"]
+            }
+            before, after = [
+                timeit(lambda: keystrokes(ui.di_widgets["field_1"]), repeat=3)
+                for ui in uis.values()
+            ]
+            report(f"100 changes {n_fields} fields{name}", before, after)
@@ -0,0 +1,63 @@
+"""benchmark setting `AutoObject.value` (e.g. loading a saved file) where only a few
+values differ, updating every widget vs. only the widgets whose values differ. counts
+the widget trait change notifications (each sends a comm message in a kernel)."""
+
+import ipywidgets as w
+
+from ipyautoui.autoobject import AutoObject
+from wide_models import create_nested_model, create_wide_model, report, timeit
+
+
+class AutoObjectUpdateAll(AutoObject):
+    """updates every widget on value set (as before the diff was used)"""
+
+    def _update_widgets_from_value(self, old=None):
+        super()._update_widgets_from_value(old=None)
+
+
+def count_notifications(fn) -> int:
+    count = 0
+    notify_change = w.Widget.notify_change
+
+    def counted(self, change):
+        nonlocal count
+        count += 1
+        return notify_change(self, change)
+
+    w.Widget.notify_change = counted
+    try:
+        fn()
+    finally:
+        w.Widget.notify_change = notify_change
+    return count
+
+
+def load_values(ui, values):
+    for value in values:
+        ui.value = value
+
+
+def get_values(ui, n_changes: int = 3):
+    """values alternating a few fields of the current value"""
+    a = ui.value
+    changed = {k: v + 1 for k, v in list(a.items()) if isinstance(v, float)}
+    b = a | dict(list(changed.items())[:n_changes])
+    return [b, a] * 5
+
+
+if __name__ == "__main__":
+    models = {
+        "wide (300 fields)": create_wide_model(300),
+        "nested (depth=3, width=5)": create_nested_model(3, 5),
+    }
+    for name, model in models.items():
+        uis = [
+            cls.from_pydantic_model(model) for cls in (AutoObjectUpdateAll, AutoObject)
+        ]
+        values = get_values(uis[1])
+        before, after = [timeit(lambda: load_values(ui, values)) for ui in uis]
+        report(f"10 value sets {name}", before, after)
+        before, after = [
+            count_notifications(lambda: load_values(ui, values)) for ui in uis
+        ]
+        print(f"{'':<45} notifications: before={before} after={after}")
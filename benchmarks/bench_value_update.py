@@ -0,0 +1,38 @@
+"""benchmark the cost of a single child widget change ("keystroke") in an AutoObject,
+patching the changed key vs. re-reading the value of every widget."""
+
+from ipyautoui.autoobject import AutoObject
+from ipyautoui.watch_validate import WatchValidate
+from wide_models import create_nested_model, create_wide_model, report, timeit
+
+
+def keystrokes(widget, n=100):
+    for i in range(n):
+        widget.value = float(i)
+
+
+def get_leaf(ui):
+    while "nested_0" in ui.di_widgets:
+        ui = ui.di_widgets["nested_0"]
+    return ui.di_widgets["field_1"]  # float
+
+
+if __name__ == "__main__":
+    models = {
+        "wide (300 fields)": create_wide_model(300),
+        "nested (depth=3, width=5)": create_nested_model(3, 5),
+    }
+    for name, model in models.items():
+        for by_model in [False, True]:
+            if by_model:
+                ui = AutoObject.from_pydantic_model(model)
+            else:
+                ui = AutoObject.from_jsonschema(model.model_json_schema())
+            leaf = get_leaf(ui)
+            patch = AutoObject._get_value_on_change
+            AutoObject._get_value_on_change = WatchValidate._get_value_on_change
+            before = timeit(lambda: keystrokes(leaf))
+            AutoObject._get_value_on_change = patch
+            after = timeit(lambda: keystrokes(leaf))
+            validated = "validated" if by_model else "no model"
+            report(f"100 changes {name} {validated}", before, after)
@@ -0,0 +1,44 @@
+"""benchmark construction time and memory of the pydantic `WidgetCaller` vs. the
+slotted `WidgetCallerLite` returned by `map_widget`, per 1,000 properties."""
+
+import contextlib
+import io
+import tracemalloc
+
+import ipyautoui.automapschema as aumap
+from wide_models import create_wide_model, report, timeit
+
+
+def get_callers(n_fields: int = 1000) -> list[dict]:
+    model, schema = aumap._init_model_schema(create_wide_model(n_fields))
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [
+            aumap.map_widget(dict(v)).model_dump()
+            for v in schema["properties"].values()
+        ]
+
+
+def construct(cls, callers: list[dict]) -> list:
+    return [cls(**c) for c in callers]
+
+
+def memory(cls, callers: list[dict]) -> int:
+    tracemalloc.start()
+    objs = construct(cls, callers)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return size
+
+
+if __name__ == "__main__":
+    callers = get_callers(1000)
+    before = timeit(lambda: construct(aumap.WidgetCaller, callers))
+    after = timeit(lambda: construct(aumap.WidgetCallerLite, callers))
+    report("construct x 1000 callers", before, after)
+    before = memory(aumap.WidgetCaller, callers)
+    after = memory(aumap.WidgetCallerLite, callers)
+    print(
+        f"{'memory x 1000 callers':<45} before={before / 1e3:9.1f}kB"
+        f" after={after / 1e3:9.1f}kB"
+    )
@@ -0,0 +1,32 @@
+"""benchmark removing and re-adding rows of an AutoArray of sub-objects, creating new
+widgets for every row vs. recycling them from `WIDGET_POOL`. also counts the widgets
+left open in the kernel (previously removed rows were never closed)."""
+
+from ipywidgets.widgets.widget import _instances
+from ipyautoui.automapschema import WIDGET_POOL, _init_model_schema
+from ipyautoui.custom.iterable import AutoArray
+from wide_models import SubModel, report, timeit
+
+N_ROWS = 20
+
+
+def churn(ui):
+    ui.value = []
+    ui.value = [SubModel().model_dump()] * N_ROWS
+
+
+if __name__ == "__main__":
+    _, schema = _init_model_schema(SubModel)
+    ui = AutoArray(items=schema, value=[SubModel().model_dump()] * N_ROWS)
+
+    WIDGET_POOL.resize(0)  # no recycling (removed widgets are closed)
+    n = len(_instances)
+    before = timeit(lambda: churn(ui), repeat=3)
+    print(f"{'':<45} open widgets +{len(_instances) - n} (no pool)")
+
+    WIDGET_POOL.resize(256)
+    churn(ui)  # fill the pool
+    n = len(_instances)
+    after = timeit(lambda: churn(ui), repeat=3)
+    print(f"{'':<45} open widgets +{len(_instances) - n} (pool)")
+    report(f"remove + add {N_ROWS} object rows", before, after)
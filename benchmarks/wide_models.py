@@ -0,0 +1,77 @@
+"""wide and nested pydantic models used by the benchmarks.
+
+the benchmarks are plain scripts (not collected by pytest). run from the repo root:
+
+    python benchmarks/bench_map_widget.py
+"""
+
+import datetime
+import time
+import typing as ty
+from enum import Enum
+
+from pydantic import BaseModel, Field, create_model
+from typing_extensions import Annotated
+
+
+class FruitEnum(str, Enum):
+    apple = "apple"
+    pear = "pear"
+    banana = "banana"
+
+
+class SubModel(BaseModel):
+    a: str = "a"
+    b: int = 1
+    c: ty.Optional[float] = None
+
+
+FIELD_TYPES = [
+    (int, 1),
+    (float, 1.5),
+    (str, "string"),
+    (bool, True),
+    (datetime.date, datetime.date(2024, 1, 1)),
+    (FruitEnum, FruitEnum.apple),
+    (ty.Optional[int], None),
+    (ty.Optional[str], None),
+    (Annotated[int, Field(ge=0, le=10)], 5),
+    (list[str], []),
+    (ty.Union[str, FruitEnum], "apple"),
+    (SubModel, SubModel()),
+]
+
+
+def create_wide_model(
+    n_fields: int = 300, field_types=FIELD_TYPES, name: str = "WideModel"
+) -> ty.Type[BaseModel]:
+    """creates a flat pydantic model with `n_fields`, cycling through `field_types`"""
+    fields = {f"field_{n}": field_types[n % len(field_types)] for n in range(n_fields)}
+    return create_model(name, **fields)
+
+
+def create_nested_model(depth: int = 3, width: int = 5) -> ty.Type[BaseModel]:
+    """creates a model with `width` sub-models at each level, `depth` levels deep"""
+    model = create_wide_model(width, field_types=FIELD_TYPES[:-1], name="Leaf")
+    for level in range(depth):
+        fields = {f"nested_{n}": (model, model()) for n in range(width)}
+        fields |= {f"value_{n}": (float, 1.0) for n in range(width)}
+        model = create_model(f"Nested{level}", **fields)
+    return model
+
+
+def timeit(fn: ty.Callable, repeat: int = 5) -> float:
+    """best of `repeat` wall-clock times in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def report(name: str, before: float, after: float):
+    print(
+        f"{name:<45} before={before * 1e3:9.2f}ms after={after * 1e3:9.2f}ms"
+        f" speedup={before / after:6.1f}x"
+    )
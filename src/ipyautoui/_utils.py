@@ -8,15 +8,20 @@ import logging
 import pathlib
 import getpass
 import inspect
+import weakref
+import types
+import contextlib
 import immutables
 import importlib
 import importlib.util
 import pandas as pd
+import traitlets as tr
 import ipywidgets as w
 import typing as ty
 from typing import Type
 from base64 import b64encode
 from markdown import markdown
+from jsonref import replace_refs
 from math import log10, floor
 from pydantic import BaseModel, field_validator, Field, ValidationInfo
 from IPython.display import display, Markdown
@@ -305,7 +310,7 @@ def load_PyObj(obj: PyObj):
 
 
 # TODO: use obj_to_importstr and obj_from_importstr rather than load_PyObj
-def obj_to_importstr(obj: ty.Callable):  # NOT IN USE
+def obj_to_importstr(obj: ty.Callable):
     """
     given a callable callable object this will return the
     import string to. From the string the object can be
@@ -358,9 +363,62 @@ def obj_from_importstr(importstr: str) -> ty.Type:
     return getattr(importlib.import_module(mod), nm)
 
 
+_ARGSPEC_NAMES = weakref.WeakKeyDictionary()
+_TRAIT_NAMES = weakref.WeakKeyDictionary()
+
+
+def _cached_names(cache: weakref.WeakKeyDictionary, call: ty.Callable, fn: ty.Callable):
+    try:
+        return cache[call]
+    except KeyError:
+        names = fn(call)
+        cache[call] = names
+        return names
+    except TypeError:  # not hashable or weak-referenceable (e.g. bound method)
+        return fn(call)
+
+
+def _argspec_names(call: ty.Callable) -> frozenset:
+    return frozenset(inspect.getfullargspec(call).args)
+
+
+def _trait_names(call: ty.Callable) -> frozenset:
+    if not hasattr(call, "traits"):
+        return frozenset()
+    li = call.traits(call).keys()
+    return frozenset(li) | frozenset(l[1:] for l in li if l[:1] == "_")
+
+
+def get_argspec_names(call: ty.Callable) -> frozenset:
+    """get (cached) names of the args of a callable"""
+    return _cached_names(_ARGSPEC_NAMES, call, _argspec_names)
+
+
+def get_trait_names(call: ty.Callable) -> frozenset:
+    """get (cached) names of kwargs that set traits of a callable. includes "{name}"
+    for private "_{name}" traits."""
+    return _cached_names(_TRAIT_NAMES, call, _trait_names)
+
+
+def get_accepted_kwargs(call: ty.Callable) -> frozenset:
+    """get (cached) names of kwargs that are accepted by a callable. the cache is keyed
+    by weakref so dynamically created classes (e.g. AutoUi) can be collected.
+
+    Example:
+    ```py
+    import ipywidgets as w
+    from ipyautoui._utils import get_accepted_kwargs
+    print({"value", "self", "_model_name"} <= get_accepted_kwargs(w.IntText))
+    #> True
+    ```
+    """
+    return get_argspec_names(call) | get_trait_names(call)
+
+
 def argspecs_in_kwargs(call: ty.Callable, kwargs: dict):
     """get argspecs for kwargs"""
-    return {k: v for k, v in kwargs.items() if k in inspect.getfullargspec(call).args}
+    names = get_argspec_names(call)
+    return {k: v for k, v in kwargs.items() if k in names}
 
 
 def traits_in_kwargs(call: ty.Callable, kwargs: dict):
@@ -369,15 +427,207 @@ def traits_in_kwargs(call: ty.Callable, kwargs: dict):
         logger.info(f"{call.__name__} does not have traits attribute")
         return {}
     else:
-        li = list(call.traits(call).keys())
-        return {k: v for k, v in kwargs.items() if k in li or f"_{k}" in li}
+        names = get_trait_names(call)
+        return {k: v for k, v in kwargs.items() if k in names}
 
 
 def remove_non_present_kwargs(callable_: ty.Callable, di: dict):
     """do this if required (get allowed args from callable)"""
-    argspec = argspecs_in_kwargs(callable_, di)
-    traits = traits_in_kwargs(callable_, di)
-    return {**argspec, **traits}
+    names = get_accepted_kwargs(callable_)
+    return {k: v for k, v in di.items() if k in names}
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _canonical(obj, path: tuple = ()):
+    if isinstance(obj, dict):  # NOTE: also true for jsonref proxies
+        if id(obj) in path:
+            raise _Uncacheable("recursive schema")
+        path = path + (id(obj),)
+        return (
+            dict,
+            tuple(sorted((str(k), _canonical(v, path)) for k, v in obj.items())),
+        )
+    elif isinstance(obj, (list, tuple)):
+        if id(obj) in path:
+            raise _Uncacheable("recursive schema")
+        path = path + (id(obj),)
+        return (list, tuple(_canonical(v, path) for v in obj))
+    try:
+        hash(obj)
+    except TypeError as e:
+        raise _Uncacheable(str(e))
+    return (type(obj), obj)  # type distinguishes 1, 1.0 and True
+
+
+def canonical_schema_key(di: dict) -> ty.Optional[tuple]:
+    """returns a hashable, key-order independent representation of a json schema.
+    unlike `json.dumps` this works with jsonref proxies. returns None if the schema
+    can't be represented (e.g. recursive or containing unhashable objects).
+
+    Example:
+    ```py
+    from ipyautoui._utils import canonical_schema_key
+    a = canonical_schema_key({"type": "integer", "default": 1})
+    b = canonical_schema_key({"default": 1, "type": "integer"})
+    c = canonical_schema_key({"type": "integer", "default": 1.0})
+    print(a == b, a == c)
+    #> True False
+    ```
+    """
+    try:
+        return _canonical(di)
+    except _Uncacheable:
+        return None
+
+
+def _copy_containers(obj):
+    if isinstance(obj, dict):
+        return {k: _copy_containers(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_copy_containers(v) for v in obj]
+    return obj
+
+
+def _copy_containers_checked(obj, path: tuple = ()):
+    if isinstance(obj, (dict, list)):
+        if id(obj) in path:
+            raise _Uncacheable("recursive schema")
+        path = path + (id(obj),)
+        if isinstance(obj, dict):
+            return {k: _copy_containers_checked(v, path) for k, v in obj.items()}
+        return [_copy_containers_checked(v, path) for v in obj]
+    return obj
+
+
+def copy_schema(schema: dict) -> dict:
+    """copy the dicts and lists of a json schema so that it can be modified without
+    side effects. recursive schemas can't be copied and are returned as is."""
+    try:
+        return _copy_containers_checked(schema)
+    except _Uncacheable:
+        return schema
+
+
+class _FrozenList(tuple):
+    pass
+
+
+def _freeze(obj, path: tuple = ()):
+    if isinstance(obj, (dict, list)):  # NOTE: also true for jsonref proxies
+        if id(obj) in path:
+            raise _Uncacheable("recursive schema")
+        path = path + (id(obj),)
+        if isinstance(obj, dict):
+            return types.MappingProxyType({k: _freeze(v, path) for k, v in obj.items()})
+        return _FrozenList(_freeze(v, path) for v in obj)
+    return obj
+
+
+def _thaw(obj):
+    if isinstance(obj, types.MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    elif isinstance(obj, _FrozenList):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+def _replace_refs(schema: dict) -> dict:
+    schema = replace_refs(schema, merge_props=True)
+    return {k: v for k, v in schema.items() if k != "$defs"}
+
+
+class ResolvedSchemaCache:
+    """cache of json schemas with `$ref`s resolved by `replace_refs(merge_props=True)`.
+    pydantic models are keyed by (model, by_alias) (weakref-keyed so reloaded models can
+    be collected), dict schemas by their `canonical_schema_key`. resolved schemas are
+    stored immutable and a mutable copy is returned on every call. recursive schemas
+    can't be copied and are resolved every time.
+    """
+
+    def __init__(self):
+        self.models = weakref.WeakKeyDictionary()
+        self.schemas = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, cache: dict, key, fn: ty.Callable) -> dict:
+        if key in cache:
+            self.hits += 1
+            return _thaw(cache[key])
+        self.misses += 1
+        schema = fn()
+        try:
+            cache[key] = _freeze(schema)
+        except _Uncacheable:
+            return schema
+        return _thaw(cache[key])
+
+    def resolve_model(self, model: ty.Type[BaseModel], by_alias: bool = False) -> dict:
+        cache = self.models.setdefault(model, {})
+        fn = lambda: _replace_refs(model.model_json_schema(by_alias=by_alias))
+        return self._get(cache, by_alias, fn)
+
+    def resolve(self, schema: dict) -> dict:
+        key = canonical_schema_key(schema)
+        if key is None:
+            self.misses += 1
+            return _replace_refs(schema)
+        return self._get(self.schemas, key, lambda: _replace_refs(schema))
+
+    @property
+    def hit_rate(self) -> float:
+        n = self.hits + self.misses
+        return self.hits / n if n else 0.0
+
+    def clear(self):
+        """clear the cache. call this when models are reloaded."""
+        self.models.clear()
+        self.schemas.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hit_rate,
+            currsize=sum(len(v) for v in self.models.values()) + len(self.schemas),
+        )
+
+
+RESOLVED_SCHEMA_CACHE = ResolvedSchemaCache()
+
+
+def get_resolved_schema(
+    schema: ty.Union[ty.Type[BaseModel], dict], by_alias: bool = False
+) -> dict:
+    """get a json schema with `$ref`s resolved and `$defs` removed from a pydantic
+    model or a json schema. results are cached in `RESOLVED_SCHEMA_CACHE`.
+
+    Example:
+    ```py
+    from pydantic import BaseModel
+    from ipyautoui._utils import get_resolved_schema
+
+    class Sub(BaseModel):
+        a: int = 1
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+
+    schema = get_resolved_schema(Test)
+    print(schema["properties"]["sub"]["properties"], "$defs" in schema)
+    #> {'a': {'default': 1, 'title': 'A', 'type': 'integer'}} False
+    print(get_resolved_schema(Test) is schema)
+    #> False
+    ```
+    """
+    if isinstance(schema, dict):
+        return RESOLVED_SCHEMA_CACHE.resolve(schema)
+    return RESOLVED_SCHEMA_CACHE.resolve_model(schema, by_alias=by_alias)
 
 
 def get_ext(fpth):
@@ -481,6 +731,139 @@ def show_hide_widget(widget, show: bool):
         ValueError(str(widget) + "failed to change layout.display")
 
 
+def iter_widgets(widget: w.Widget) -> ty.Iterator[w.Widget]:
+    """yields the widget and all descendant widgets (children, layout and style)"""
+    seen = set()
+    stack = [widget]
+    while stack:
+        widget = stack.pop()
+        if id(widget) in seen:
+            continue
+        seen.add(id(widget))
+        yield widget
+        for name in ("layout", "style"):
+            v = getattr(widget, name, None)
+            if isinstance(v, w.Widget):
+                stack.append(v)
+        stack.extend(
+            v for v in getattr(widget, "children", ()) if isinstance(v, w.Widget)
+        )
+
+
+SHARED_WIDGETS = weakref.WeakSet()
+# ^ module level widgets that are shared between instances. never closed by `close_all`
+_CLASS_WIDGETS = weakref.WeakKeyDictionary()
+
+
+def _get_class_widgets(cls) -> set:
+    """ids of the widgets that are class attributes or trait defaults of `cls`"""
+    ids = _CLASS_WIDGETS.get(cls)
+    if ids is None:
+        ids = set()
+        for c in cls.__mro__:
+            for v in vars(c).values():
+                if isinstance(v, tr.TraitType):
+                    v = v.default_value
+                if isinstance(v, w.Widget):
+                    ids.add(id(v))
+        _CLASS_WIDGETS[cls] = ids
+    return ids
+
+
+def _iter_held_widgets(obj, depth: int) -> ty.Iterator[w.Widget]:
+    if isinstance(obj, w.Widget):
+        yield obj
+    elif depth > 0 and isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            yield from _iter_held_widgets(v, depth - 1)
+    elif depth > 0 and isinstance(obj, dict):
+        for v in obj.values():
+            yield from _iter_held_widgets(v, depth - 1)
+
+
+def iter_owned_widgets(
+    widget: w.Widget, keep: ty.Iterable[w.Widget] = ()
+) -> ty.Iterator[w.Widget]:
+    """yields the widget and all the widgets it holds: children, layout, style and
+    widgets held in traits or attributes (incl. in lists and dicts). class level
+    widgets (e.g. trait defaults), `SHARED_WIDGETS` and `keep` (and the widgets they
+    hold) are skipped."""
+    skip = {id(v) for v in keep} | {id(v) for v in SHARED_WIDGETS}
+    seen = set()
+    stack = [widget]
+    while stack:
+        widget = stack.pop()
+        if id(widget) in seen or id(widget) in skip:
+            continue
+        seen.add(id(widget))
+        yield widget
+        skip_class = _get_class_widgets(type(widget))
+        stack.extend(
+            v for v in _iter_held_widgets(vars(widget), 4) if id(v) not in skip_class
+        )
+
+
+def close_all(*widgets: w.Widget, keep: ty.Iterable[w.Widget] = ()) -> int:
+    """closes the widgets and all the widgets they hold (see `iter_owned_widgets`),
+    removing observers and callbacks so the comms and the python objects can be
+    released. returns the number of widgets closed."""
+    n = 0
+    for widget in widgets:
+        for v in list(iter_owned_widgets(widget, keep=keep)):
+            for x in vars(v).values():
+                if isinstance(x, w.CallbackDispatcher):
+                    x.callbacks.clear()
+            v.unobserve_all()
+            if v.comm is not None:
+                n += 1
+            w.Widget.close(v)
+    return n
+
+
+class CloseAll:
+    """`close()` closes the widget and all the widgets it holds (see `close_all`).
+    when garbage collected (`Widget.__del__`) only the widget itself is closed, as the
+    widgets it holds may still be shown or held elsewhere.
+    NOTE: must come before the ipywidgets base class, e.g. `class A(CloseAll, w.VBox)`
+    """
+
+    def close(self, cascade: bool = True):
+        if cascade and self.comm is not None:
+            close_all(self)
+        else:
+            w.Widget.close(self)
+
+    def __del__(self):
+        self.close(cascade=False)
+
+
+@contextlib.contextmanager
+def hold_sync_all(*widgets: w.Widget):
+    """holds the frontend sync of the widgets and all their descendants (as ipywidgets
+    `hold_sync`). on exit each changed widget sends a single message with all of its
+    changes. yields a dict, "messages" is set to the number of messages sent on exit.
+    widgets without a comm (no frontend) or already held are skipped.
+    """
+    counter = {"messages": 0}
+    widgets = [
+        v
+        for v in widgets
+        if getattr(v, "comm", None) is not None and not v._holding_sync
+    ]
+    widgets = [v for x in widgets for v in iter_widgets(x) if not v._holding_sync]
+    for v in widgets:
+        v._holding_sync = True
+    try:
+        yield counter
+    finally:
+        for v in widgets:
+            v._holding_sync = False
+            if v._states_to_send:
+                v.send_state(v._states_to_send)
+                v._states_to_send.clear()
+                counter["messages"] += 1
+
+
 def zip_files_to_string(fpths: ty.List[pathlib.Path]) -> str:
     # Create a BytesIO object
     zip_buffer = io.BytesIO()
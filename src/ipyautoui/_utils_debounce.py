@@ -1,7 +1,8 @@
 # https://ipywidgets.readthedocs.io/en/latest/examples/Widget%20Events.html#Debouncing
-# NOTE: currently not in use
 
 import asyncio
+import typing as ty
+import traitlets as tr
 
 # from threading import Timer
 # ^ this can replace the Timer class below... not sure when / why this makes sense...
@@ -45,3 +46,114 @@ def debounce(wait):
         return debounced
 
     return decorator
+
+
+def get_running_loop() -> ty.Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class Debouncer:
+    """coalesces calls made within `wait` seconds into a single call, made with the
+    latest args. `mode="debounce"` calls after `wait` seconds without a call,
+    `mode="throttle"` calls at most once every `wait` seconds (first and last call of
+    a burst). if there is no running event loop calls are made immediately."""
+
+    def __init__(self, wait: float = 0.1, mode: str = "debounce"):
+        if mode not in ("debounce", "throttle"):
+            raise ValueError(f"mode must be 'debounce' or 'throttle', not {mode}")
+        self.wait = wait
+        self.mode = mode
+        self._timer = None
+        self._call = None
+
+    @property
+    def pending(self) -> bool:
+        return self._call is not None
+
+    @property
+    def args(self) -> tuple:
+        return () if self._call is None else self._call[1]
+
+    def __call__(self, fn: ty.Callable, *args, **kwargs):
+        self._call = (fn, args, kwargs)
+        if get_running_loop() is None:
+            self.flush()
+        elif self.mode == "throttle":
+            if self._timer is None:
+                self.flush()
+                self._start()
+        else:
+            self._cancel_timer()
+            self._start()
+
+    def _start(self):
+        self._timer = Timer(self.wait, self._on_timer)
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self):
+        self._timer = None
+        if self.pending:
+            self.flush()
+            if self.mode == "throttle":
+                self._start()
+
+    def flush(self):
+        """make the pending call now (if any)"""
+        if self._call is None:
+            return
+        fn, args, kwargs = self._call
+        self._call = None
+        fn(*args, **kwargs)
+
+    def cancel(self):
+        """drop the pending call (if any)"""
+        self._call = None
+        self._cancel_timer()
+
+
+class DebounceChanges(tr.HasTraits):
+    """debounce / throttle the handling of child widget changes. bursts of changes are
+    coalesced into a single call. pending changes are flushed when `value` is read.
+
+    Attributes:
+        change_policy (str, optional): None (handle immediately), "debounce" or
+            "throttle". Defaults to None.
+        change_wait (float): seconds to debounce / throttle. Defaults to 0.1.
+    """
+
+    change_policy = tr.Enum(
+        values=["debounce", "throttle"], default_value=None, allow_none=True
+    )
+    change_wait = tr.Float(default_value=0.1)
+    _debouncer = None
+
+    @tr.observe("change_policy", "change_wait")
+    def _observe_change_policy(self, on_change):
+        self.flush_changes()
+        if self.change_policy is None:
+            self._debouncer = None
+        else:
+            self._debouncer = Debouncer(self.change_wait, mode=self.change_policy)
+
+    def _debounce_change(self, fn: ty.Callable, *args):
+        if self._debouncer is None:
+            fn(*args)
+        else:
+            self._debouncer(fn, *args)
+
+    def flush_changes(self):
+        """handle pending changes now"""
+        if self._debouncer is not None:
+            self._debouncer.flush()
+
+    def _cancel_changes(self):
+        if self._debouncer is not None:
+            self._debouncer.cancel()
@@ -84,9 +84,11 @@ class AnyOf(w.HBox):
 
     @tr.observe("selected_item")
     def _selected_item(self, on_change):
-        from ipyautoui.automapschema import get_widget
+        from ipyautoui.automapschema import get_pooled_widget
 
-        self.widget = get_widget(self.selected_item)
+        if hasattr(self, "widget"):
+            self._release_widget()
+        self.widget = get_pooled_widget(self.selected_item)
         self.children = [self.widget]
         self._init_watch_widget()
         self._watch_widget("")
@@ -110,6 +112,17 @@ class AnyOf(w.HBox):
         else:
             pass
 
+    def _release_widget(self):
+        """stop watching the widget of the previous selection and return it to the
+        widget pool"""
+        from ipyautoui.automapschema import WIDGET_POOL
+
+        for watch in ["value", "_value"]:
+            if self.widget.has_trait(watch):
+                self.widget.unobserve(self._watch_widget, watch)
+                break
+        WIDGET_POOL.release(self.widget)
+
     def _watch_widget(self, on_change):
         self._value = self.widget.value
 
@@ -23,6 +23,7 @@ import ipywidgets as w
 from IPython.display import display
 import traitlets as tr
 from ipyautoui.custom.title_description import TitleDescription
+from ipyautoui._utils import close_all, CloseAll, SHARED_WIDGETS
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ logger = logging.getLogger(__name__)
 # +
 # functions to format the box based on traits
 SPACER = w.HBox(layout={"width": "48px"})
+SHARED_WIDGETS.add(SPACER)
 
 f1 = lambda self: [
     w.HBox(
@@ -127,7 +129,7 @@ class Nest:
             self.widget.layout.display = "None"
 
 
-class AutoBox(w.VBox, Nest, TitleDescription):
+class AutoBox(CloseAll, w.VBox, Nest, TitleDescription):
     nested = tr.Bool(default_value=False)
     align_horizontal = tr.Bool(default_value=True).tag(sync=True)
     hide = tr.Bool(default_value=True).tag(sync=True)
@@ -188,7 +190,17 @@ class AutoBox(w.VBox, Nest, TitleDescription):
         return (self.align_horizontal, self.nested, self.indent)
 
     def format_box(self):
+        previous, keep = getattr(self, "_wrappers", ([], []))
         self.children = map_format[self.format_tuple](self)
+        wrapped = [
+            self.widget,
+            self.html_title,
+            self.html_unit,
+            self.html_description,
+            getattr(self, "tgl", None),
+        ]
+        self._wrappers = ([v for v in self.children if v not in wrapped], wrapped)
+        close_all(*previous, keep=keep)  # boxes from the previous format
 
     @classmethod
     def wrapped_widget(
@@ -63,6 +63,8 @@ from ipyautoui._utils import (
     frozenmap,
     get_ext,
     st_mtime_string,
+    close_all,
+    CloseAll,
 )
 from ipyautoui.constants import (
     #  BUTTON_WIDTH_MIN,
@@ -307,7 +309,7 @@ ORDER_DEFAULT = ("exists", "openpreview", "openfile", "openfolder", "name")
 ORDER_NOTPATH = ("exists", "openpreview", "name")
 
 
-class DisplayObject(w.VBox):
+class DisplayObject(CloseAll, w.VBox):
     """
     class for displaying file-like objects.
 
@@ -400,6 +402,7 @@ class DisplayObject(w.VBox):
         self.bx_bar = w.HBox()
         self.bx_out = w.VBox()
         self.bx_out.children = [self.out_caller, self.out]
+        self._previews = []  # widgets shown in `out`
 
     def _update_form(self):
         self.name.value = "<b>{0}</b>".format(self.display_actions.name)
@@ -428,7 +431,10 @@ class DisplayObject(w.VBox):
                     hasattr(self.display_actions, "path")
                     and self.display_actions.check_exists()
                 ):
-                    display(self.display_actions.renderer())
+                    preview = self.display_actions.renderer()
+                    if isinstance(preview, w.Widget):
+                        self._previews.append(preview)
+                    display(preview)
                 else:
                     display(Markdown("file does not exist"))
         else:
@@ -436,6 +442,11 @@ class DisplayObject(w.VBox):
             self.out.layout.display = "none"
             with self.out:
                 clear_output()
+            self._close_previews()
+
+    def _close_previews(self):
+        close_all(*self._previews)
+        self._previews = []
 
 
 class DisplayCallable(DisplayObject):
@@ -884,6 +895,7 @@ class AutoDisplay(tr.HasTraits):
     @title.setter
     def title(self, value):
         self._title = value
+        close_all(*self.box_title.children)
         if self.title is None:
             self.box_title.children = []
         else:
@@ -898,6 +910,7 @@ class AutoDisplay(tr.HasTraits):
         if hasattr(self, "display_objects") and len(self.display_objects) == 1:
             value = False
         self._display_showhide = value
+        close_all(*self.box_showhide.children[:1])  # the spacer
         if self.display_showhide:
             self.box_showhide.children = [
                 w.HBox(layout=w.Layout(width="24px", height=BUTTON_HEIGHT_MIN)),
@@ -923,6 +936,7 @@ class AutoDisplay(tr.HasTraits):
     @display_objects_actions.setter
     def display_objects_actions(self, display_objects_actions):
         self._display_objects_actions = display_objects_actions
+        close_all(*getattr(self, "display_objects", []))
         self.display_objects = [DisplayObject(d) for d in display_objects_actions]
 
         self.box_files.children = self.display_objects
@@ -978,6 +992,9 @@ class AutoDisplay(tr.HasTraits):
         self.b_collapse_all.on_click(self.collapse_all)
         self.b_display_default.on_click(self.display_default)
 
+    def close(self):
+        close_all(self.box_form, *self.display_objects)
+
     def display_all(self, onclick=None):
         for d in self.display_objects:
             d.openpreview.value = True
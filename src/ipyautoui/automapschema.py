@@ -16,13 +16,27 @@
 # +
 
 
+import copy
 import typing as ty
+import weakref
+import collections
+import collections.abc
+import itertools
 import ipywidgets as w
 from pydantic import BaseModel, Field
 from ipyautoui.nullable import nullable
-from jsonref import replace_refs
 from ipyautoui.constants import MAP_JSONSCHEMA_TO_IPYWIDGET
-from ipyautoui._utils import remove_non_present_kwargs, frozenmap, obj_from_importstr
+from ipyautoui._utils import (
+    remove_non_present_kwargs,
+    frozenmap,
+    obj_from_importstr,
+    obj_to_importstr,
+    copy_schema,
+    canonical_schema_key,
+    get_resolved_schema,
+    _copy_containers,
+    close_all,
+)
 from ipyautoui.custom.markdown_widget import MarkdownWidget
 from ipyautoui.custom.filechooser import FileChooser
 from ipyautoui.custom.date_string import DatePickerString, NaiveDatetimePickerString
@@ -49,10 +63,8 @@ def _init_model_schema(
         # https://koxudaxi.github.io/datamodel-code-generator/using_as_module/
     else:
         model = schema  # the "model" passed is a pydantic model
-        schema = model.model_json_schema(by_alias=by_alias).copy()
 
-    schema = replace_refs(schema, merge_props=True)
-    schema = {k: v for k, v in schema.items() if k != "$defs"}
+    schema = get_resolved_schema(schema, by_alias=by_alias)
     return model, schema
 
 
@@ -1013,11 +1025,60 @@ class WidgetCaller(BaseModel):
     kwargs_box: ty.Dict = Field(default_factory=lambda: {})
 
 
-def widgetcaller(caller: WidgetCaller, show_errors=True):
+class WidgetCallerLite:
+    """slotted equivalent of `WidgetCaller` returned by `map_widget`. avoids the pydantic
+    construction and validation cost on the hot path. `to_model` returns the pydantic
+    `WidgetCaller` (e.g. for debugging or serialisation).
+
+    Example:
+    ```py
+    import ipywidgets as w
+    from ipyautoui.automapschema import WidgetCallerLite
+    caller = WidgetCallerLite(schema_={"type": "integer"}, autoui=w.IntText)
+    print(caller.to_model().kwargs, caller.model_dump()["allow_none"])
+    #> {} False
+    ```
+    """
+
+    __slots__ = ("schema_", "autoui", "allow_none", "args", "kwargs", "kwargs_box")
+
+    def __init__(
+        self,
+        schema_: dict,
+        autoui: ty.Callable,
+        allow_none: bool = False,
+        args: ty.Optional[list] = None,
+        kwargs: ty.Optional[dict] = None,
+        kwargs_box: ty.Optional[dict] = None,
+    ):
+        self.schema_ = schema_
+        self.autoui = autoui
+        self.allow_none = allow_none
+        self.args = [] if args is None else args
+        self.kwargs = {} if kwargs is None else kwargs
+        self.kwargs_box = {} if kwargs_box is None else kwargs_box
+
+    def model_dump(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def to_model(self) -> WidgetCaller:
+        return WidgetCaller(**self.model_dump())
+
+    def __eq__(self, other):
+        if not isinstance(other, (WidgetCallerLite, WidgetCaller)):
+            return NotImplemented
+        return self.model_dump() == dict(other.model_dump())
+
+    def __repr__(self):
+        s = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"WidgetCallerLite({s})"
+
+
+def widgetcaller(caller: ty.Union[WidgetCallerLite, WidgetCaller], show_errors=True):
     """
     returns widget from widget caller object
     Args:
-        caller: WidgetCaller
+        caller: WidgetCallerLite or WidgetCaller
     Returns:
         widget of some kind
     """
@@ -1239,11 +1300,431 @@ def get_autooveride(schema):
     return cl
 
 
+# dispatch tags for the builtin `fn_filt` predicates. a predicate can only return True
+# for a property schema whose tags (see `get_dispatch_tags`) intersect with the tags
+# given here. predicates that are not listed (e.g. user defined `fn_filt`) are
+# always evaluated.
+MAP_FN_FILT_TAGS = frozenmap(
+    {
+        is_AutoOveride: frozenset({"autoui"}),
+        is_IntText: frozenset({"integer"}),
+        is_IntSlider: frozenset({"integer"}),
+        is_FloatText: frozenset({"number"}),
+        is_FloatSlider: frozenset({"number"}),
+        is_IntRangeSlider: frozenset({"array"}),
+        is_FloatRangeSlider: frozenset({"array"}),
+        is_Text: frozenset({"string"}),
+        is_Textarea: frozenset({"string"}),
+        is_Markdown: frozenset({"string"}),
+        is_Dropdown: frozenset({"enum"}),
+        is_Combobox: frozenset({"anyOf", "examples"}),
+        is_SelectMultiple: frozenset({"array"}),
+        is_TagsInput: frozenset({"array"}),
+        is_Color: frozenset({"string"}),
+        is_Path: frozenset({"string"}),
+        is_Checkbox: frozenset({"boolean"}),
+        is_Date: frozenset({"string"}),
+        is_Datetime: frozenset({"string"}),
+        is_AnyOf: frozenset({"anyOf"}),
+        is_Object: frozenset({"object"}),
+        is_DataFrame: frozenset({"array"}),
+        is_Array: frozenset({"array"}),
+    }
+)
+
+
+def get_dispatch_tags(di: dict) -> ty.Optional[frozenset]:
+    """get the cheap discriminators of a property schema used to pre-filter the
+    `fn_filt` predicates. returns None if the schema is not understood, in which
+    case every predicate must be evaluated.
+
+    Example:
+    ```py
+    from ipyautoui.automapschema import get_dispatch_tags
+    print(sorted(get_dispatch_tags({'title': 'a', 'type': 'integer', 'default': 1})))
+    #> ['integer']
+    print(sorted(get_dispatch_tags({'title': 'a', 'anyOf': [{'type': 'string', 'enum': ['a']}, {'type': 'null'}]})))
+    #> ['anyOf', 'enum', 'string']
+    ```
+    """
+    if "type" in di:
+        t = di["type"]
+        if not isinstance(t, str):
+            return None
+        effective = di
+    elif "anyOf" in di:
+        types = [l.get("type") for l in di["anyOf"]]
+        non_null = [l for l in di["anyOf"] if l.get("type") != "null"]
+        if len(non_null) != 1:
+            return frozenset({"anyOf"})  # only anyOf widgets can match
+        t = non_null[0].get("type")
+        if not isinstance(t, str):
+            return None
+        if "null" not in types:
+            return frozenset({"anyOf"})
+        effective = {**{k: v for k, v in di.items() if k != "anyOf"}, **non_null[0]}
+    elif "allOf" in di:
+        tags = get_dispatch_tags(flatten_allOf(di))
+        return None if tags is None else tags | get_dispatch_tags_flags(di)
+    else:
+        return None
+    return (
+        frozenset({t})
+        | get_dispatch_tags_flags(di)
+        | get_dispatch_tags_flags(effective)
+    )
+
+
+def get_dispatch_tags_flags(di: dict) -> frozenset:
+    return frozenset(k for k in ("autoui", "enum", "examples", "anyOf") if k in di)
+
+
+def drop_null_from_anyOf(di: dict) -> dict:
+    """mirrors the (in-place) side effect of `is_Nullable` for a nullable anyOf with
+    multiple non-null types. the first predicate evaluated during a full scan removes
+    the null type, so later predicates (e.g. `is_AnyOf`) see `allow_none=False`."""
+    if "type" not in di and "anyOf" in di:
+        non_null = [l for l in di["anyOf"] if l.get("type") != "null"]
+        if len(non_null) > 1 and len(non_null) != len(di["anyOf"]):
+            di["anyOf"] = non_null
+    return di
+
+
+_WIDGETS_MAP_INDEX_UID = itertools.count()
+
+
+class WidgetsMapIndex(collections.abc.Mapping):
+    """compiled dispatch structure for a widgets map. mappers are pre-bucketed by the
+    dispatch tags of their `fn_filt` (see `MAP_FN_FILT_TAGS`) so that only the
+    candidate predicates for a given property schema are evaluated. buckets are built
+    lazily and retain the iteration order of the widgets map, so ambiguity detection
+    ("multiple matches found") is unchanged. behaves as a read-only mapping of the
+    WidgetMappers. each index has a unique `uid` used to key the `MAP_WIDGET_CACHE`.
+
+    Args:
+        widgets_map (frozenmap): map of WidgetMappers
+        dispatch (bool, optional): if False, every predicate is evaluated for every
+            property (i.e. a linear scan). Defaults to True.
+    """
+
+    def __init__(self, widgets_map: frozenmap, dispatch: bool = True):
+        self.widgets_map = widgets_map
+        self.dispatch = dispatch
+        self.filters = tuple(
+            (k, v.fn_filt, self._get_tags(v.fn_filt)) for k, v in widgets_map.items()
+        )
+        self.buckets = {}
+        self.uid = next(_WIDGETS_MAP_INDEX_UID)
+
+    @staticmethod
+    def _get_tags(fn_filt) -> ty.Optional[frozenset]:
+        try:
+            return MAP_FN_FILT_TAGS.get(fn_filt)
+        except TypeError:  # unhashable callable
+            return None
+
+    def __getitem__(self, key):
+        return self.widgets_map[key]
+
+    def __iter__(self):
+        return iter(self.widgets_map)
+
+    def __len__(self):
+        return len(self.widgets_map)
+
+    def get_bucket(self, tags: ty.Optional[frozenset]) -> tuple:
+        if tags is None:
+            return tuple((k, fn) for k, fn, _ in self.filters)
+        if tags not in self.buckets:
+            self.buckets[tags] = tuple(
+                (k, fn) for k, fn, t in self.filters if t is None or t & tags
+            )
+        return self.buckets[tags]
+
+    def candidates(self, di: dict) -> tuple:
+        """returns the (widget_name, fn_filt) pairs that could map `di`."""
+        if not self.dispatch:
+            return self.get_bucket(None)
+        tags = get_dispatch_tags(di)
+        if tags == {"anyOf"}:
+            drop_null_from_anyOf(di)
+        return self.get_bucket(tags)
+
+
+def _mapper_key(name: str, mapper) -> tuple:
+    try:
+        key = (name, mapper.fn_filt, mapper.widget, tuple(mapper.li_fn_modify))
+        hash(key)
+        return key
+    except TypeError:  # unhashable content, fall back to identity
+        return (name, id(mapper))
+
+
+class WidgetsMapRegistry:
+    """process-wide registry of memoized widgets maps. maps are built once per unique
+    set of `update_map_widgets` overrides and shared (immutable) between every
+    AutoObject, nested AutoObject and EditGrid row form that uses them.
+
+    Example:
+    ```py
+    from ipyautoui.automapschema import WIDGETS_MAP_REGISTRY
+    print(WIDGETS_MAP_REGISTRY.get() is WIDGETS_MAP_REGISTRY.get({}))
+    #> True
+    ```
+    """
+
+    def __init__(self):
+        self.registered = frozenmap()
+        self.cache = {}
+        self.containers_cache = {}
+
+    def _get_key(self, di_update: ty.Optional[dict]) -> tuple:
+        if not di_update:
+            return ()
+        return tuple(sorted(_mapper_key(k, v) for k, v in di_update.items()))
+
+    def get(self, di_update: ty.Optional[dict] = None) -> WidgetsMapIndex:
+        """get the (shared) compiled widgets map for the given overrides"""
+        key = self._get_key(di_update)
+        if key not in self.cache:
+            di_update = dict(self.registered) | dict(di_update or {})
+            # NOTE: the overrides are held by the cached map so `id` keys stay valid
+            self.cache[key] = WidgetsMapIndex(get_widgets_map(di_update))
+        return self.cache[key]
+
+    def get_containers(self, di_update: ty.Optional[dict] = None) -> WidgetsMapIndex:
+        """get the (shared) compiled containers map for the given overrides"""
+        key = self._get_key(di_update)
+        if key not in self.containers_cache:
+            self.containers_cache[key] = WidgetsMapIndex(get_containers_map(di_update))
+        return self.containers_cache[key]
+
+    def register(self, name: str, mapper: WidgetMapper):
+        """register a WidgetMapper for all subsequently created maps"""
+        self.registered = self.registered.set(name, mapper)
+        self.invalidate()
+
+    def unregister(self, name: str):
+        if name in self.registered:
+            self.registered = self.registered.delete(name)
+        self.invalidate()
+
+    def invalidate(self):
+        """clear the memoized maps. existing widgets keep the map they were built with."""
+        self.cache.clear()
+        self.containers_cache.clear()
+
+
+WIDGETS_MAP_REGISTRY = WidgetsMapRegistry()
+
+
+def get_widgets_map_index(
+    widgets_map: ty.Union[frozenmap, WidgetsMapIndex, None] = None,
+) -> WidgetsMapIndex:
+    """returns a WidgetsMapIndex. if None the shared default from the
+    `WIDGETS_MAP_REGISTRY` is returned."""
+    if widgets_map is None:
+        return WIDGETS_MAP_REGISTRY.get()
+    if isinstance(widgets_map, WidgetsMapIndex):
+        return widgets_map
+    return WidgetsMapIndex(frozenmap(widgets_map))
+
+
+def _copy_caller(caller: WidgetCallerLite) -> WidgetCallerLite:
+    return WidgetCallerLite(
+        schema_=_copy_containers(caller.schema_),
+        autoui=caller.autoui,
+        allow_none=caller.allow_none,
+        args=list(caller.args),
+        kwargs=_copy_containers(caller.kwargs),
+        kwargs_box=_copy_containers(caller.kwargs_box),
+    )
+
+
+class WidgetCallerCache:
+    """LRU cache of WidgetCallerLite templates used by `map_widget`. keyed on the
+    widgets map `uid`, `fail_on_error` and the `canonical_schema_key` of the property
+    schema. a copy of the template is returned on every hit as callers mutate the
+    returned kwargs.
+
+    Args:
+        maxsize (int, optional): max number of templates. 0 disables the cache.
+            Defaults to 2048.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self.templates = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> ty.Optional[WidgetCallerLite]:
+        if key is None or self.maxsize <= 0:
+            return None
+        caller = self.templates.get(key)
+        if caller is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.templates.move_to_end(key)
+        return _copy_caller(caller)
+
+    def set(self, key, caller: WidgetCallerLite):
+        if key is None or self.maxsize <= 0:
+            return
+        self.templates[key] = _copy_caller(caller)
+        self.templates.move_to_end(key)
+        while len(self.templates) > self.maxsize:
+            self.templates.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        self.maxsize = maxsize
+        while len(self.templates) > max(maxsize, 0):
+            self.templates.popitem(last=False)
+
+    def clear(self):
+        self.templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self.templates),
+        )
+
+
+MAP_WIDGET_CACHE = WidgetCallerCache()
+
+
+class WidgetPool:
+    """pool of widgets that are no longer shown, keyed by the `WidgetCaller` template
+    that created them. containers `release` the widgets they remove and `get` widgets
+    from the pool (with the value reset to the default of the template) instead of
+    creating new ones. widgets that weren't created by the pool, or that are evicted
+    when the pool is full, are closed.
+
+    Example:
+    ```py
+    import ipywidgets as w
+    from ipyautoui.automapschema import WidgetCallerLite, WidgetPool
+    pool = WidgetPool(maxsize=1)
+    caller = WidgetCallerLite(schema_={}, autoui=w.IntText, kwargs={"value": 1})
+    a, b = pool.get(caller), pool.get(caller)
+    b.value = 5
+    pool.release(a)
+    pool.release(b)  # the pool is full so `a` is evicted and closed
+    c = pool.get(caller)
+    print(c is b, c.value, a.comm is None)
+    #> True 1 True
+    ```
+
+    Args:
+        maxsize (int, optional): max number of pooled widgets. 0 disables the pool
+            (released widgets are closed). Defaults to 256.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.templates = weakref.WeakKeyDictionary()  # {widget: (key, defaults)}
+        self.pooled = {}  # {key: [widget, ...]}
+        self.order = collections.OrderedDict()  # {widget: key}, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.closed = 0
+
+    @staticmethod
+    def get_key(caller: WidgetCallerLite) -> ty.Optional[tuple]:
+        key = canonical_schema_key(caller.kwargs)
+        if key is None:
+            return None
+        return (caller.autoui, caller.allow_none, key)
+
+    def get(self, caller: WidgetCallerLite) -> w.Widget:
+        """get a widget for `caller` from the pool, or create one"""
+        key = self.get_key(caller) if self.maxsize > 0 else None
+        while key is not None and self.pooled.get(key):
+            widget = self.pooled[key].pop()
+            del self.order[widget]
+            try:
+                for k, v in self.templates[widget][1].items():
+                    setattr(widget, k, copy.deepcopy(v))
+                widget.layout.display = None
+            except Exception as e:
+                logger.warning(f"pooled widget can't be reset, closing it: {e}")
+                self._close(widget)
+                continue
+            self.hits += 1
+            return widget
+        self.misses += 1
+        widget = widgetcaller(caller)
+        if key is not None and hasattr(widget, "value"):
+            defaults = {"value": copy.deepcopy(widget.value)}
+            if widget.has_trait("disabled"):
+                defaults["disabled"] = widget.disabled
+            self.templates[widget] = (key, defaults)
+        return widget
+
+    def release(self, widget: w.Widget):
+        """return a widget that is no longer shown to the pool (or close it)"""
+        if widget in self.order:
+            return
+        template = self.templates.get(widget)
+        if template is None or self.maxsize <= 0 or widget.comm is None:
+            self._close(widget)
+            return
+        self.pooled.setdefault(template[0], []).append(widget)
+        self.order[widget] = template[0]
+        while len(self.order) > self.maxsize:
+            self._evict()
+
+    def _evict(self):
+        widget, key = self.order.popitem(last=False)
+        self.pooled[key].remove(widget)
+        if not self.pooled[key]:
+            del self.pooled[key]
+        self._close(widget)
+
+    def _close(self, widget: w.Widget):
+        self.templates.pop(widget, None)
+        close_all(widget)
+        self.closed += 1
+
+    def resize(self, maxsize: int):
+        self.maxsize = maxsize
+        while len(self.order) > max(maxsize, 0):
+            self._evict()
+
+    def clear(self):
+        """close all the pooled widgets"""
+        while self.order:
+            self._evict()
+
+    def info(self) -> dict:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            closed=self.closed,
+            maxsize=self.maxsize,
+            currsize=len(self.order),
+        )
+
+
+WIDGET_POOL = WidgetPool()
+
+
 def map_widget(
-    di: dict, widgets_map: frozenmap = None, fail_on_error: bool = False
-) -> WidgetCaller:
+    di: dict,
+    widgets_map: ty.Union[frozenmap, WidgetsMapIndex] = None,
+    fail_on_error: bool = False,
+    as_model: bool = False,
+) -> ty.Union[WidgetCallerLite, WidgetCaller]:
     """
     map_widget maps a json schema to a widget. it uses the widgets_map to find the correct widget.
+    successful mappings are cached in `MAP_WIDGET_CACHE` (see `WidgetCallerCache`).
+    returns a `WidgetCallerLite`, or the pydantic `WidgetCaller` if `as_model=True`.
     Example:
     ```py
     from ipyautoui.automapschema import is_FloatText
@@ -1256,8 +1737,22 @@ def map_widget(
     ```
     """
 
-    if widgets_map is None:
-        widgets_map = get_widgets_map()
+    caller = _map_widget(di, get_widgets_map_index(widgets_map), fail_on_error)
+    return caller.to_model() if as_model else caller
+
+
+def _map_widget(
+    di: dict, widgets_map: WidgetsMapIndex, fail_on_error: bool
+) -> WidgetCallerLite:
+    key = None
+    if MAP_WIDGET_CACHE.maxsize > 0:
+        # NOTE: key must be made before the `fn_filt`s are called as they modify `di`
+        key = canonical_schema_key(di)
+        if key is not None:
+            key = (widgets_map.uid, fail_on_error, key)
+        caller = MAP_WIDGET_CACHE.get(key)
+        if caller is not None:
+            return caller
 
     def get_widget(di, k, widgets_map):
         if k == "AutoOveride":
@@ -1266,9 +1761,9 @@ def map_widget(
             return widgets_map[k].widget
 
     mapped = []
-    # loop through widgets_map to find a correct mapping...
-    for widget_name, v in widgets_map.items():
-        check, allow_none = v.fn_filt(di)
+    # loop through candidate mappers to find a correct mapping...
+    for widget_name, fn_filt in widgets_map.candidates(di):
+        check, allow_none = fn_filt(di)
         if check:
             mapped.append((widget_name, allow_none))
 
@@ -1276,7 +1771,7 @@ def map_widget(
         if fail_on_error:
             raise ValueError(f"widget map not found for: {di}")
         else:
-            return WidgetCaller(schema_=di, autoui=AutoPlaceholder)
+            return WidgetCallerLite(schema_=di, autoui=AutoPlaceholder)
     elif len(mapped) == 1:
         # ONLY THIS ONE SHOULD HAPPEN
         widget_name, allow_none = mapped[0]
@@ -1290,13 +1785,15 @@ def map_widget(
         #          as `flatten_type_and_nullable` is typically in `li_fn_modify`
         kwargs_box = update_keys(kwargs_box)
         kwargs_box = remove_non_present_kwargs(AutoBox, kwargs_box)
-        return WidgetCaller(
+        caller = WidgetCallerLite(
             schema_=di,
             autoui=wi,
             allow_none=allow_none,
             kwargs=kwargs,
             kwargs_box=kwargs_box,
         )
+        MAP_WIDGET_CACHE.set(key, caller)
+        return caller
     else:
         s = str(mapped)
         e = f"multiple matches found. . using the last one. {di}. \n  {s}"
@@ -1307,7 +1804,38 @@ def map_widget(
             print(mapped)
             widget_name, allow_none = mapped[-1]
             wi = get_widget(di, widget_name, widgets_map)
-            return WidgetCaller(schema_=di, autoui=wi, allow_none=allow_none)
+            return WidgetCallerLite(schema_=di, autoui=wi, allow_none=allow_none)
+
+
+def caller_to_plan(caller: WidgetCallerLite) -> dict:
+    """serialise a WidgetCaller to plain data (the widget is stored as an import string)"""
+    importstr = obj_to_importstr(caller.autoui)
+    try:
+        is_importable = obj_from_importstr(importstr) is caller.autoui
+    except (ImportError, AttributeError):
+        is_importable = False
+    if not is_importable:
+        raise ValueError(f"{caller.autoui} can't be imported from `{importstr}`")
+    return dict(
+        widget=importstr,
+        allow_none=caller.allow_none,
+        kwargs=caller.kwargs,
+        kwargs_box=caller.kwargs_box,
+    )
+
+
+def caller_from_plan(plan: dict) -> WidgetCallerLite:
+    return WidgetCallerLite(
+        schema_={},
+        autoui=obj_from_importstr(plan["widget"]),
+        allow_none=plan["allow_none"],
+        kwargs=copy_schema(plan["kwargs"]),
+        kwargs_box=copy_schema(plan["kwargs_box"]),
+    )
+
+
+def callers_from_plan(plan: dict) -> dict[str, WidgetCallerLite]:
+    return {k: caller_from_plan(v) for k, v in plan.items()}
 
 
 def get_widget(di, **kwargs):
@@ -1316,12 +1844,17 @@ def get_widget(di, **kwargs):
     return widgetcaller(caller)  # TODO: add passing of value
 
 
+def get_pooled_widget(di, **kwargs):
+    """as `get_widget`, but gets the widget from `WIDGET_POOL` if one is available"""
+    return WIDGET_POOL.get(map_widget(di | kwargs))
+
+
 def from_schema_method(
     cls, schema: ty.Union[ty.Type[BaseModel], dict], value: ty.Optional[dict] = None
 ):
     if "$defs" in schema.keys():
         try:
-            schema = replace_refs(schema, merge_props=True)
+            schema = get_resolved_schema(schema)
         except ValueError as e:
             logger.warning(f"replace_refs error: \n{e}")
             pass
@@ -1331,7 +1864,7 @@ def from_schema_method(
 
 
 def from_model_method(cls, model: ty.Type[BaseModel], value: ty.Optional[dict] = None):
-    schema = replace_refs(model.model_json_schema(), merge_props=True)
+    schema = get_resolved_schema(model)
     if value is not None:
         schema["value"] = value
     ui = cls(**schema)
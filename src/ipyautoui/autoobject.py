@@ -15,6 +15,9 @@
 
 # +
 import logging
+import functools
+import typing as ty
+import collections.abc
 import pathlib
 import ipywidgets as w
 import traitlets as tr
@@ -22,11 +25,12 @@ from IPython.display import display
 from jsonref import replace_refs
 
 import ipyautoui.automapschema as aumap
-from ipyautoui._utils import obj_from_importstr, is_null
+from ipyautoui._utils import obj_from_importstr, is_null, close_all, CloseAll
 from ipyautoui.nullable import Nullable
+from ipyautoui.constants import BUTTON_WIDTH_MIN
 from ipyautoui.autobox import AutoBox
 from ipyautoui.autoform import AutoObjectFormLayout
-from ipyautoui.watch_validate import WatchValidate
+from ipyautoui.watch_validate import WatchValidate, get_diff
 from ipyautoui.custom.title_description import TitleDescription
 
 logger = logging.getLogger(__name__)
@@ -56,7 +60,106 @@ def _get_value_trait(obj_with_traits):
         )
 
 
-class AutoObject(w.VBox, WatchValidate):
+def _get_widget_value(widget):
+    return widget._value if "_value" in widget.traits() else widget.value
+
+
+def get_nested_widgets() -> list:
+    """widgets that are shown nested (i.e. collapsible) within an AutoObject"""
+    from ipyautoui.custom.markdown_widget import MarkdownWidget  # , EditGrid
+    from ipyautoui.custom.iterable import AutoArray
+    from ipyautoui.custom.editgrid import EditGrid  # as EditGridCore
+    from ipyautoui import AutoUi
+
+    return [
+        AutoArray,
+        MarkdownWidget,
+        EditGrid,
+        AutoUi,
+        AutoObject,
+    ]
+
+
+def map_properties(
+    properties: dict,
+    widgets_map: aumap.WidgetsMapIndex = None,
+    nested_widgets: ty.Optional[list] = None,
+) -> dict[str, aumap.WidgetCallerLite]:
+    """map the properties of an object schema to WidgetCallers
+
+    Args:
+        properties (dict): json schema properties
+        widgets_map (WidgetsMapIndex, optional): Defaults to None.
+        nested_widgets (list, optional): Defaults to `get_nested_widgets()`.
+
+    Returns:
+        dict[str, WidgetCallerLite]: di_callers
+    """
+    if nested_widgets is None:
+        nested_widgets = get_nested_widgets()
+    di_callers = {
+        property_key: aumap.map_widget(property_schema, widgets_map=widgets_map)
+        for property_key, property_schema in properties.items()
+    }
+    for k, v in di_callers.items():
+        if v.autoui in nested_widgets:
+            v.kwargs = v.kwargs | {"show_title": False, "show_description": False}
+            # NOTE: ^ this avoids nested widgets having title and description both in AutoBox and in themselves
+            v.kwargs_box = v.kwargs_box | {"nested": True}
+    return di_callers
+
+
+class LazyWidget(w.VBox):
+    """placeholder for a nested widget that is created when it is first opened (see
+    `AutoObject.lazy_nested`). the value is held as plain data until then."""
+
+    _value = tr.Any(default_value=None, allow_none=True)
+
+    def __init__(self, caller: aumap.WidgetCallerLite, **kwargs):
+        self.caller = caller
+        super().__init__(**kwargs)
+        self._value = caller.kwargs_box.get("value")
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    def realise(self) -> w.Widget:
+        """create the widget, with the value of the placeholder"""
+        widget = aumap.widgetcaller(self.caller)
+        if self._value is not None:
+            widget.value = self._value
+        return widget
+
+
+def is_lazy(caller: aumap.WidgetCallerLite) -> bool:
+    """nested widgets with a default value can be created lazily. widgets without a
+    default get their value from their child widgets so must be created."""
+    return (
+        caller.kwargs_box.get("nested", False)
+        and not caller.allow_none
+        and "value" in caller.kwargs_box
+    )
+
+
+_NO_DEFAULT = object()
+
+
+def get_default_value(caller: aumap.WidgetCallerLite) -> ty.Any:
+    """the default value of a widget caller, without creating the widget.
+    returns `_NO_DEFAULT` if the value is only known once the widget is created."""
+    if "value" in caller.kwargs_box:
+        return caller.kwargs_box["value"]
+    if caller.allow_none:
+        return None
+    return _NO_DEFAULT
+
+
+class AutoObject(CloseAll, w.VBox, WatchValidate):
     """creates an ipywidgets form from a json-schema or pydantic model.
     datatype must be "object"
 
@@ -87,14 +190,31 @@ class AutoObject(w.VBox, WatchValidate):
             is ignored by the widget otherwise.
         disabled (bool, optional): disables all widgets. If widgets are disabled
             using schema kwargs this is remembered when re-enabled. Defaults to False.
+        plan (dict, optional): precompiled widget callers (see `ipyautoui.autoplan`).
+            if given the properties are not mapped. Defaults to None.
+        lazy_nested (bool, optional): create nested widgets (that have a default value)
+            when they are first opened or included in `order`. until then their value
+            is held as plain data in a `LazyWidget`. Defaults to False.
+        page_size (int, optional): if given only `page_size` rows are shown at a time
+            and widgets are only created for the visible page (plus `page_buffer` rows
+            either side). the values of the other rows are held as plain data in
+            `_value` and the row boxes are recycled when paging. Defaults to None.
+        page_buffer (int, optional): rows either side of the page that keep their
+            widgets. Defaults to 0.
+        page (int): the page shown (when `page_size` is given).
+        search (str): filters the rows shown (when `page_size` is given) by key and title.
 
     """
 
     nested_widgets = tr.List()
     update_map_widgets = tr.Dict()
-    widgets_map = tr.Dict()
+    widgets_map = tr.Instance(klass=collections.abc.Mapping)
     type = tr.Unicode(default_value="object")
     allOf = tr.List(allow_none=True, default_value=None)
+    plan = tr.Dict(default_value=None, allow_none=True)
+    lazy_nested = tr.Bool(default_value=False)
+    page_size = tr.Int(default_value=None, allow_none=True)
+    page_buffer = tr.Int(default_value=0)
     properties = tr.Dict()
     _value = tr.Dict(
         allow_none=True
@@ -107,22 +227,34 @@ class AutoObject(w.VBox, WatchValidate):
     disabled = tr.Bool(default_value=False)
     open_nested = tr.Bool(default_value=None, allow_none=True)
     show_null = tr.Bool(default_value=False)
+    page = tr.Int(default_value=0)
+    search = tr.Unicode(default_value="")
     # show_raw = tr.Bool(default_value=False)  # TODO: match logic for show_null
 
     @tr.observe("show_null", "_value")
     def observe_show_null(self, on_change):
-        self._show_null(self.show_null)
-
-    def _show_null(self, yesno: bool):
-        for k, v in self.di_boxes.items():
-            if k in self.value.keys():
-                if is_null(self.value[k]):
-                    v.layout.display = (lambda yesno: "" if yesno else "None")(yesno)
+        keys = None
+        old, new = on_change["old"], on_change["new"]
+        if on_change["name"] == "_value" and isinstance(old, dict):
+            if isinstance(new, dict) and old.keys() == new.keys():
+                keys = [k for k, v in new.items() if v is not old[k]]
+        self._show_null(self.show_null, keys=keys)
+
+    def _show_null(self, yesno: bool, keys: ty.Optional[list] = None):
+        di_boxes = self.di_boxes
+        if keys is not None:  # only update the boxes of the changed keys
+            di_boxes = {k: di_boxes[k] for k in keys if k in di_boxes}
+        display_null = "" if yesno else "None"
+        with self.bulk_update([v.layout for v in di_boxes.values()]):
+            for k, v in di_boxes.items():
+                if k in self.value.keys():
+                    if is_null(self.value[k]):
+                        v.layout.display = display_null
+                    else:
+                        v.layout.display = ""
                 else:
-                    v.layout.display = ""
-            else:
-                # If no value passed assume value is None
-                v.layout.display = (lambda yesno: "" if yesno else "None")(yesno)
+                    # If no value passed assume value is None
+                    v.layout.display = display_null
 
     @tr.default("update_map_widgets")
     def _default_update_map_widgets(self):
@@ -130,11 +262,15 @@ class AutoObject(w.VBox, WatchValidate):
 
     @tr.observe("update_map_widgets")
     def _update_map_widgets(self, on_change):
-        self.widgets_map = dict(aumap.get_widgets_map(self.update_map_widgets))
+        self.widgets_map = aumap.WIDGETS_MAP_REGISTRY.get(self.update_map_widgets)
 
     @tr.default("widgets_map")
     def _widgets_map(self):
-        return dict(aumap.get_widgets_map(self.update_map_widgets))
+        return aumap.WIDGETS_MAP_REGISTRY.get(self.update_map_widgets)
+
+    @tr.validate("widgets_map")
+    def _valid_widgets_map(self, proposal):
+        return aumap.get_widgets_map_index(proposal["value"])
 
     @tr.validate("type")
     def _valid_type(self, proposal):
@@ -151,17 +287,16 @@ class AutoObject(w.VBox, WatchValidate):
 
     @tr.observe("properties")
     def _properties(self, on_change):
-        self.di_callers = {
-            property_key: aumap.map_widget(
-                property_schema, widgets_map=self.widgets_map
+        if on_change["old"] and hasattr(self, "di_widgets"):
+            self.plan = None  # the plan is only valid for the initial properties
+            self._update_properties(on_change["old"])
+            return
+        if self.plan is not None:  # precompiled, see `ipyautoui.autoplan`
+            self.di_callers = aumap.callers_from_plan(self.plan["callers"])
+        else:
+            self.di_callers = map_properties(
+                self.properties, self.widgets_map, self.nested_widgets
             )
-            for property_key, property_schema in self.properties.items()
-        }
-        for k, v in self.di_callers.items():
-            if v.autoui in self.nested_widgets:
-                v.kwargs = v.kwargs | {"show_title": False, "show_description": False}
-                # NOTE: ^ this avoids nested widgets having title and description both in AutoBox and in themselves
-                v.kwargs_box = v.kwargs_box | {"nested": True}
         self._init_ui()
 
     @tr.observe("align_horizontal")
@@ -196,28 +331,31 @@ class AutoObject(w.VBox, WatchValidate):
 
     @tr.observe("disabled")
     def observe_disabled(self, on_change):
-        if self.disabled:
-            for k, v in self.di_widgets.items():
-                try:
-                    v.disabled = True
-                except:
-                    logger.warning(f"{k}: widget does not have a `disabled` traitlet")
-        else:
-            for k, v in self.di_widgets.items():
-                if (
-                    "disabled" in self.properties[k].keys()
-                    and self.properties[k]["disabled"]
-                ):
-                    logger.info(
-                        f"{k}: widget is disabled in base schema. Enabling not allowed."
-                    )
-                else:
+        with self.bulk_update():
+            if self.disabled:
+                for k, v in self.di_widgets.items():
                     try:
-                        v.disabled = False
+                        v.disabled = True
                     except:
                         logger.warning(
                             f"{k}: widget does not have a `disabled` traitlet"
                         )
+            else:
+                for k, v in self.di_widgets.items():
+                    if (
+                        "disabled" in self.properties[k].keys()
+                        and self.properties[k]["disabled"]
+                    ):
+                        logger.info(
+                            f"{k}: widget is disabled in base schema. Enabling not allowed."
+                        )
+                    else:
+                        try:
+                            v.disabled = False
+                        except:
+                            logger.warning(
+                                f"{k}: widget does not have a `disabled` traitlet"
+                            )
 
     @tr.validate("order")
     def _order(self, proposal):
@@ -239,13 +377,22 @@ class AutoObject(w.VBox, WatchValidate):
 
     @tr.observe("order")
     def _obs_order(self, on_change):
-        if len(on_change["new"]) < len(self.di_boxes) and not self.order_can_hide_rows:
+        if (
+            len(on_change["new"]) < len(self.default_order)
+            and not self.order_can_hide_rows
+        ):
             logger.warning(
                 "order_can_hide_rows == False. set to True to use order to filter"
             )
             self.order = on_change["old"]
         else:
-            self.vbx_widget.children = [self.di_boxes[o] for o in self.order]
+            if self.is_paged:
+                self._show_page()
+            else:
+                self.vbx_widget.children = [self.di_boxes[o] for o in self.order]
+            for k in self.order:
+                if k in self.di_widgets:
+                    self.realise_widget(k)
 
     @tr.validate("order_can_hide_rows")
     def _order_can_hide_rows(self, proposal):
@@ -257,18 +404,7 @@ class AutoObject(w.VBox, WatchValidate):
 
     @tr.default("nested_widgets")
     def _default_nested_widgets(self):
-        from ipyautoui.custom.markdown_widget import MarkdownWidget  # , EditGrid
-        from ipyautoui.custom.iterable import AutoArray
-        from ipyautoui.custom.editgrid import EditGrid  # as EditGridCore
-        from ipyautoui import AutoUi
-
-        return [
-            AutoArray,
-            MarkdownWidget,
-            EditGrid,
-            AutoUi,
-            AutoObject,
-        ]
+        return get_nested_widgets()
 
     @tr.validate("nested_widgets")
     def _valid_nested_widgets(self, proposal):
@@ -282,6 +418,43 @@ class AutoObject(w.VBox, WatchValidate):
         else:
             self._close_nested()
 
+    @tr.observe("page_size")
+    def _observe_page_size(self, on_change):
+        if not hasattr(self, "di_widgets"):
+            return
+        if on_change["old"] is not None and on_change["new"] is not None:
+            self._show_page()
+        else:  # switching between paged and not paged
+            value = self._get_value()
+            self._close_widgets()
+            self._init_ui()
+            with self.silence_autoui_traits():
+                self._update_widgets_from_value()
+            self._value = self._get_value() | value
+
+    @tr.observe("page_buffer")
+    def _observe_page_buffer(self, on_change):
+        if self.is_paged:
+            self._show_page()
+
+    @tr.validate("page")
+    def _valid_page(self, proposal):
+        if not self.is_paged:
+            return proposal["value"]
+        return min(max(proposal["value"], 0), self.n_pages - 1)
+
+    @tr.observe("page")
+    def _observe_page(self, on_change):
+        if self.is_paged:
+            self._show_page()
+
+    @tr.observe("search")
+    def _observe_search(self, on_change):
+        if self.page != 0:
+            self.page = 0  # shows the page
+        elif self.is_paged:
+            self._show_page()
+
     @tr.validate("_value")
     def _valid_value(self, proposal):
         # TODO: add validation?
@@ -326,9 +499,9 @@ class AutoObject(w.VBox, WatchValidate):
         {setattr(self, k, v) for k, v in kwargs.items()}
 
         if "value" in kwargs.keys():
-            self.value = self.di_widgets_value | kwargs["value"]
+            self.value = self._get_value() | kwargs["value"]
         else:
-            self._value = self.di_widgets_value
+            self._value = self._get_value()
         self._show_null(self.show_null)
         self._set_children()
         self._post_init(**kwargs)
@@ -340,19 +513,21 @@ class AutoObject(w.VBox, WatchValidate):
         pass
 
     def _open_nested(self):
-        for r in self.di_boxes.values():
-            if r.nested:
-                r.tgl.value = True
+        with self.bulk_update():
+            for r in self.di_boxes.values():
+                if r.nested:
+                    r.tgl.value = True
 
     def _close_nested(self):
-        for r in self.di_boxes.values():
-            if r.nested:
-                r.tgl.value = False
+        with self.bulk_update():
+            for r in self.di_boxes.values():
+                if r.nested:
+                    r.tgl.value = False
 
     @property
     def default_order(self):
         try:
-            return list(self.di_widgets.keys())
+            return list(self.di_callers.keys())
         except:
             return None
 
@@ -360,23 +535,271 @@ class AutoObject(w.VBox, WatchValidate):
         self._init_widgets()
         self._init_controls()
 
+    def _init_widget(self, caller: aumap.WidgetCallerLite) -> w.Widget:
+        if self.lazy_nested and is_lazy(caller):
+            return LazyWidget(caller)
+        if self.is_paged:  # widgets are released to the pool when paging
+            return aumap.WIDGET_POOL.get(caller)
+        return aumap.widgetcaller(caller)
+
     def _init_widgets(self):
-        self.di_widgets = {k: aumap.widgetcaller(v) for k, v in self.di_callers.items()}
-        self.di_boxes = {
-            k: AutoBox(
-                **(self.di_callers[k].kwargs_box | {"widget": self.di_widgets[k]})
-            )
-            for k in self.di_callers.keys()
-        }
+        if self.is_paged:
+            self._init_pages()
+            return
+        self.di_widgets = {k: self._init_widget(v) for k, v in self.di_callers.items()}
+        self._map_widget_key = {id(v): k for k, v in self.di_widgets.items()}
+        self.di_boxes = {k: self._init_box(k) for k in self.di_callers.keys()}
         self.vbx_widget.children = list(self.di_boxes.values())
         self.indent_widgets()
 
+    def _init_box(self, key: str) -> AutoBox:
+        widget = self.di_widgets[key]
+        box = AutoBox(**(self.di_callers[key].kwargs_box | {"widget": widget}))
+        if isinstance(widget, LazyWidget):
+            box.tgl.observe(functools.partial(self._realise_on_open, box), "value")
+        return box
+
+    def _update_properties(self, old: dict):
+        """remap and recreate only the rows whose property schema has changed. the
+        widgets (and values) of unchanged rows are kept."""
+        new = self.properties
+        changed = [k for k, v in new.items() if k not in old or old[k] != v]
+        removed = [k for k in old if k not in new]
+        if not changed and not removed and list(old) == list(new):
+            return
+        di_callers = map_properties(
+            {k: new[k] for k in changed}, self.widgets_map, self.nested_widgets
+        )
+        self.flush_changes()
+        value = self._value if isinstance(self._value, dict) else {}
+        self._value = {k: v for k, v in value.items() if k in new and k not in changed}
+        for k in removed + changed:
+            if k in self.di_widgets:
+                self._close_widget(k)
+            if not self.is_paged and k in self.di_boxes:
+                self.di_boxes.pop(k).close()
+        self.di_callers = {k: di_callers.get(k, self.di_callers.get(k)) for k in new}
+
+        order = self.order
+        if order is not None:
+            order = [k for k in order if k in new]
+            if not self.order_can_hide_rows:
+                order += [k for k in new if k not in order]
+        if self.is_paged:
+            for k in changed:
+                if get_default_value(self.di_callers[k]) is _NO_DEFAULT:
+                    self._materialize(k)
+        else:
+            for k in changed:
+                self._materialize(k)
+                self.di_boxes[k] = self._init_box(k)
+            self.di_widgets = {k: self.di_widgets[k] for k in new}
+            self.di_boxes = {k: self.di_boxes[k] for k in new}
+            self.indent_widgets()
+        if order != self.order:
+            self.order = order  # shows the rows
+        elif self.is_paged:
+            self._show_page()
+        else:
+            keys = new if self.order is None else self.order
+            self.vbx_widget.children = [self.di_boxes[k] for k in keys]
+        self._value = self._get_value()
+        self._show_null(self.show_null)
+
+    def _realise_on_open(self, box, on_change):
+        if on_change["new"]:
+            key = next((k for k, v in self.di_boxes.items() if v is box), None)
+            if key is not None:
+                self.realise_widget(key)
+
+    @property
+    def is_paged(self) -> bool:
+        return self.page_size is not None and hasattr(self, "di_callers")
+
+    @property
+    def page_keys(self) -> list:
+        """the keys of the rows that can be paged through (i.e. `order` filtered by
+        `search`)"""
+        keys = self.order if self.order is not None else self.default_order
+        if self.search:
+            s = self.search.lower()
+            keys = [
+                k
+                for k in keys
+                if s in k.lower()
+                or s in str(self.di_callers[k].kwargs_box.get("title", "")).lower()
+            ]
+        return keys
+
+    @property
+    def n_pages(self) -> int:
+        return max(1, -(-len(self.page_keys) // max(self.page_size, 1)))
+
+    def _init_page_controls(self):
+        self.bn_prev = w.Button(icon="chevron-left", layout={"width": BUTTON_WIDTH_MIN})
+        self.bn_next = w.Button(
+            icon="chevron-right", layout={"width": BUTTON_WIDTH_MIN}
+        )
+        self.html_page = w.HTML()
+        self.txt_search = w.Text(placeholder="search", value=self.search)
+        self.hbx_pages = w.HBox(
+            [self.bn_prev, self.html_page, self.bn_next, self.txt_search]
+        )
+        self.bn_prev.on_click(lambda _: setattr(self, "page", self.page - 1))
+        self.bn_next.on_click(lambda _: setattr(self, "page", self.page + 1))
+        tr.link((self.txt_search, "value"), (self, "search"))
+
+    def _init_pages(self):
+        self.di_widgets, self._map_widget_key, self.di_boxes = {}, {}, {}
+        if not hasattr(self, "_boxes_pool"):
+            self._boxes_pool = []  # AutoBox's recycled when paging
+            self._init_page_controls()
+        value = self._value if isinstance(self._value, dict) else {}
+        for k, caller in self.di_callers.items():
+            if k not in value and get_default_value(caller) is _NO_DEFAULT:
+                self._materialize(k)  # the value is got from the widget
+        self._show_page()
+
+    def _materialize(self, key: str) -> w.Widget:
+        """create and watch the widget for `key`, setting the value from `_value`"""
+        if key in self.di_widgets:
+            return self.di_widgets[key]
+        widget = self._init_widget(self.di_callers[key])
+        if isinstance(self._value, dict) and key in self._value:
+            self._set_widget_value(widget, self._value[key])
+        self.di_widgets[key] = widget
+        self._map_widget_key[id(widget)] = key
+        self._watch_widget(key, widget)
+        if self.disabled and widget.has_trait("disabled"):
+            widget.disabled = True
+        return widget
+
+    def _dematerialize(self, key: str):
+        """close the widget for `key` (in paged mode), keeping its value in `_value`"""
+        value = _get_widget_value(self.di_widgets[key])
+        if isinstance(self._value, dict) and (
+            key not in self._value or self._value[key] != value
+        ):
+            self._value = self._value | {key: value}
+        self._close_widget(key)
+
+    def _close_widget(self, key: str):
+        widget = self.di_widgets.pop(key)
+        del self._map_widget_key[id(widget)]
+        for watch in ["_value", "value"]:
+            if widget.has_trait(watch):
+                widget.unobserve(self._watch_validate_change, watch)
+                break
+        aumap.WIDGET_POOL.release(widget)
+
+    def _get_box(self, n: int) -> AutoBox:
+        while len(self._boxes_pool) <= n:
+            box = AutoBox()
+            fn = functools.partial(self._realise_on_open, box)
+            box.get_tgl.observe(fn, "value")
+            self._boxes_pool.append(box)
+        return self._boxes_pool[n]
+
+    def _recycle_box(self, box: AutoBox, key: str):
+        """set an AutoBox from the pool to show the row for `key`"""
+        kwargs_box = self.di_callers[key].kwargs_box
+        previous = getattr(box, "_kwargs_box", {})
+        kwargs = {
+            k: box.trait_defaults(k)
+            for k in previous
+            if k not in kwargs_box and box.has_trait(k)
+        }
+        kwargs |= {k: v for k, v in kwargs_box.items() if k not in ["value", "tooltip"]}
+        kwargs |= {
+            "nested": kwargs_box.get("nested", False),
+            "indent": False,
+            "align_horizontal": self.align_horizontal,
+            "widget": self.di_widgets[key],
+        }
+        with box.hold_trait_notifications():
+            for k, v in kwargs.items():
+                setattr(box, k, v)
+        box._kwargs_box = kwargs_box
+        box.tgl.value = bool(self.open_nested) if box.nested else True
+        box._tgl("")
+
+    def _show_page(self):
+        """create the widgets of the page shown (closing the rest) and recycle the boxes"""
+        self.flush_changes()
+        keys, size = self.page_keys, max(self.page_size, 1)
+        page = min(self.page, self.n_pages - 1)
+        start, end = page * size, page * size + size
+        visible = keys[start:end]
+        buffer = keys[max(start - self.page_buffer, 0) : start]
+        buffer += keys[end : end + self.page_buffer]
+        keep = set(visible) | set(buffer)
+        for k in [k for k in self.di_widgets if k not in keep]:
+            self._dematerialize(k)
+        for k in visible + buffer:
+            self._materialize(k)
+        self.di_boxes = {k: self._get_box(n) for n, k in enumerate(visible)}
+        for k, box in self.di_boxes.items():
+            self._recycle_box(box, k)
+        for box in self._boxes_pool[len(visible) :]:
+            # unused boxes mustn't hold widgets released to the pool (which may be
+            # given to another container and would be closed with this one)
+            box.widget = box.trait_defaults("widget")
+        self.indent_widgets()
+        self.html_page.value = f"{page + 1} / {self.n_pages}"
+        self.vbx_widget.children = [self.hbx_pages] + list(self.di_boxes.values())
+        if isinstance(self._value, dict):
+            self._show_null(self.show_null)
+
+    def _close_widgets(self):
+        pool = getattr(self, "_boxes_pool", [])
+        for k, v in self.di_boxes.items():
+            if not any(v is b for b in pool):
+                v.close()
+        for v in self.di_widgets.values():
+            v.close()
+        self.di_widgets, self._map_widget_key, self.di_boxes = {}, {}, {}
+
+    def realise_widget(self, key: str) -> w.Widget:
+        """create the widget for `key` if it is a `LazyWidget` placeholder
+
+        Args:
+            key (str): property key
+
+        Returns:
+            w.Widget: the widget
+        """
+        lazy = self.di_widgets[key]
+        if not isinstance(lazy, LazyWidget):
+            return lazy
+        caller = lazy.caller
+        if isinstance(caller.autoui, type) and issubclass(caller.autoui, AutoObject):
+            caller = aumap._copy_caller(caller)
+            caller.kwargs = caller.kwargs | {"lazy_nested": True}
+            lazy.caller = caller
+        widget = lazy.realise()
+        self.di_widgets[key] = widget
+        del self._map_widget_key[id(lazy)]
+        self._map_widget_key[id(widget)] = key
+        self._watch_widget(key, widget)
+        if self.disabled and widget.has_trait("disabled"):
+            widget.disabled = True
+        box = self.di_boxes[key]
+        box.widget = widget
+        box._tgl("")
+        lazy.close()
+        value = _get_widget_value(widget)
+        if isinstance(self._value, dict) and self._value.get(key) != value:
+            self._value = self._value | {key: value}
+        return widget
+
     def indent_widgets(self):
         """Indent the widgets appropriately based on the schema.
         Any widget that is not nullable and has a type of "array" will be indented."""
         li = [v.allow_none for v in self.di_callers.values()]
         if True in li:
             for k, v in self.di_callers.items():
+                if k not in self.di_boxes:
+                    continue
                 if not v.allow_none:
                     self.di_boxes[k].indent = True
                 if "type" in v.kwargs and v.kwargs["type"] == "array":
@@ -397,35 +820,74 @@ class AutoObject(w.VBox, WatchValidate):
             watch,  # NOTE: `_watch_validate_change` in WatchValidate
         )
 
+    def _watch_widget(self, key, widget):
+        for watch in ["_value", "value"]:
+            if widget.has_trait(watch):
+                self.set_watcher(key, widget, watch)
+                break  # if `_value` is found don't look for `value`
+
     def _init_watch_widgets(self):
+        if self.is_paged:
+            return  # widgets are watched when created, see `_materialize`
         for k, v in self.di_widgets.items():
-            for watch in ["_value", "value"]:
-                if v.has_trait(watch):
-                    self.set_watcher(k, v, watch)
-                    break  # if `_value` is found don't look for `value`
-
-    def _update_widgets_from_value(self):
-        with self.silence_autoui_traits():
-            for k, v in self.value.items():
+            self._watch_widget(k, v)
+
+    def _update_widgets_from_value(self, old: ty.Optional[dict] = None):
+        value = self.value
+        diff = get_diff(old, value)  # only update widgets with changed values
+        if diff is not None:
+            value = diff
+        widgets = [self.di_widgets[k] for k in value if k in self.di_widgets]
+        with self.silence_autoui_traits(), self.bulk_update(widgets):
+            for k, v in value.items():
                 if k in self.di_widgets.keys():
-                    if is_null(v) and not isinstance(self.di_widgets[k], Nullable):
-                        v = _get_value_trait(self.di_widgets[k]).default()
-                    try:
-                        self.di_widgets[k].value = v
-                    except tr.TraitError as err:
-                        logging.warning(err)
+                    self._set_widget_value(self.di_widgets[k], v)
+                elif k in self.di_callers:
+                    pass  # not on the page shown. the value is held in `_value`
                 else:
                     logging.critical(
                         f"no widget created for {k}, with value {str(v)}. fix this in the schema!"
                     )
 
+    @staticmethod
+    def _set_widget_value(widget, v):
+        if is_null(v) and not isinstance(widget, Nullable):
+            v = _get_value_trait(widget).default()
+        try:
+            widget.value = v
+        except tr.TraitError as err:
+            logging.warning(err)
+
     def _get_value(self):
-        return self.di_widgets_value
+        if not self.is_paged:
+            return self.di_widgets_value
+        value = self._value if isinstance(self._value, dict) else {}
+        widgets_value = self.di_widgets_value
+        return {
+            k: (
+                widgets_value[k]
+                if k in widgets_value
+                else value.get(k, get_default_value(v))
+            )
+            for k, v in self.di_callers.items()
+        }
+
+    def _get_value_on_change(self, on_change):
+        # NOTE: patches the changed key only (on_change["new"] is the value of the
+        #       watched "_value" or "value" trait, as read by `di_widgets_value`)
+        k = self._map_widget_key.get(id(on_change["owner"]))
+        if (
+            k is None
+            or not isinstance(self._value, dict)
+            or len(self._value) != len(self.di_callers)
+            or k not in self._value
+        ):
+            return self._get_value()
+        return self._value | {k: on_change["new"]}
 
     @property
     def di_widgets_value(self):  # used to set _value
-        get_value = lambda v: v._value if "_value" in v.traits() else v.value
-        return {k: get_value(v) for k, v in self.di_widgets.items()}
+        return {k: _get_widget_value(v) for k, v in self.di_widgets.items()}
 
     def check_for_nullables(self) -> bool:
         """Search through widgets and as soon as a Nullable widget is found, return True.
@@ -433,6 +895,8 @@ class AutoObject(w.VBox, WatchValidate):
         for v in self.di_widgets.values():
             if isinstance(v, Nullable):
                 return True
+        if self.is_paged:  # not all widgets are created
+            return any(v.allow_none for v in self.di_callers.values())
         return False
 
 
@@ -441,6 +905,7 @@ class AutoObjectForm(AutoObject, AutoObjectFormLayout, TitleDescription):
         super().__init__(
             **kwargs,
         )
+        previous = self.children
         self.children = [
             w.HBox([self.bn_shownull, self.savebuttonbar]),
             self.html_title,
@@ -448,6 +913,7 @@ class AutoObjectForm(AutoObject, AutoObjectFormLayout, TitleDescription):
             self.vbx_widget,
             self.vbx_showraw,
         ]
+        close_all(*previous, keep=self.children)
         self.show_hide_bn_nullable()
 
     def display_ui(self):
@@ -0,0 +1,189 @@
+"""compile a pydantic model or json schema into a serialisable "UI plan".
+
+a plan is plain data (json) containing the resolved schema and the widget callers
+(widget import strings, kwargs, kwargs_box, nesting and nullability) that are otherwise
+created by mapping the schema (`map_widget`) every time a ui is initialised. plans can
+be saved to disk and AutoUi / AutoObject instances built from them without re-running
+the mappers. plans are keyed by a hash of the resolved schema and ipyautoui version, so
+are invalidated automatically when either changes.
+
+NOTE: only the root object and nested objects are precompiled. arrays, anyOf's and
+editable grids map their items when created.
+
+Example::
+
+    from ipyautoui.autoplan import get_plan
+    from ipyautoui.autoui import AutoUi
+    plan = get_plan(MyModel, fdir=pathlib.Path(".plans"))  # compiled once and saved
+    ui = AutoUi(MyModel, plan=plan)
+"""
+
+import json
+import pathlib
+import hashlib
+import logging
+import typing as ty
+import importlib.metadata
+from pydantic import BaseModel
+
+import ipyautoui.automapschema as aumap
+from ipyautoui._utils import copy_schema
+from ipyautoui.autoobject import AutoObject, map_properties
+from ipyautoui.autoui import get_root_caller
+
+logger = logging.getLogger(__name__)
+PLAN_VERSION = 1
+
+
+def _get_version() -> str:
+    try:
+        return importlib.metadata.version("ipyautoui")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def get_schema_hash(schema: dict) -> str:
+    """hash of a resolved json schema, the ipyautoui version and the plan version.
+    key order is retained as it defines the order of the ui."""
+    s = json.dumps(
+        {"schema": schema, "ipyautoui": _get_version(), "plan_version": PLAN_VERSION},
+        default=str,
+    )
+    return hashlib.sha256(s.encode()).hexdigest()
+
+
+def check_plan(plan: dict, schema: dict) -> bool:
+    """check the plan was compiled for the resolved `schema`. logs a warning if not"""
+    if plan.get("schema_hash") == get_schema_hash(schema):
+        return True
+    logger.warning("plan invalidated, schema changed. the schema will be mapped")
+    return False
+
+
+def _init_model_schema(schema, by_alias: bool = False):
+    model, schema = aumap._init_model_schema(schema, by_alias=by_alias)
+    if aumap.canonical_schema_key(schema) is None:
+        raise ValueError("recursive schemas can't be compiled to a plan")
+    return model, schema
+
+
+def _is_object(caller: aumap.WidgetCallerLite) -> bool:
+    return (
+        isinstance(caller.autoui, type)
+        and issubclass(caller.autoui, AutoObject)
+        and "properties" in caller.kwargs
+    )
+
+
+def compile_callers(
+    properties: dict, widgets_map: aumap.WidgetsMapIndex = None
+) -> dict:
+    """compile the widget callers of the properties of an object (and nested objects)"""
+    di_callers = map_properties(properties, widgets_map)
+    plan = {}
+    for k, v in di_callers.items():
+        if _is_object(v):
+            nested = compile_callers(v.kwargs["properties"], widgets_map)
+            v.kwargs = v.kwargs | {"plan": {"callers": nested}}
+        plan[k] = aumap.caller_to_plan(v)
+    return plan
+
+
+def compile_plan(
+    schema: ty.Union[ty.Type[BaseModel], dict],
+    by_alias: bool = False,
+    widgets_map: aumap.WidgetsMapIndex = None,
+) -> dict:
+    """compile a pydantic model or json schema into a UI plan
+
+    Args:
+        schema (ty.Union[ty.Type[BaseModel], dict]): pydantic model or json schema
+        by_alias (bool, optional): Defaults to False.
+        widgets_map (WidgetsMapIndex, optional): Defaults to None.
+
+    Returns:
+        dict: json serialisable plan
+    """
+    model, schema = _init_model_schema(schema, by_alias=by_alias)
+    caller, is_container = get_root_caller(schema)
+    plan = dict(
+        schema_hash=get_schema_hash(schema),
+        schema=schema,
+        root=aumap.caller_to_plan(caller),
+        is_container=is_container,
+        callers=None,
+    )
+    if is_container and _is_object(caller):
+        properties = copy_schema(schema["properties"])
+        plan["callers"] = compile_callers(properties, widgets_map)
+    json.dumps(plan)  # raises if the plan isn't serialisable
+    return plan
+
+
+def save_plan(plan: dict, path: pathlib.Path):
+    pathlib.Path(path).write_text(json.dumps(plan), encoding="utf-8")
+
+
+def load_plan(path: pathlib.Path, schema_hash: ty.Optional[str]):
+    """load a plan. returns None if there is no plan or the `schema_hash` doesn't match.
+    pass `schema_hash=None` to load without checking (a warning is logged)"""
+    path = pathlib.Path(path)
+    if not path.is_file():
+        return None
+    plan = json.loads(path.read_text(encoding="utf-8"))
+    if schema_hash is None:
+        logger.warning(f"plan loaded without checking the schema_hash: {path}")
+    elif plan.get("schema_hash") != schema_hash:
+        logger.info(f"plan invalidated, schema changed: {path}")
+        return None
+    return plan
+
+
+def get_plan(
+    schema: ty.Union[ty.Type[BaseModel], dict],
+    fdir: ty.Optional[pathlib.Path] = None,
+    by_alias: bool = False,
+) -> dict:
+    """get a UI plan. if `fdir` is given, plans are saved to and loaded from
+    `fdir / f"{schema_hash}.json"`, so a plan is only compiled once per schema.
+
+    Args:
+        schema (ty.Union[ty.Type[BaseModel], dict]): pydantic model or json schema
+        fdir (pathlib.Path, optional): plan cache directory. Defaults to None.
+        by_alias (bool, optional): Defaults to False.
+
+    Returns:
+        dict: json serialisable plan
+    """
+    if fdir is None:
+        return compile_plan(schema, by_alias=by_alias)
+    _, resolved = _init_model_schema(schema, by_alias=by_alias)
+    schema_hash = get_schema_hash(resolved)
+    path = pathlib.Path(fdir) / f"{schema_hash}.json"
+    plan = load_plan(path, schema_hash=schema_hash)
+    if plan is None:
+        plan = compile_plan(schema, by_alias=by_alias)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        save_plan(plan, path)
+    return plan
+
+
+def autoobject_from_plan(
+    plan: dict,
+    model: ty.Optional[ty.Type[BaseModel]] = None,
+    value: ty.Any = None,
+    cls: ty.Type[AutoObject] = AutoObject,
+    **kwargs,
+) -> AutoObject:
+    """init an AutoObject (or subclass) from a plan without mapping the schema.
+    if a `model` is given and it doesn't match the plan, the model is mapped instead"""
+    if plan["callers"] is None:
+        raise ValueError("plan is not for an object")
+    if model is not None:
+        _, resolved = aumap._init_model_schema(model)
+        if not check_plan(plan, resolved):
+            return cls.from_resolved_schema(
+                resolved, model=model, value=value, **kwargs
+            )
+    schema = copy_schema(plan["schema"]) | {"plan": plan}
+    return cls.from_resolved_schema(schema, model=model, value=value, **kwargs)
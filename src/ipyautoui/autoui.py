@@ -49,9 +49,11 @@ from ipyautoui.autoform import (
     ShowNull,
 )
 from ipyautoui.custom.editgrid import EditGrid
+from ipyautoui._utils import copy_schema, hold_sync_all
 from ipyautoui.automapschema import (
-    get_widgets_map,
-    get_containers_map,
+    WIDGETS_MAP_REGISTRY,
+    WidgetCallerLite,
+    caller_from_plan,
     map_widget,
     widgetcaller,
     _init_model_schema,
@@ -161,11 +163,12 @@ class AutoUiFileMethods(tr.HasTraits):
             raise ValueError("p.is_file() == False")
 
     def load_value(self, value, unsaved_changes=False):
-        self.value = value
-        if unsaved_changes:
-            self.savebuttonbar.unsaved_changes = False
-        else:
-            self.savebuttonbar.unsaved_changes = True
+        with hold_sync_all(self):  # 1no message per changed widget
+            self.value = value
+            if unsaved_changes:
+                self.savebuttonbar.unsaved_changes = False
+            else:
+                self.savebuttonbar.unsaved_changes = True
 
     def load_file(self, path=None):
         p = self._get_path(path=path)
@@ -217,60 +220,43 @@ class AutoRenderMethods:
         return {ext: AutoRenderer}
 
 
-def get_autoui(schema: ty.Union[ty.Type[BaseModel], dict], **kwargs):
-    model, schema = _init_model_schema(schema)
-    schema = {**schema, **kwargs}
+def get_root_caller(schema: dict) -> tuple[WidgetCallerLite, bool]:
+    """map the root of a (resolved) schema. returns the caller and whether the root is
+    a container (i.e. AutoObject, AutoArray or EditGrid)"""
     try:
         # assumes the root object is a container so reduces the search space
         caller = map_widget(
-            schema, widgets_map=get_containers_map(), fail_on_error=True
+            dict(schema),
+            widgets_map=WIDGETS_MAP_REGISTRY.get_containers(),
+            fail_on_error=True,
         )
-        is_container = True
-        if issubclass(caller.autoui, EditGrid):
-            li = [caller.autoui, TitleDescription, ShowRaw, AutoUiFileMethods]
-
-            class AutoUi(*li):
-                def _set_children(self):
-                    self.children = [
-                        w.HBox([self.bn_showraw, self.html_title]),
-                        self.html_description,
-                        self.vbx_error,
-                        self.vbx_widget,
-                        self.vbx_showraw,
-                    ]
-
-        else:
+        return caller, True
+    except ValueError:
+        # increases the search spaces to include all widgets
+        return map_widget(dict(schema), widgets_map=WIDGETS_MAP_REGISTRY.get()), False
 
-            class AutoUi(
-                caller.autoui,
-                ShowRaw,
-                ShowNull,
-                TitleDescription,
-                WrapSaveButtonBar,
-                AutoUiFileMethods,
-            ):
-                def _set_children(self):
-                    self.children = [
-                        self.savebuttonbar,
-                        w.HBox([self.bn_showraw, self.bn_shownull, self.html_title]),
-                        self.html_description,
-                        self.vbx_error,
-                        self.vbx_widget,
-                        self.vbx_showraw,
-                    ]
-                    self.show_hide_bn_nullable()
-
-        if model is not None:
-            return wrapped_partial(
-                AutoUi.from_pydantic_model, model
-            )  # TODO: this is inefficient as the top-level mapping is called twice.
-        else:
-            return wrapped_partial(AutoUi.from_jsonschema, schema)
 
-    except:
-        # increases the search spaces to include all widgets
-        caller = map_widget(schema, widgets_map=get_widgets_map())
-        is_container = False
+def get_autoui(
+    schema: ty.Union[ty.Type[BaseModel], dict],
+    plan: ty.Optional[dict] = None,
+    **kwargs,
+):
+    # NOTE: schema generation, ref resolution and root mapping are done once here and
+    #       the resolved schema handed to the returned constructor
+    model, schema = _init_model_schema(schema)
+    if plan is not None:
+        from ipyautoui.autoplan import check_plan  # avoids circular import
+
+        if not check_plan(plan, schema):
+            plan = None
+    if plan is None:
+        caller, is_container = get_root_caller({**schema, **kwargs})
+    else:  # precompiled, see `ipyautoui.autoplan`
+        schema = plan["schema"]
+        caller, is_container = caller_from_plan(plan["root"]), plan["is_container"]
+        if plan["callers"] is not None:
+            schema = schema | {"plan": plan}
+    if not is_container:
         return wrapped_partial(
             AutoBox.wrapped_widget,
             caller.autoui,
@@ -278,6 +264,55 @@ def get_autoui(schema: ty.Union[ty.Type[BaseModel], dict], **kwargs):
             kwargs_fromcaller=caller.kwargs,
         )
 
+    if issubclass(caller.autoui, EditGrid):
+        li = [caller.autoui, TitleDescription, ShowRaw, AutoUiFileMethods]
+
+        class AutoUi(*li):
+            def _set_children(self):
+                self.children = [
+                    w.HBox([self.bn_showraw, self.html_title]),
+                    self.html_description,
+                    self.vbx_error,
+                    self.vbx_widget,
+                    self.vbx_showraw,
+                ]
+
+    else:
+
+        class AutoUi(
+            caller.autoui,
+            ShowRaw,
+            ShowNull,
+            TitleDescription,
+            WrapSaveButtonBar,
+            AutoUiFileMethods,
+        ):
+            def _set_children(self):
+                self.children = [
+                    self.savebuttonbar,
+                    w.HBox([self.bn_showraw, self.bn_shownull, self.html_title]),
+                    self.html_description,
+                    self.vbx_error,
+                    self.vbx_widget,
+                    self.vbx_showraw,
+                ]
+                self.show_hide_bn_nullable()
+
+    if issubclass(caller.autoui, EditGrid):
+        # NOTE: EditGrid isn't a WatchValidate (no `from_resolved_schema`). it resolves
+        #       and maps the schema itself, so plans aren't supported
+        if plan is not None:
+            logger.warning("plans aren't supported for EditGrid. the plan is ignored")
+        return wrapped_partial(AutoUi, model if model is not None else schema)
+
+    def from_resolved_schema(value=None, **kwargs):
+        return AutoUi.from_resolved_schema(
+            copy_schema(schema), model=model, value=value, **kwargs
+        )
+
+    functools.update_wrapper(from_resolved_schema, AutoUi.from_resolved_schema)
+    return from_resolved_schema
+
 
 def get_autodisplay_map(
     schema: ty.Union[ty.Type[BaseModel], dict], ext=".json", **kwargs
@@ -296,8 +331,14 @@ def get_autodisplay_map(
     return {ext: renderer}
 
 
-def autoui(schema: ty.Union[ty.Type[BaseModel], dict], value=None, path=None, **kwargs):
-    ui = get_autoui(schema, **kwargs)  # TODO: resolve how path is handled
+def autoui(
+    schema: ty.Union[ty.Type[BaseModel], dict],
+    value=None,
+    path=None,
+    plan: ty.Optional[dict] = None,
+    **kwargs,
+):
+    ui = get_autoui(schema, plan=plan, **kwargs)  # TODO: resolve how path is handled
     if value is None:
         return ui(**kwargs)
     else:
@@ -2,7 +2,7 @@
 
 import pathlib
 from ipydatagrid import TextRenderer
-from ipyautoui._utils import frozenmap
+from ipyautoui._utils import frozenmap, SHARED_WIDGETS
 
 # ^ frozenmap
 # https://www.python.org/dev/peps/pep-0603/
@@ -182,6 +182,7 @@ KWARGS_DATAGRID_DEFAULT = frozenmap(
         horizontal_alignment="center",
     )
 )
+SHARED_WIDGETS.add(KWARGS_DATAGRID_DEFAULT["header_renderer"])
 
 TOGGLEBUTTON_ONCLICK_BORDER_LAYOUT = "solid yellow 2px"
 OPEN_BN_COLOR = "white"
@@ -33,7 +33,7 @@ from ipydatagrid.datagrid import SelectionHelper
 
 from ipyautoui.custom.datagrid import DataGrid
 import ipyautoui.automapschema as asch
-from ipyautoui._utils import obj_from_importstr, frozenmap
+from ipyautoui._utils import obj_from_importstr, frozenmap, CloseAll
 from ipyautoui._utils import json_as_type
 
 MAP_TRANSPOSED_SELECTION_MODE = frozenmap({True: "column", False: "row"})
@@ -81,6 +81,35 @@ def get_default_row_data_from_schema_properties(
     return {k: v for k, v in di.items()}
 
 
+def fill_na_with_default(col: pd.Series, default_value) -> ty.Optional[pd.Series]:
+    """fills null values (and lists of null values) of a column with the default.
+    returns None if there is nothing to fill. only object columns are checked for
+    lists.
+
+    Args:
+        col (pd.Series): column
+        default_value: value to fill with
+
+    Returns:
+        ty.Optional[pd.Series]: filled column
+    """
+    isna = col.isna()
+    if col.dtype == object:
+        is_list = col.map(type) == list
+        if is_list.any():  # empty lists or lists of nulls
+            lists = col[is_list].reset_index(drop=True).explode()
+            isna[is_list] = lists.isna().groupby(level=0).all().to_numpy()
+    if not isna.any():
+        return None
+    if pd.api.types.is_scalar(default_value):
+        filled = col.mask(isna, default_value)
+    else:  # e.g. list or dict defaults can't be broadcast by `mask`
+        filled = col.astype(object)
+        n = int(isna.sum())
+        filled[isna] = pd.Series([default_value] * n, index=col.index[isna])
+    return filled.infer_objects() if filled.dtype == object else filled
+
+
 def get_column_widths_from_schema(schema, column_properties, map_name_index, **kwargs):
     """Set the column widths of the data grid based on column_width given in the schema."""
 
@@ -413,55 +442,28 @@ class GridSchema:
                     " facing index names"
                 )
 
-        def filter_input_data(data, order, bykeys):
-            if bykeys and len(col_names) > len(order):
-                drop = [l for l in col_names if l not in order]
-            else:
-                drop = [l for l in col_names if l not in self.get_order_titles(order)]
-            return data.drop(drop, axis=1)
-
-        def fill_with_default(col):
-            default_value = self._get_default_row().get(col.name)
-            if default_value is None:
-                return col
-            else:
-                return col.apply(
-                    lambda x: (
-                        default_value
-                        if (pd.isna(x).all() if isinstance(x, list) else pd.isna(x))
-                        else x
-                    )
-                )
-
         if order is None:
             order = self.default_order
 
         col_names = list(data.columns)
         bykeys = is_bykeys(col_names)
-
-        # filter data as per order
-        if len(col_names) > len(order):
-            data = filter_input_data(data, order, bykeys)
-
-        if len(col_names) < len(order):
-            # add missing columns
-            if bykeys:
-                data = data.reindex(columns=order)
-            else:
-                data = data.reindex(columns=[self.map_name_index[x] for x in order])
-
-        data = data.apply(fill_with_default)
-
-        # map column names to outward facing names
         if bykeys:
-            data = data.rename(
-                columns={
-                    k: v for k, v in self.map_name_index.items() if k in data.columns
-                }
-            )
+            columns = list(order)
+        else:
+            columns = [self.map_name_index[x] for x in order]
+
+        # filter, add missing and order columns (1no copy)
+        data = data.reindex(columns=columns)
+        default_row = self._get_default_row()
+        for col in columns:
+            default_value = default_row.get(col)
+            if default_value is not None:
+                filled = fill_na_with_default(data[col], default_value)
+                if filled is not None:
+                    data[col] = filled
 
-        # ensure columns are in correct order
-        data = data.reindex(self.get_index(order), axis=1)
+        # map column names to outward facing names
+        data.columns = self.get_index(order)
         data.index = pd.RangeIndex(len(data))
 
         # transpose if necessary
@@ -504,7 +506,7 @@ if __name__ == "__main__":
 # from ipyautoui.automapschema import from_schema_method
 
 
-class AutoGrid(DataGrid):
+class AutoGrid(CloseAll, DataGrid):
     """a thin wrapper around DataGrid that makes makes it possible to initiate the
     grid from a json-schema / pydantic model.
 
@@ -534,14 +536,44 @@ class AutoGrid(DataGrid):
         order: ty.Optional[tuple] = None,
         **kwargs,
     ):
-        self.__init__(
-            schema=schema,
-            data=data,
-            by_alias=by_alias,
-            by_title=by_title,
-            order=order,
-            **kwargs,
-        )
+        """update the grid from a new schema without re-initialising the grid. if
+        `data` is None, columns whose property schema is unchanged keep their data
+        and new (or changed) columns are filled with the default."""
+        old_properties = self.properties if self.schema is not None else {}
+        records = self.records() if data is None and old_properties else []
+        model, schema = asch._init_model_schema(schema, by_alias=by_alias)
+        properties = schema["items"]["properties"]
+        unchanged = [
+            k for k, v in properties.items() if old_properties.get(k, None) == v
+        ]
+        if data is None and records and unchanged:
+            data = pd.DataFrame(records, columns=unchanged)
+
+        self.kwargs = kwargs
+        self.by_title = by_title
+        if schema == self.schema:
+            self._set_gridschema(None)  # kwargs may have changed
+        self.model, self.schema = model, schema
+        self.gridschema.get_traits = self.datagrid_trait_names
+        if order is None and self.order is not None:  # keep the order if possible
+            order = tuple(o for o in self.order if o in properties)
+            if not order:
+                order = tuple(self.gridschema.default_order)
+        if data is None:
+            self.data = self.gridschema.get_default_dataframe(
+                order=order, transposed=self.transposed
+            )
+        else:
+            self.data = self.gridschema.coerce_data(
+                data, order=order, transposed=self.transposed
+            )
+        {setattr(self, k, v) for k, v in self.gridschema.datagrid_traits.items()}
+        if "global_decimal_places" in self.gridschema.datagrid_traits.keys():
+            self.global_decimal_places = self.gridschema.datagrid_traits[
+                "global_decimal_places"
+            ]
+        if order is not None and order != self.order:
+            self.order = order
 
     @tr.validate("schema")
     def _valid_schema(self, proposal):
@@ -603,6 +635,34 @@ class AutoGrid(DataGrid):
             return True
 
     def records(self, keys_as_title=False):
+        """the grid data as a list of dicts (1no per row). by property key, records are
+        cached; cells edited in place (`on_cell_change`) update only the records of
+        their rows, any change to `_data` (e.g. setting `data`) rebuilds them in full.
+        copies of the cached records are returned.
+        """
+        if keys_as_title or self.transposed or self._dirty_rows is None:
+            return self._records(keys_as_title=keys_as_title)
+        if self._records_cache is None:
+            self._dirty_rows.clear()
+            self._records_cache = self._records()
+        elif self._dirty_rows:
+            self._update_records_cache(sorted(self._dirty_rows))
+            self._dirty_rows.clear()
+        return [dict(r) for r in self._records_cache]
+
+    def _update_records_cache(self, rows: list):
+        df = self._data["data"]
+        key = self._data["schema"]["primaryKey"]
+        columns = [c for c in df.columns if c not in key]
+        data = df.loc[rows, columns]
+        data.columns = [
+            self.gridschema.map_index_name.get(c) for c in self.column_names
+        ]
+        positions = df.index.get_indexer(rows)
+        for n, record in zip(positions, data.to_dict(orient="records")):
+            self._records_cache[n] = record
+
+    def _records(self, keys_as_title=False):
         if self.transposed:
             data = self.data.T
         else:
@@ -705,6 +765,72 @@ class AutoGrid(DataGrid):
                 data, order=self.order, transposed=self.transposed
             )
 
+    @property
+    def n_items(self) -> int:
+        """number of rows (transposed==False) or cols (transposed==True)"""
+        if self.transposed:
+            return len(self.column_names)
+        return len(self._data["data"])
+
+    def _set_items_data(self, df: pd.DataFrame) -> bool:
+        """set the rows of the backing dataframe (`_data["data"]`), renumbering the
+        primary key. the data schema is kept, so is not rebuilt. returns False if
+        the column dtypes have changed (and the schema must be rebuilt)."""
+        if not df.dtypes.equals(self._data["data"].dtypes):
+            return False
+        df = df.reset_index(drop=True)
+        for k in self._data["schema"]["primaryKey"]:  # index + ipydguuid
+            df[k] = pd.RangeIndex(len(df))
+        self._data = self._data | {"data": df}
+        return True
+
+    def insert_rows(self, index: int, rows: list[dict]):
+        """insert rows (transposed==False) or cols (transposed==True) before `index`.
+        only the new rows are coerced and the data is updated in place.
+
+        Args:
+            index (int): position of the first inserted item
+            rows (list[dict]): item values, keyed by property key
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        if not self.transposed:
+            df = self._data["data"]
+            new = self.gridschema.coerce_data(pd.DataFrame(rows), order=self.order)
+            new = new.reindex(columns=df.columns)
+            for k in self._data["schema"]["primaryKey"]:
+                new[k] = 0  # renumbered below
+            if self._set_items_data(pd.concat([df.iloc[:index], new, df.iloc[index:]])):
+                return
+        records = self.records()
+        records[index:index] = rows
+        self.data = self._init_data(pd.DataFrame(records))
+
+    def append_rows(self, rows: list[dict]):
+        """append rows (transposed==False) or cols (transposed==True)
+
+        Args:
+            rows (list[dict]): item values, keyed by property key
+        """
+        self.insert_rows(self.n_items, rows)
+
+    def delete_rows(self, indexes: list[int]):
+        """delete rows (transposed==False) or cols (transposed==True)
+
+        Args:
+            indexes (list[int]): positions of the items to delete
+        """
+        indexes = set(indexes)
+        if not indexes:
+            return
+        if not self.transposed:
+            df = self._data["data"]
+            if self._set_items_data(df.drop(index=df.index[sorted(indexes)])):
+                return
+        records = [r for n, r in enumerate(self.records()) if n not in indexes]
+        self.data = self._init_data(pd.DataFrame(records))
+
     def set_cell_value_if_different(self, column_name, primary_key_value, new_value):
         old = self.get_cell_value(column_name, primary_key_value)
         if len(old) != 1:
@@ -766,11 +892,7 @@ class AutoGrid(DataGrid):
             pass
         else:
             raise Exception("Columns of value given do not match with value keys.")
-        changes = [
-            self.set_cell_value_if_different(column, index, v)
-            for column, v in value.items()
-        ]
-        return [c for c in changes if c is not None]
+        return self.set_cells((column, index, v) for column, v in value.items())
 
     def apply_map_name_title(self, row_data):
         return {
@@ -793,14 +915,10 @@ class AutoGrid(DataGrid):
             value = {self.map_name_index.get(name): v for name, v in value.items()}
         if set(value.keys()) != set(self.data.index.to_list()):
             raise Exception("Index of datagrid does not match with value keys.")
-        changes = []
-        for primary_key_value, v in value.items():
-            if isinstance(primary_key_value, tuple):
-                primary_key_value = list(primary_key_value)
-            changes.append(
-                self.set_cell_value_if_different(column_name, primary_key_value, v)
-            )
-        return [c for c in changes if c is not None]
+        return self.set_cells(
+            (column_name, list(k) if isinstance(k, tuple) else k, v)
+            for k, v in value.items()
+        )
 
     def filter_by_column_name(self, column_name: str, li_filter: list):
         """Filter rows to display based on a column name and a list of objects belonging to that column.
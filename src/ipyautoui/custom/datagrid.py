@@ -1,6 +1,8 @@
 import logging
+import typing as ty
 from copy import deepcopy
 
+import numpy as np
 import pandas as pd
 import traitlets as tr
 
@@ -16,6 +18,8 @@ class DataGrid(DataGrid):
     count_changes = tr.Int()
     map_name_index = tr.Dict()
     transposed = tr.Bool(default_value=False)
+    _dirty_rows: ty.Optional[set] = None  # rows of `_data["data"]` edited in place
+    _records_cache: ty.Optional[list] = None
 
     def __init__(self, dataframe, index_name=None, **kwargs):
         if "transposed" in kwargs:
@@ -67,6 +71,7 @@ class DataGrid(DataGrid):
         return self._data["schema"]["fields"]
 
     def _observe_changes(self):
+        self._dirty_rows = set()
         self.on_cell_change(self._count_cell_changes)
         self.observe(self._count_data_change, "_data")
 
@@ -76,7 +81,84 @@ class DataGrid(DataGrid):
                 row=cell["row"], column=cell["column_index"]
             )
         )
+        self._dirty_rows.add(cell["row"])
         self.count_changes += 1
 
     def _count_data_change(self, cell):
+        self._records_cache = None  # structural change, records rebuilt in full
+        self._dirty_rows.clear()
         self.count_changes += 1
+
+    def _get_primary_key_index(self) -> pd.Index:
+        """the primary key (i.e. dataframe index) of each row of `_data["data"]`"""
+        df = self._data["data"]
+        key = self._data["schema"]["primaryKey"][:-1]  # omitting ipydguuid
+        if len(key) == 1:
+            return pd.Index(df[key[0]])
+        return pd.MultiIndex.from_frame(df[key])
+
+    def set_cells(self, cells: ty.Iterable[tuple]) -> list[dict]:
+        """set many cell values. the cells are found and compared to the data in one
+        pass and the changed rows are sent to the frontend as 1no message per row
+        (rather than 1no message per cell).
+
+        Args:
+            cells (ty.Iterable[tuple]): (column_name, primary_key_value, new_value)
+
+        Returns:
+            list[dict]: changes, as `AutoGrid.set_cell_value_if_different`
+        """
+        cells = list(cells)
+        if not cells:
+            return []
+        df = self._data["data"]
+        index = self._get_primary_key_index()
+        if not index.is_unique:
+            raise ValueError("primary key values of the data must be unique")
+        single = index.nlevels == 1
+        keys = [
+            (k[0] if single else tuple(k)) if isinstance(k, (list, tuple)) else k
+            for _, k, _ in cells
+        ]
+        columns = [tuple(c) if isinstance(c, list) else c for c, _, _ in cells]
+        rows = index.get_indexer(keys)
+        if (rows == -1).any():
+            missing = [k for k, r in zip(keys, rows) if r == -1]
+            raise ValueError(f"primary key values not found: {missing}")
+        cols = df.columns.get_indexer(columns)
+        if (cols == -1).any():
+            raise KeyError([c for c, n in zip(columns, cols) if n == -1])
+
+        old, new = np.empty(len(cells), dtype=object), np.empty(
+            len(cells), dtype=object
+        )
+        for n, (r, c, (_, _, v)) in enumerate(zip(rows, cols, cells)):
+            old[n], new[n] = df.iat[r, c], v
+        changed = np.flatnonzero(old != new)
+
+        changes, changed_rows = [], {}
+        for n in changed:
+            column, primary_key_value, new_value = cells[n]
+            df.loc[rows[n], columns[n]] = new_value
+            changed_rows[rows[n]] = None
+            changes.append(
+                {
+                    "column_name": column,
+                    "primary_key_value": primary_key_value,
+                    "old_value": old[n],
+                    "new_value": new_value,
+                }
+            )
+            self._cell_change_handlers(
+                {
+                    "row": int(rows[n]),
+                    "column": columns[n],
+                    "column_index": self._column_name_to_index(columns[n]),
+                    "value": new_value,
+                }
+            )
+        if self.comm is not None:
+            headers = self._get_col_headers(self._data)
+            for row in changed_rows:
+                self._notify_row_change(int(row), df.loc[row, headers].tolist())
+        return changes
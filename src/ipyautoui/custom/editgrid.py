@@ -31,10 +31,12 @@ import ipywidgets as w
 from IPython.display import clear_output, display
 from pydantic import BaseModel, Field
 import json
+from collections import OrderedDict
 
 from ipyautoui.autoobject import AutoObjectForm
 from ipyautoui.custom.buttonbars import CrudButtonBar
-from ipyautoui._utils import frozenmap
+from ipyautoui._utils import frozenmap, close_all, CloseAll
+from ipyautoui._utils_debounce import DebounceChanges
 from ipyautoui.constants import BUTTON_WIDTH_MIN
 from ipyautoui.custom.autogrid import AutoGrid
 from ipyautoui.custom.title_description import TitleDescription
@@ -66,6 +68,82 @@ class DataHandler(BaseModel):
     fn_copy: ty.Callable[[list[int]], None]
 
 
+class PagedDataHandler(DataHandler):
+    """paged CRUD operations for EditGrid. rather than getting all data, EditGrid
+    shows a sliding window of `window_pages` pages and fetches pages as required.
+    following a post, patch, delete or copy only the window is fetched again.
+
+    Args:
+        fn_get_page (Callable): Function to get a page of data. is passed
+            (offset, limit, sort, filter) and returns a list of dicts. sort is a list
+            of (key, descending) tuples and filter a list of dicts with "key",
+            "operator" and "value" (as ipydatagrid filter transforms).
+        fn_count (Callable): Function to count the rows. is passed filter.
+        page_size (int): rows per page.
+        window_pages (int): pages shown in the grid.
+        cache_pages (int): max pages kept in memory (least recently used are dropped).
+        fn_post, fn_patch, fn_delete, fn_copy: as DataHandler.
+    """
+
+    fn_get_all_data: ty.Optional[ty.Callable] = None
+    fn_get_page: ty.Callable[[int, int, list, list], list[dict]]
+    fn_count: ty.Callable[[list], int]
+    page_size: int = 100
+    window_pages: int = 3
+    cache_pages: int = 10
+
+
+class PageCache:
+    """least recently used cache of the pages of a PagedDataHandler query"""
+
+    def __init__(self, datahandler: PagedDataHandler):
+        self.datahandler = datahandler
+        self.sort, self.filter = [], []
+        self.pages = OrderedDict()
+        self._count = None
+
+    def clear(self):
+        self.pages.clear()
+        self._count = None
+
+    def set_query(self, sort: list, filter: list) -> bool:
+        """returns True (and clears the cache) if the query changed"""
+        if (sort, filter) == (self.sort, self.filter):
+            return False
+        self.sort, self.filter = sort, filter
+        self.clear()
+        return True
+
+    @property
+    def count(self) -> int:
+        if self._count is None:
+            self._count = self.datahandler.fn_count(self.filter)
+        return self._count
+
+    @property
+    def n_pages(self) -> int:
+        return -(-self.count // self.datahandler.page_size)
+
+    def get_page(self, page: int) -> list[dict]:
+        if page in self.pages:
+            self.pages.move_to_end(page)
+            return self.pages[page]
+        size = self.datahandler.page_size
+        rows = list(
+            self.datahandler.fn_get_page(page * size, size, self.sort, self.filter)
+        )
+        self.pages[page] = rows
+        max_pages = max(self.datahandler.cache_pages, self.datahandler.window_pages)
+        while len(self.pages) > max_pages:
+            self.pages.popitem(last=False)
+        return rows
+
+    def get_window(self, page: int) -> list[dict]:
+        """the rows of `window_pages` pages starting at `page`"""
+        last = min(page + self.datahandler.window_pages, self.n_pages)
+        return [row for n in range(page, last) for row in self.get_page(n)]
+
+
 if __name__ == "__main__":
 
     class TestModel(BaseModel):
@@ -237,7 +315,7 @@ if __name__ == "__main__":
 
 
 # from ipyautoui.watch_validate import WatchValidate
-class EditGrid(w.VBox, TitleDescription):
+class EditGrid(CloseAll, w.VBox, TitleDescription, DebounceChanges):
     _value = tr.Tuple()  # using a tuple to guarantee no accidental mutation
     warn_on_delete = tr.Bool()
     show_copy_dialogue = tr.Bool()
@@ -271,12 +349,16 @@ class EditGrid(w.VBox, TitleDescription):
 
     @property
     def value(self):
+        self.flush_changes()
         return self._value
 
     @value.setter
     def value(self, value):
+        self._cancel_changes()
         self.grid.data = self.grid._init_data(pd.DataFrame(value))
+        self._reset_transforms()
 
+    def _reset_transforms(self):
         # HOTFIX: Setting data creates bugs out transforms currently so reset transform applied
         _transforms = self.grid._transforms
         self.grid.transform([])  # Set to no transforms
@@ -316,6 +398,8 @@ class EditGrid(w.VBox, TitleDescription):
         title: str = None,
         description: str = None,
         show_title: bool = True,
+        change_policy: ty.Optional[str] = None,
+        change_wait: float = 0.1,
         **kwargs,
     ):  # TODO: use **kwargs to pass attributes to EditGrid as in AutoObject and AutoArray
         self.vbx_error = w.VBox()
@@ -327,6 +411,9 @@ class EditGrid(w.VBox, TitleDescription):
         self.by_title = by_title
         self.by_alias = by_alias
         self.datahandler = datahandler
+        self.page_cache = None
+        self.window_page = 0
+        self._loading_window = False
 
         self.close_crud_dialogue_on_action = close_crud_dialogue_on_action
         self._init_autogrid(schema, value, **kwargs)
@@ -337,6 +424,8 @@ class EditGrid(w.VBox, TitleDescription):
         self._init_row_controls()
         self._init_controls()
         super().__init__()
+        self.change_wait = change_wait
+        self.change_policy = change_policy
         self.warn_on_delete = warn_on_delete
         # self.show_copy_dialogue = show_copy_dialogue
         self.show_copy_dialogue = False
@@ -362,6 +451,7 @@ class EditGrid(w.VBox, TitleDescription):
         self.grid.update_from_schema(
             schema, data=getvalue(value), by_alias=self.by_alias, **kwargs
         )
+        self._close_ui_callables()
         self._init_ui_callables(
             ui_add=ui_add, ui_edit=ui_edit, ui_delete=ui_delete, ui_copy=ui_copy
         )
@@ -410,6 +500,10 @@ class EditGrid(w.VBox, TitleDescription):
         self.ui_copy.layout.display = "None"
         self.ui_delete.fn_delete = self._delete_selected
 
+    def _close_ui_callables(self):
+        """close the forms before they are rebuilt"""
+        close_all(self.ui_add, self.ui_edit, self.ui_delete, self.ui_copy)
+
     def _init_row_controls(self):
         self.ui_edit.show_savebuttonbar = True
         self.ui_edit.savebuttonbar.fns_onsave = [self._patch, self._save_edit_to_grid]
@@ -432,10 +526,24 @@ class EditGrid(w.VBox, TitleDescription):
         self.stk_crud = w.Stack(
             children=[self.ui_add, self.ui_edit, self.ui_copy, self.ui_delete]
         )
+        self.bn_previous_page = w.Button(
+            icon="chevron-left", layout=w.Layout(width=BUTTON_WIDTH_MIN)
+        )
+        self.bn_next_page = w.Button(
+            icon="chevron-right", layout=w.Layout(width=BUTTON_WIDTH_MIN)
+        )
+        self.html_rows = w.HTML()
+        self.hbx_pager = w.HBox(
+            [self.bn_previous_page, self.html_rows, self.bn_next_page],
+            layout=w.Layout(display="None"),
+        )
+        self.bn_previous_page.on_click(lambda _: self.previous_page())
+        self.bn_next_page.on_click(lambda _: self.next_page())
 
     def _init_controls(self):
         self.grid.observe(self._observe_selections, "selections")
         self.grid.observe(self._grid_changed, "count_changes")
+        self.grid.observe(self._observe_transforms, "_transforms")
         self.buttonbar_grid.observe(self._setview, "active")
         self.grid.observe(self._observe_order, "order")
         self._observe_order(None)  # prompts order if it is set in by grid setter above
@@ -447,9 +555,21 @@ class EditGrid(w.VBox, TitleDescription):
         self.datahandler = datahandler
         if self.datahandler is not None:
             self.buttonbar_grid.fn_reload = self._reload_datahandler
+        if isinstance(self.datahandler, PagedDataHandler):
+            self.page_cache = PageCache(self.datahandler)
+            self.hbx_pager.layout.display = ""
+            self.set_window(0)
+        else:
+            self.page_cache = None
+            self.hbx_pager.layout.display = "None"
 
     def _set_children(self):
-        self.vbx_widget.children = [self.buttonbar_grid, self.stk_crud, self.grid]
+        self.vbx_widget.children = [
+            self.buttonbar_grid,
+            self.stk_crud,
+            self.grid,
+            self.hbx_pager,
+        ]
         self.stk_crud.children = [
             self.ui_add,
             self.ui_edit,
@@ -471,11 +591,10 @@ class EditGrid(w.VBox, TitleDescription):
             if self.buttonbar_grid.delete.value:
                 self._set_ui_delete_to_selected_row()
 
-    # @debounce(0.1)  # TODO: make debounce work if too slow...
     def _grid_changed(self, onchange):
-        # debouncer used to allow editing whole rows in 1 go
+        # set `change_policy` to debounce, allowing editing whole rows in 1 go
         # without updating the `value` on every cell edit.
-        self._update_value_from_grid()
+        self._debounce_change(self._update_value_from_grid)
 
     def _setview(self, onchange):
         if self.buttonbar_grid.active is None:
@@ -543,12 +662,8 @@ class EditGrid(w.VBox, TitleDescription):
     # --------------------------------------------------------------------------
     def _save_add_to_grid(self):
         if self.datahandler is None:
-            if len(self.grid._data["data"]) == 0:  # If no data in grid
-                self.value = tuple([self.ui_add.value])
-            else:
-                # Append new row onto data frame and set to grid's data.
-                # Call setter. syntax below required to avoid editing in place.
-                self.value = tuple(list(self.value) + [self.ui_add.value])
+            self.grid.append_rows([self.ui_add.value])
+            self._reset_transforms()
         else:
             self._reload_all_data()
         if self.close_crud_dialogue_on_action:
@@ -588,7 +703,8 @@ class EditGrid(w.VBox, TitleDescription):
         pass
 
     def _copy_selected_to_end(self):
-        self.value = tuple(list(self.value) + self._get_selected_data())
+        self.grid.append_rows(self._get_selected_data())
+        self._reset_transforms()
         if self.close_crud_dialogue_on_action:
             self.buttonbar_grid.copy.value = False
 
@@ -621,6 +737,57 @@ class EditGrid(w.VBox, TitleDescription):
 
     # --------------------------------------------------------------------------
 
+    # paging (PagedDataHandler only)
+    # --------------------------------------------------------------------------
+    def set_window(self, page: int):
+        """show `window_pages` pages starting at `page`. pages already in the
+        `page_cache` aren't fetched again."""
+        last = max(self.page_cache.n_pages - self.datahandler.window_pages, 0)
+        self.window_page = min(max(page, 0), last)
+        self._loading_window = True  # setting value resets the grid transforms
+        try:
+            self.value = self.page_cache.get_window(self.window_page)
+        finally:
+            self._loading_window = False
+        self._update_pager()
+
+    def next_page(self):
+        self.set_window(self.window_page + 1)
+
+    def previous_page(self):
+        self.set_window(self.window_page - 1)
+
+    def _update_pager(self):
+        start = self.window_page * self.datahandler.page_size
+        n, count = len(self._value), self.page_cache.count
+        self.html_rows.value = (
+            f"<i>rows {min(start + 1, count)}-{start + n} of {count}</i>"
+        )
+        self.bn_previous_page.disabled = self.window_page == 0
+        self.bn_next_page.disabled = start + n >= count
+
+    def _get_query(self) -> tuple[list, list]:
+        """sort and filter of the grid transforms, by property key"""
+        map_index_name = self.grid.gridschema.map_index_name
+        sort, filter = [], []
+        for t in self.grid._transforms:
+            key = map_index_name.get(t.get("column"))
+            if key is None:
+                continue
+            if t["type"] == "sort":
+                sort.append((key, t.get("desc", False)))
+            elif t["type"] == "filter":
+                filter.append(dict(key=key, operator=t["operator"], value=t["value"]))
+        return sort, filter
+
+    def _observe_transforms(self, on_change):
+        if self.page_cache is None or self._loading_window or self.transposed:
+            return
+        if self.page_cache.set_query(*self._get_query()):
+            self.set_window(0)
+
+    # --------------------------------------------------------------------------
+
     # delete
     # --------------------------------------------------------------------------
     def _reload_datahandler(self):
@@ -628,7 +795,10 @@ class EditGrid(w.VBox, TitleDescription):
         self.buttonbar_grid.message.value = "🔄 <i>Reloaded Data</i> "
 
     def _reload_all_data(self):
-        if self.datahandler is not None:
+        if self.page_cache is not None:
+            self.page_cache.clear()
+            self.set_window(self.window_page)
+        elif self.datahandler is not None:
             self.value = self.datahandler.fn_get_all_data()
 
     def _delete_selected(self):
@@ -638,12 +808,8 @@ class EditGrid(w.VBox, TitleDescription):
                 self.datahandler.fn_delete(v)
             self._reload_all_data()
         else:
-            self.value = [
-                value
-                for i, value in enumerate(self.value)
-                if i not in self.grid.selected_indexes
-            ]
-            # ^ Only set for values NOT in self.grid.selected_indexes
+            self.grid.delete_rows(self.grid.selected_indexes)
+            self._reset_transforms()
         self.buttonbar_grid.message.value = "🗑️ <i>Deleted Data</i> "
         if self.close_crud_dialogue_on_action:
             self.buttonbar_grid.delete.value = False
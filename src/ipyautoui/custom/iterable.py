@@ -39,13 +39,14 @@ from ipyautoui.constants import (
     BUTTON_WIDTH_MIN,
     BUTTON_HEIGHT_MIN,
 )
-from ipyautoui._utils import frozenmap
+from ipyautoui._utils import frozenmap, close_all, CloseAll, hold_sync_all
 import logging
 from ipyautoui.custom.title_description import TitleDescription
 import enum
 import string
 import random
-from ipyautoui.automapschema import from_schema_method, get_widget
+import bisect
+from ipyautoui.automapschema import from_schema_method, get_pooled_widget, WIDGET_POOL
 from jsonref import replace_refs
 from ipyautoui.watch_validate import WatchValidate
 
@@ -125,7 +126,8 @@ class ItemBox(w.Box):
             ItemControl.none: self._no_user_controls,
         }
         super().__init__(**kwargs)
-        self.set_children()
+        if len(self.children) == 0:  # already set if `widget` given
+            self.set_children()
 
     def set_children(self):
         self.children = [
@@ -140,7 +142,7 @@ class ItemBox(w.Box):
 # -
 
 
-class Array(w.VBox, WatchValidate):
+class Array(CloseAll, w.VBox, WatchValidate):
     # TODO: explicitly define widget type for each item. AutoArray guesses it, but it can be overridden...
 
     _value = tr.List()  # NOTE: value setter and getter in `WatchValidate`
@@ -167,6 +169,28 @@ class Array(w.VBox, WatchValidate):
     def _get_widgets(self):
         return [bx.widget for bx in self.boxes]
 
+    @property
+    def boxes(self) -> list:
+        """the row boxes, in display order. `di_boxes` indexes them by key"""
+        return self._boxes
+
+    @boxes.setter
+    def boxes(self, boxes):
+        self._boxes = list(boxes)
+        self.di_boxes = {}
+        self._widget_boxes = {}  # id(widget): box. finds the row of a changed widget
+        self._sorted_on_key = False
+        self._reindex()
+
+    def _reindex(self, start: int = 0):
+        """update the index (and key map) of the boxes from position `start`"""
+        for n in range(start, len(self._boxes)):
+            bx = self._boxes[n]
+            if bx.index != n:
+                bx.index = n
+            self.di_boxes[bx.key] = bx
+            self._widget_boxes[id(bx.widget)] = bx
+
     @property
     def widgets(self):
         return self._get_widgets()
@@ -184,22 +208,34 @@ class Array(w.VBox, WatchValidate):
             ItemBox(index=n, widget=widget) for n, widget in enumerate(widgets)
         ]
 
-    def _update_widgets_from_value(self):
-        diff = len(self.value) - len(self.boxes)
-        if diff < 0:
-            self.boxes = self.boxes[0 : len(self.value)]
-        elif diff > 0:
-            for n in range(0, diff):
-                self.add_row(update_value=False)
-        for n, v in enumerate(self.value):
-            try:
-                self.boxes[n].widget.value = v
-            except Exception as e:
-                raise ValueError(
-                    f"{e}, widget-type={str(type(self.boxes[n].widget))}, value={v}, also, ",
-                    f"\n value (len={len(self.value)} and widgets (len={len(self.widgets)}) must be same length",
-                )
-        self._update_boxes()
+    def _update_widgets_from_value(self, old: ty.Optional[list] = None):
+        self._set_rows(self.value, old=old)
+
+    def _set_rows(self, values: list, old: ty.Optional[list] = None):
+        """update the rows to `values`: excess rows are removed, existing rows with
+        changed values updated and missing rows created with their value. the
+        frontend is updated once (`bx_boxes.children` is set once)."""
+        n_boxes = 0 if old is None else min(len(old), len(self.boxes))
+        with self.bulk_update():
+            if len(values) < len(self.boxes):
+                for bx in self.boxes[len(values) :]:
+                    self._forget_box(bx)
+                    self._close_box(bx)
+                del self._boxes[len(values) :]
+            for n, v in enumerate(values[: len(self.boxes)]):
+                if n >= n_boxes or old[n] != v:  # only update changed values
+                    self._set_widget_value(self.boxes[n].widget, v)
+            self._insert_rows(values[len(self.boxes) :])
+            self._update_boxes()
+
+    def _set_widget_value(self, widget, v):
+        try:
+            widget.value = v
+        except Exception as e:
+            raise ValueError(
+                f"{e}, widget-type={str(type(widget))}, value={v}, also, ",
+                f"\n value (len={len(self.value)} and widgets (len={len(self.widgets)}) must be same length",
+            )
 
     @tr.validate("type")
     def _type(self, proposal):
@@ -296,7 +332,7 @@ class Array(w.VBox, WatchValidate):
         self.length = len(self.boxes)
 
     def _get_attribute(self, key, get):
-        return [getattr(bx, get) for bx in self.boxes if bx.key == key][0]
+        return getattr(self.di_boxes[key], get)
 
     def _init_row_controls(self, key=None):
         self._get_attribute(key, "bn_add").on_click(
@@ -316,19 +352,66 @@ class Array(w.VBox, WatchValidate):
                     'array item must have either "value" or "_value" trait to be observed'
                 )
 
+    def _forget_box(self, bx):
+        self.di_boxes.pop(bx.key, None)
+        self._widget_boxes.pop(id(bx.widget), None)
+
+    def _close_box(self, bx):
+        """stop watching the widget of a removed row and return it to the widget pool"""
+        for watch in ["_value", "value"]:
+            if bx.widget.has_trait(watch):
+                bx.widget.unobserve(self._watch_validate_change, names=watch)
+                break
+        WIDGET_POOL.release(bx.widget)
+        close_all(bx, keep=[bx.widget])
+
     def _sort_boxes(self):
         if self.sort_on_index:
             sort = sorted(self.boxes, key=lambda k: k.index)
         else:
             sort = sorted(self.boxes, key=lambda k: str(k.key))
-        for n, s in enumerate(sort):
-            s.index = n
         self.boxes = sort
+        self._sorted_on_key = not self.sort_on_index
+
+    def _insert_box(self, bx, position: int):
+        """insert a box at `position` (or in key order if not `sort_on_index`)"""
+        if self.sort_on_index:
+            self._boxes.insert(position, bx)
+            self.di_boxes[bx.key] = bx
+            self._reindex(position)
+        elif self._sorted_on_key:
+            position = bisect.bisect(self._boxes, str(bx.key), key=lambda k: str(k.key))
+            self._boxes.insert(position, bx)
+            self.di_boxes[bx.key] = bx
+            self._reindex(position)
+        else:
+            self._boxes.append(bx)
+            self._sort_boxes()
 
     def _get_value(self):
         get = lambda w: w.value if hasattr(w, "value") else None
         return [get(bx.widget) for bx in self.boxes]
 
+    def _get_changed_box(self, on_change):
+        if self._value is None or len(self._value) != len(self.boxes):
+            return None, None
+        bx = self._widget_boxes.get(id(on_change["owner"]))
+        if bx is not None and bx.widget is on_change["owner"]:
+            return bx.index, bx
+        for n, bx in enumerate(self.boxes):
+            if bx.widget is on_change["owner"]:
+                return n, bx
+        return None, None
+
+    def _get_value_on_change(self, on_change):
+        # NOTE: patches the changed row only
+        n, bx = self._get_changed_box(on_change)
+        if bx is None or not hasattr(bx.widget, "value"):
+            return self._get_value()
+        value = list(self._value)
+        value[n] = bx.widget.value
+        return value
+
     # def _update_value(self, on_change):
     #     if not self._silent:
     #         self._value = [bx.widget.value for bx in self.boxes]
@@ -351,6 +434,63 @@ class Array(w.VBox, WatchValidate):
         self, key=None, new_key=None, add_kwargs=None, widget=None, update_value=True
     ):
         """add row to array after key. if key=None then append to end"""
+        bx = self._insert_row(
+            key=key, new_key=new_key, add_kwargs=add_kwargs, widget=widget
+        )
+        if bx is None:
+            return None
+        self._update_boxes()
+        # self._update_value("")
+        if update_value:
+            self._watch_validate_update_value()
+
+    def extend(self, values: list):
+        """append rows for `values`. the widgets are created with their value, the
+        frontend is updated once and the value changes once"""
+        with self.silence_autoui_traits(), self.bulk_update():
+            self._insert_rows(list(values))
+            self._update_boxes()
+        self._watch_validate_update_value()
+
+    def set_rows(self, values: list):
+        """set the rows to `values` (as a user edit, i.e. validated and `value`
+        changes once). existing rows are reused."""
+        old = self.value
+        with self.silence_autoui_traits():
+            self._set_rows(list(values), old=old)
+        self._watch_validate_update_value()
+
+    def _insert_rows(self, values: list) -> list:
+        """create row boxes for `values` at the end without updating the children.
+        the widget values are set before they are observed."""
+        n_max = self.max_items
+        if n_max is not None and len(self.boxes) + len(values) > n_max:
+            logging.warning(f"ERROR: you can't have more that {n_max} items")
+            values = values[: max(self.max_items - len(self.boxes), 0)]
+        start = len(self.boxes)
+        boxes = []
+        for n, v in enumerate(values):
+            widget = self.fn_add()
+            with hold_sync_all(widget):
+                self._set_widget_value(widget, v)
+            boxes.append(
+                ItemBox(
+                    index=start + n,
+                    widget=widget,
+                    add_remove_controls=self.add_remove_controls,
+                )
+            )
+        self._boxes.extend(boxes)
+        if self.sort_on_index:
+            self._reindex(start)
+        else:
+            self._sort_boxes()
+        for bx in boxes:
+            self._init_row_controls(bx.key)
+        return boxes
+
+    def _insert_row(self, key=None, new_key=None, add_kwargs=None, widget=None):
+        """create a row box after key (or at the end) without updating the children"""
         if self.max_items is not None and len(self.boxes) >= self.max_items:
             logging.warning(
                 f"ERROR: you can't have more that {self.max_items} items. len(self.boxes) >= self.max_items"
@@ -358,16 +498,11 @@ class Array(w.VBox, WatchValidate):
             return None
 
         if key is None:
-            if len(self.boxes) == 0:
-                index = 0
-            else:
-                # append
-                key = self.boxes[-1].key
-                index = self._get_attribute(key, "index")
+            index = len(self.boxes) - 1  # append
         else:
             index = self._get_attribute(key, "index")
         if new_key is not None:
-            if new_key in [i.key for i in self.boxes]:
+            if new_key in self.di_boxes:
                 logger.warning(f"ERROR: {new_key} already exists in keys")
                 return None
         else:
@@ -382,18 +517,14 @@ class Array(w.VBox, WatchValidate):
             new_obj = widget
 
         bx = ItemBox(
-            index=index,
+            index=index + 1,
             key=new_key,
             widget=new_obj,
             add_remove_controls=self.add_remove_controls,
         )
-        self.boxes.insert(index + 1, bx)
-        self._sort_boxes()  # update map
+        self._insert_box(bx, index + 1)  # update map
         self._init_row_controls(bx.key)  # init controls
-        self._update_boxes()
-        # self._update_value("")
-        if update_value:
-            self._watch_validate_update_value()
+        return bx
 
     def _remove_rows(self, onclick, key=None):
         self.remove_row(key=key)
@@ -408,12 +539,14 @@ class Array(w.VBox, WatchValidate):
             self.display_bn_add_from_zero(display=True)
         if key is None:
             print("key is None")
-            key = self.iterable[-1].key
+            key = self.boxes[-1].key
         n = self._get_attribute(key, "index")
         bx = self.boxes[n]
         self.fn_remove(bx)
-        self.boxes.pop(n)
-        self._sort_boxes()
+        self._boxes.pop(n)
+        self._forget_box(bx)
+        self._close_box(bx)
+        self._reindex(n)
         self._update_boxes()
         # self._update_value("")
         self._watch_validate_update_value()
@@ -430,6 +563,13 @@ class Dictionary(Array):
         get = lambda w: w.value if hasattr(w, "value") else None
         return {bx.key: get(bx.widget) for bx in self.boxes}
 
+    def _get_value_on_change(self, on_change):
+        # NOTE: patches the changed item only
+        n, bx = self._get_changed_box(on_change)
+        if bx is None or not hasattr(bx.widget, "value") or bx.key not in self._value:
+            return self._get_value()
+        return self._value | {bx.key: bx.widget.value}
+
     def _get_widgets(self):
         return {bx.key: bx.widget for bx in self.boxes}
 
@@ -466,7 +606,7 @@ class AutoArray(Array):
 
     @tr.observe("items")
     def _items(self, on_change):
-        self.fn_add = functools.partial(get_widget, self.items)
+        self.fn_add = functools.partial(get_pooled_widget, self.items)
 
     @classmethod
     def from_schema(cls, schema, value=None):
@@ -3,7 +3,7 @@ import ipywidgets as w
 import traitlets as tr
 
 from ipyautoui.constants import BUTTON_WIDTH_MIN
-from ipyautoui._utils import is_null
+from ipyautoui._utils import is_null, CloseAll
 
 SHOW_NONE_KWARGS = dict(value="None", disabled=True, layout={"display": "None"})
 
@@ -29,7 +29,7 @@ def _get_value_trait(obj_with_traits):
             )
 
 
-class Nullable(w.HBox):
+class Nullable(CloseAll, w.HBox):
     """class to allow widgets to be nullable. The widget that is extended is accessed
     using `self.widget`"""
 
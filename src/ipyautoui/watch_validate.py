@@ -3,8 +3,10 @@ import typing as ty
 import ipywidgets as w
 from IPython.display import clear_output
 import contextlib
-from pydantic import BaseModel, RootModel, ValidationError
-from jsonref import replace_refs
+import weakref
+from pydantic import BaseModel, RootModel, TypeAdapter, ValidationError
+from ipyautoui._utils import get_resolved_schema, hold_sync_all
+from ipyautoui._utils_debounce import DebounceChanges
 import json
 import logging
 
@@ -15,6 +17,55 @@ def pydantic_validate(model: BaseModel, value):
     return model.model_validate(value).model_dump(mode="json")
 
 
+_FIELD_ADAPTERS = weakref.WeakKeyDictionary()
+
+
+def get_field_adapters(model: ty.Type[BaseModel]) -> dict:
+    """cached `TypeAdapter` for each field of a pydantic model, keyed by field name
+    and alias. the adapters validate the field type and constraints only, field and
+    model validators run when the whole model is validated.
+
+    Args:
+        model (ty.Type[BaseModel]): pydantic model
+
+    Returns:
+        dict: {field name or alias: TypeAdapter}
+    """
+    try:
+        return _FIELD_ADAPTERS[model]
+    except KeyError:
+        pass
+    adapters = {}
+    if not issubclass(model, RootModel):
+        for name, field in model.model_fields.items():
+            type_ = field.annotation
+            if field.metadata:
+                type_ = ty.Annotated[(type_, *field.metadata)]
+            adapters[name] = TypeAdapter(type_)
+            if field.alias is not None:
+                adapters[field.alias] = adapters[name]
+    _FIELD_ADAPTERS[model] = adapters
+    return adapters
+
+
+def get_changed_keys(old, new) -> ty.Optional[list]:
+    """keys of `new` that differ from `old`. None if either isn't a dict or the keys
+    differ"""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return None
+    if old.keys() != new.keys():
+        return None
+    return [k for k, v in new.items() if v is not old[k] and v != old[k]]
+
+
+def get_diff(old, new) -> ty.Optional[dict]:
+    """items of `new` that are missing from or differ to `old`. None if either isn't
+    a dict"""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return None
+    return {k: v for k, v in new.items() if k not in old or old[k] != v}
+
+
 class _WatchSilent(tr.HasTraits):  # TODO: contains context manager for silencing traits
     pass
 
@@ -30,13 +81,17 @@ def summarize_di_callers(obj):  # : AutoObject
         return fn_item(obj.caller)
 
 
-class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
+class WatchValidate(DebounceChanges):  # TODO: _WatchValidate
     error = tr.Unicode(default_value=None, allow_none=True)
     schema = tr.Dict(default_value=None, allow_none=True)
     model = tr.Type(klass=BaseModel, default_value=None, allow_none=True)
     show_validation = tr.Bool(default_value=True)
+    validation_mode = tr.Enum(values=["model", "field"], default_value="model")
+    # ^ "field": on change of the UI validate only the changed fields, validate the
+    #   whole model on save or when `validate_model` is called
     _value = tr.Any()  # TODO: update trait type on schema change
     _silent = tr.Bool(default_value=False)
+    count_sync_messages = 0  # messages sent on exit of `bulk_update`
 
     @contextlib.contextmanager
     def silence_autoui_traits(self):
@@ -48,6 +103,16 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
             raise e
         self._silent = False
 
+    @contextlib.contextmanager
+    def bulk_update(self, widgets: ty.Optional[ty.Iterable[w.Widget]] = None):
+        """batch the frontend messages of this widget (or `widgets`) and all
+        descendants, sending one message per changed widget on exit (see ipywidgets
+        `hold_sync`). `count_sync_messages` counts the messages sent."""
+        widgets = [self] if widgets is None else widgets
+        with hold_sync_all(*widgets) as counter:
+            yield counter
+        self.count_sync_messages += counter["messages"]
+
     @tr.observe("error")
     def _error(self, on_change):
         if self.error is None:
@@ -74,13 +139,22 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
 
     @property
     def value(self):
+        self.flush_changes()
         return self._value
 
     @value.setter
     def value(self, value: ty.Any):
+        self.flush_changes()
+        # ^ pending widget changes are applied to `_value` first, so that the widgets
+        #   are diffed against what they show
         if self.model is not None:
             value = pydantic_validate(self.model, value)
+            self._field_errors = {}
+        self._set_value(value)
+
+    def _set_value(self, value: ty.Any):
         if value != self._value:
+            old = self._value
             with self.hold_trait_notifications():
                 # these means that change events will be squashed
                 # and trigger after all widgets have changed
@@ -91,7 +165,7 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
                 # NOTE: it is required to set the whole "_value" otherwise
                 #       traitlets doesn't register the change.
                 with self.silence_autoui_traits():
-                    self._update_widgets_from_value()
+                    self._update_widgets_from_value(old=old)
 
     @property
     def json(self):
@@ -100,34 +174,74 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
         else:
             return json.dumps(self.value, indent=4)
 
-    def _set_validate_value(self, v):  # this is called on change of the UI
-        if self.model is not None:
+    def _validate_model(self, v):
+        try:
+            v_ = pydantic_validate(self.model, v)
+            self.error = None
+        except ValidationError as e:
+            self.error = str(e)
+            v_ = v
+        self._field_errors = {}
+        return v_
+
+    def _validate_fields(self, v: dict, keys: list):
+        adapters = get_field_adapters(self.model)
+        if not all(k in adapters for k in keys):
+            return self._validate_model(v)
+        if not hasattr(self, "_field_errors"):
+            self._field_errors = {}
+        v_ = dict(v)
+        for k in keys:
+            adapter = adapters[k]
             try:
-                v_ = pydantic_validate(self.model, v)
-                self.error = None
+                v_[k] = adapter.dump_python(adapter.validate_python(v[k]), mode="json")
+                self._field_errors.pop(k, None)
             except ValidationError as e:
-                self.error = str(e)
-                v_ = v
+                self._field_errors[k] = f"{k}: {e}"
+        if self._field_errors:
+            self.error = "\n".join(self._field_errors.values())
+        elif self.error is not None:
+            # the fields are valid, check if the model is too
+            v_ = self._validate_model(v_)
+        return v_
+
+    def _set_validate_value(self, v, keys: ty.Optional[list] = None):
+        # NOTE: this is called on change of the UI. `keys` are the changed keys,
+        #       if given and validation_mode == "field" only these are validated
+        if self.model is not None:
+            if keys is not None and self.validation_mode == "field":
+                v_ = self._validate_fields(v, keys)
+            else:
+                v_ = self._validate_model(v)
             if v_ != v:
-                try:
-                    with self.silence_autoui_traits():
-                        # silence trait notications to avoid infinite loop
-                        # and push validated value back to widgets
-                        self.value = v_
-                    pass
-                except Exception as e:
-                    self.value = v_
+                with self.silence_autoui_traits():
+                    # silence trait notications to avoid infinite loop
+                    # and push validated value back to widgets
+                    self._set_value(v_)
             else:
                 self._value = v_
         else:
             self._value = v
 
-    def _watch_validate_update_value(self):
+    def validate_model(self) -> bool:
+        """validate the whole value with the pydantic model (model validators, cross
+        field checks etc.), updating `error`. returns True if valid"""
+        self.flush_changes()
+        if self.model is None:
+            return True
+        self._set_validate_value(self._value)
+        return self.error is None
+
+    def _watch_validate_update_value(self, on_change: ty.Optional[dict] = None):
         # NOTE: this code only run when triggered by a change in a UI
         #       when value is forced in by the value setter it does not run
-        v = self._get_value()
+        if on_change is None:
+            v = self._get_value()
+        else:
+            v = self._get_value_on_change(on_change)
         if v != self._value:
-            self._set_validate_value(v)
+            keys = None if on_change is None else get_changed_keys(self._value, v)
+            self._set_validate_value(v, keys=keys)
             if hasattr(self, "savebuttonbar"):
                 self.savebuttonbar.unsaved_changes = True
 
@@ -140,7 +254,11 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
         message = f'change: {str(on_change["old"])} --> {str(on_change["new"])}'
         logger.info(message)
         if not self._silent:
-            self._watch_validate_update_value()
+            if self._debouncer is not None and self._debouncer.pending:
+                (pending,) = self._debouncer.args
+                if pending is None or pending["owner"] is not on_change["owner"]:
+                    on_change = None  # changes to many widgets, get the whole value
+            self._debounce_change(self._watch_validate_update_value, on_change)
 
     @classmethod
     def from_jsonschema(cls, schema: dict, value: ty.Any = None, **kwargs):
@@ -149,20 +267,13 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
                 f"schema must be a dict of type jsonschema, not {type(schema)}"
             )
         else:
-            model = None
             if "$defs" in schema.keys():
                 try:
-                    schema = replace_refs(schema, merge_props=True)
-                    schema = {k: v for k, v in schema.items() if k != "$defs"}
+                    schema = get_resolved_schema(schema)
                 except ValueError as e:
                     logger.warning(f"replace_refs error: \n{e}")
                     pass
-        if value is not None:
-            schema["value"] = value
-        schema = {**schema, **kwargs}
-        ui = cls(**schema)
-        ui.schema = schema
-        return ui
+        return cls.from_resolved_schema(schema, value=value, **kwargs)
 
     @classmethod
     def from_pydantic_model(
@@ -171,19 +282,29 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
         if not (issubclass(model, BaseModel) or issubclass(model, RootModel)):
             raise ValueError(f"schema must be a pydantic model, not {type(model)}")
         else:
-            schema = model.model_json_schema(by_alias=by_alias)
-            if "by_alias" in kwargs.keys():
-                by_alias = kwargs["by_alias"]
-            schema = replace_refs(schema, merge_props=True)
-            schema = {k: v for k, v in schema.items() if k != "$defs"}
+            schema = get_resolved_schema(model, by_alias=by_alias)
+        return cls.from_resolved_schema(schema, model=model, value=value, **kwargs)
+
+    @classmethod
+    def from_resolved_schema(
+        cls,
+        schema: dict,
+        model: ty.Optional[ty.Type[BaseModel]] = None,
+        value: ty.Any = None,
+        **kwargs,
+    ):
+        """init from a schema with `$ref`s already resolved (see `get_resolved_schema`).
+        the schema is used as is, pass a copy if it is reused."""
         if value is not None:
             schema["value"] = value
         schema = {**schema, **kwargs}
         ui = cls(**schema)
-        ui.model = model
+        if model is not None:
+            ui.model = model
         ui.schema = schema
-        ui._init_validation_error()
-        ui._set_validate_value(ui.value)
+        if model is not None:
+            ui._init_validation_error()
+            ui._set_validate_value(ui.value)
         return ui
 
     def _init_validation_error(self):
@@ -191,6 +312,10 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
             self.out_error = w.Output()
             self.is_valid = w.Valid(value=True)
             self.vbx_error.children = [self.is_valid, self.out_error]
+            if hasattr(self, "savebuttonbar"):
+                self.savebuttonbar.fns_onsave_add_action(
+                    self.validate_model, to_beginning=True
+                )
 
     @property
     def jsonschema_caller(self):
@@ -204,16 +329,23 @@ class WatchValidate(tr.HasTraits):  # TODO: _WatchValidate
     # i.e. AutoObject, AutoArray, EditGrid, etc.
     # ↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓
 
-    def _update_widgets_from_value(self):
+    def _update_widgets_from_value(self, old: ty.Any = None):
         # NOTE: fn name requried by WatchValidate base class
         #       `with self.silence_autoui_traits()` applied when
-        #       calling this method
+        #       calling this method. `old` is the previous value, only
+        #       widgets with a value that differs from it need updating
         pass
 
     def _get_value(self, **kwargs):
         # NOTE: fn name requried by WatchValidate base class
         pass  # NOTE: implement this method in your class
 
+    def _get_value_on_change(self, on_change: dict):
+        # NOTE: called when a child widget (`on_change["owner"]`) changes. override
+        #       to patch only the changed item of `_value` rather than getting the
+        #       value from all child widgets
+        return self._get_value()
+
     def _init_watcher(self):
         # NOTE: implement a method in your class
         #       it must call `_watch_validate_change` on change
@@ -0,0 +1,46 @@
+import collections
+import uuid
+
+import comm
+import ipywidgets as w
+import pytest
+from ipywidgets.widgets.tests.utils import DummyComm
+from ipywidgets.widgets.widget import _instances
+
+
+class UniqueDummyComm(DummyComm):
+    """ipywidgets test comm (has a kernel, so messages are sent) with a unique
+    comm_id per widget. `DummyComm.comm_id` is fixed, so widgets would overwrite
+    each other in `Widget.widgets`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.comm_id = kwargs.get("comm_id") or uuid.uuid4().hex
+
+
+@pytest.fixture
+def dummy_comm(monkeypatch):
+    """widgets opened in the test get a `UniqueDummyComm`. they are closed, and the
+    widget instances restored, on teardown"""
+    instances = dict(_instances)
+    monkeypatch.setattr(comm, "create_comm", UniqueDummyComm)
+    yield
+    for k, v in list(_instances.items()):
+        if k not in instances:
+            w.Widget.close(v)
+    _instances.clear()
+    _instances.update(instances)
+
+
+@pytest.fixture
+def count_sent(monkeypatch):
+    """counts the messages sent to the frontend by each widget (by `id(widget)`)"""
+    sent = collections.Counter()
+    _send = w.Widget._send
+
+    def send(self, msg, buffers=None):
+        sent[id(self)] += 1
+        return _send(self, msg, buffers=buffers)
+
+    monkeypatch.setattr(w.Widget, "_send", send)
+    return sent
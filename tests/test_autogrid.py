@@ -8,6 +8,10 @@ from pydantic import BaseModel, Field, RootModel
 from ipyautoui.custom.autogrid import AutoGrid, GridSchema
 from ipyautoui.automapschema import _init_model_schema
 from ipyautoui.demo_schemas.editable_datagrid import EditableGrid, DATAGRID_TEST_VALUE
+from ipyautoui.demo_schemas.multiindex_editable_grid import (
+    MultiIndexEditableGrid,
+    DATAGRID_TEST_VALUE as MULTIINDEX_VALUE,
+)
 
 from .constants import DIR_TESTS
 
@@ -335,6 +339,38 @@ class TestGridSchema:
         assert pd.isna(data.loc[0, "Optional String"])
         assert data.loc[0, "Number"] == 2  # value passed should be set
 
+    def test_coerce_data_fill_defaults(self):
+        class TestProperties(BaseModel):
+            inty: int = 1
+            booly: bool = True
+            stringy: str = "a"
+            listy: ty.List[int] = [1]
+            nully: ty.Optional[str] = None
+
+        class TestGridSchema(RootModel):
+            root: ty.List[TestProperties] = Field(
+                json_schema_extra=dict(format="dataframe")
+            )
+
+        model, schema = _init_model_schema(TestGridSchema)
+        gridschema = GridSchema(schema)
+        data = pd.DataFrame(
+            {
+                "listy": [[2], [], [None], None],
+                "inty": [2, None, 3, None],
+                "booly": [False, None, True, None],
+            }
+        )
+        df = gridschema.coerce_data(data)
+        assert list(df.columns) == ["Inty", "Booly", "Stringy", "Listy", "Nully"]
+        assert df["Inty"].tolist() == [2, 1, 3, 1]
+        assert df["Booly"].dtype == bool
+        assert df["Booly"].tolist() == [False, True, True, True]
+        assert df["Stringy"].tolist() == ["a"] * 4  # missing column
+        assert df["Listy"].tolist() == [[2], [1], [1], [1]]
+        assert df["Nully"].isna().all()
+        assert data["inty"].isna().sum() == 2  # input not modified
+
     def test_grid_types(self):
         class TestProperties(BaseModel):
             stringy: str
@@ -733,6 +769,33 @@ class TestAutoGrid:
         grid.order = ("floater",)
         assert grid.records() == [{"floater": 2.5}]
 
+    @pytest.mark.parametrize("schema", [EditableGrid, MultiIndexEditableGrid])
+    def test_records_cached(self, schema):
+        """records are cached and only the rows of edited cells are updated"""
+        value = DATAGRID_TEST_VALUE if schema is EditableGrid else MULTIINDEX_VALUE
+        data = pd.DataFrame([v | {"string": str(n)} for n, v in enumerate(value * 4)])
+        grid = AutoGrid(schema=schema, data=data)
+        records = grid.records()
+        assert records == grid._records()
+        cached = list(grid._records_cache)
+        records[0]["string"] = "mutated"  # copies are returned
+        assert grid.records()[0]["string"] == "0"
+
+        grid.set_cell_value(grid.map_name_index["string"], 1, "changed")
+        grid.set_cells([(grid.map_name_index["floater"], 3, 9.5)])
+        col = grid.column_names.index(grid.map_name_index["string"])
+        content = dict(event_type="cell-changed", row=2, column_index=col, value="x")
+        grid._DataGrid__handle_custom_msg(None, content, None)  # frontend edit
+        updated = grid.records()
+        assert updated == grid._records()
+        assert [r["string"] for r in updated] == ["0", "changed", "x", "3"]
+        assert updated[3]["floater"] == 9.5
+        assert grid._records_cache[0] is cached[0]  # unchanged rows aren't rebuilt
+        assert grid._records_cache[1] is not cached[1]
+
+        grid.delete_rows([2, 3])  # structural change, rebuilt in full
+        assert grid.records() == grid._records() == updated[:2]
+
     def test_update_from_schema(self):
         autogrid = AutoGrid()
 
@@ -767,3 +830,57 @@ class TestAutoGrid:
         json_schema_copy.pop("$defs", None)
         # Now compare the modified copies
         assert schema_copy == json_schema_copy
+
+    def test_update_from_schema_keeps_data(self):
+        class A(BaseModel):
+            a: str = "a"
+            b: int = 1
+
+        class B(BaseModel):
+            a: str = "a"
+            b: float = 2.0
+            c: int = 3
+
+        class GridA(RootModel):
+            root: ty.List[A] = Field(json_schema_extra=dict(format="dataframe"))
+
+        class GridB(RootModel):
+            root: ty.List[B] = Field(json_schema_extra=dict(format="dataframe"))
+
+        grid = AutoGrid(schema=GridA, data=pd.DataFrame([{"a": "x", "b": 5}] * 3))
+        grid.update_from_schema(GridB)
+        # unchanged columns keep their data, changed and new columns get the default
+        assert grid.records() == [{"a": "x", "b": 2.0, "c": 3}] * 3
+        grid.update_from_schema(GridA, data=pd.DataFrame([{"a": "y", "b": 1}]))
+        assert grid.records() == [{"a": "y", "b": 1}]
+
+    @pytest.mark.parametrize("transposed", [True, False])
+    def test_set_item_value_batched(self, transposed: bool):
+        data = pd.DataFrame(DATAGRID_TEST_VALUE * 3)
+        grid = AutoGrid(schema=EditableGrid, data=data, transposed=transposed)
+        check = AutoGrid(schema=EditableGrid, data=data, transposed=transposed)
+        sent, cell_changes = [], []
+        grid.comm.send = lambda data, **kwargs: sent.append(data)
+        grid.on_cell_change(cell_changes.append)
+        value = dict(DATAGRID_TEST_VALUE[0]) | {"string": "new", "floater": 1.5}
+
+        changes = grid.set_item_value(1, value)
+        if transposed:
+            column = check.get_col_name_from_index(1)
+            expected = [
+                check.set_cell_value_if_different(
+                    column, check.map_name_index[k], value[k]
+                )
+                for k in value
+            ]
+        else:
+            expected = [
+                check.set_cell_value_if_different(check.map_name_index[k], 1, v)
+                for k, v in value.items()
+            ]
+        assert changes == [c for c in expected if c is not None]
+        assert len(changes) == len(cell_changes) == 2
+        assert grid.records() == check.records()
+        events = [m["content"]["event_type"] for m in sent]
+        assert events == ["row-changed"] * (2 if transposed else 1)
+        assert grid.set_item_value(1, value) == []  # unchanged
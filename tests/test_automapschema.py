@@ -136,3 +136,164 @@ def test_union():
     assert "anyOf" in caller.kwargs["properties"]["floaty"]
     ui = widgetcaller(caller)
     assert len(ui.di_widgets["floaty"].anyOf) == 2
+
+
+@pytest.mark.parametrize("pydantic_model", [CoreIpywidgets, ComplexSerialisation])
+def test_dispatch_matches_linear_scan(pydantic_model):
+    from ipyautoui.automapschema import WidgetsMapIndex, get_widgets_map
+
+    widgets_map = get_widgets_map()
+    compiled = WidgetsMapIndex(widgets_map)
+    linear = WidgetsMapIndex(widgets_map, dispatch=False)
+    model, schema = _init_model_schema(pydantic_model)
+    for k, v in schema["properties"].items():
+        a, b = map_widget(dict(v), compiled), map_widget(dict(v), linear)
+        assert (a.autoui, a.allow_none) == (b.autoui, b.allow_none), k
+        assert a.kwargs.keys() == b.kwargs.keys(), k
+        assert a.kwargs_box == b.kwargs_box, k
+
+
+def test_dispatch_ambiguous_mapping():
+    import ipywidgets as w
+    from ipyautoui.automapschema import (
+        WidgetMapper,
+        get_widgets_map,
+        get_dispatch_tags,
+        is_IntText,
+    )
+
+    di = {"title": "a", "type": "integer", "default": 1}
+    assert get_dispatch_tags(di) == {"integer"}
+    widgets_map = get_widgets_map(
+        {"IntText2": WidgetMapper(fn_filt=is_IntText, widget=w.IntText)}
+    )
+    with pytest.raises(ValueError, match="multiple matches found"):
+        map_widget(di, widgets_map, fail_on_error=True)
+
+
+def test_widgets_map_registry():
+    import ipywidgets as w
+    from ipyautoui.automapschema import (
+        WidgetMapper,
+        WidgetsMapRegistry,
+        is_IntText,
+    )
+
+    registry = WidgetsMapRegistry()
+    assert registry.get() is registry.get({})
+    assert registry.get_containers() is registry.get_containers()
+    update = {"IntText": WidgetMapper(fn_filt=is_IntText, widget=w.BoundedIntText)}
+    same = {"IntText": WidgetMapper(fn_filt=is_IntText, widget=w.BoundedIntText)}
+    assert registry.get(update) is registry.get(same)
+    assert registry.get(update) is not registry.get()
+
+    di = {"title": "a", "type": "integer", "default": 1}
+    default = registry.get()
+    registry.register("IntText", update["IntText"])
+    assert registry.get() is not default
+    assert map_widget(dict(di), registry.get()).autoui == w.BoundedIntText
+    registry.unregister("IntText")
+    assert map_widget(dict(di), registry.get()).autoui == w.IntText
+
+
+def test_map_widget_cache():
+    from ipyautoui.automapschema import (
+        WidgetCallerCache,
+        get_widgets_map_index,
+        MAP_WIDGET_CACHE,
+    )
+
+    class Sub(BaseModel):
+        a: ty.Optional[int] = 1
+
+    class Test(BaseModel):
+        sub1: Sub = Sub()
+        sub2: Sub = Field(Sub(), title="Sub")
+        fruit: ty.Optional[int] = None
+
+    model, schema = _init_model_schema(Test)  # NOTE: properties are jsonref proxies
+    widgets_map = get_widgets_map_index()
+    MAP_WIDGET_CACHE.clear()
+    a = map_widget(dict(schema["properties"]["sub1"]), widgets_map)
+    b = map_widget(dict(schema["properties"]["sub1"]), widgets_map)
+    assert MAP_WIDGET_CACHE.info()["hits"] == 1
+    assert a is not b and a.kwargs is not b.kwargs
+    assert a.kwargs["properties"] == b.kwargs["properties"]
+    assert (a.autoui, a.allow_none, a.kwargs_box) == (
+        b.autoui,
+        b.allow_none,
+        b.kwargs_box,
+    )
+
+    # nullable: must be keyed before `is_Nullable` modifies the schema
+    c = map_widget(dict(schema["properties"]["fruit"]), widgets_map)
+    d = map_widget(dict(schema["properties"]["fruit"]), widgets_map)
+    assert c.allow_none and d.allow_none
+
+    cache = WidgetCallerCache(maxsize=2)
+    for n in range(3):
+        cache.set(n, a)
+    assert cache.get(0) is None and cache.get(2) is not None
+    assert cache.info() == dict(hits=1, misses=1, maxsize=2, currsize=2)
+    cache.resize(0)
+    assert cache.get(2) is None and cache.info()["currsize"] == 0
+
+
+def test_map_widget_as_model():
+    from ipyautoui.automapschema import WidgetCaller, WidgetCallerLite
+
+    di = {"title": "a", "type": "integer", "default": 1}
+    caller = map_widget(dict(di))
+    model = map_widget(dict(di), as_model=True)
+    assert isinstance(caller, WidgetCallerLite) and isinstance(model, WidgetCaller)
+    assert caller == model
+    assert caller.model_dump() == model.model_dump()
+    assert caller.to_model() == model
+    with pytest.raises(AttributeError):
+        caller.other = 1
+
+
+@pytest.fixture
+def widget_pool():
+    """the module level `WIDGET_POOL`, emptied. on teardown `maxsize` is restored and
+    the pool emptied"""
+    from ipyautoui.automapschema import WIDGET_POOL
+
+    maxsize = WIDGET_POOL.maxsize
+    WIDGET_POOL.clear()
+    yield WIDGET_POOL
+    WIDGET_POOL.resize(maxsize)
+    WIDGET_POOL.clear()
+
+
+def test_widget_pool(widget_pool):
+    from ipyautoui.autoanyof import AnyOf
+    from ipyautoui.custom.iterable import AutoArray
+
+    ui = AutoArray(items={"type": "integer", "default": 0}, value=[1, 2, 3])
+    widgets = ui.widgets
+    ui.remove_row(ui.boxes[0].key)
+    ui.value = [4]  # removes another row
+    assert widget_pool.info()["currsize"] == 2
+    ui.add_row()
+    assert ui.widgets[1] is widgets[2]  # recycled, with the value reset
+    assert ui.value == [4, 0]
+
+    widget_pool.resize(0)  # released widgets are closed
+    assert widgets[0].comm is None
+    ui.remove_row(ui.boxes[1].key)
+    assert widgets[2].comm is None
+    widget_pool.resize(256)
+
+    class A(BaseModel):
+        a: int = 1
+
+    class B(BaseModel):
+        b: str = "b"
+
+    ui = AnyOf(anyOf=[A.model_json_schema(), B.model_json_schema()])
+    ui.select.value = ui.titles[0]
+    widget = ui.widget
+    ui.select.value = ui.titles[1]
+    ui.select.value = ui.titles[0]
+    assert ui.widget is widget
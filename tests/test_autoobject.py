@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, RootModel, ConfigDict
+from pydantic import BaseModel, Field, RootModel, ConfigDict, create_model
 from ipyautoui.autoobject import AutoObject, AutoObjectForm
 import pytest
 import stringcase
@@ -223,3 +223,321 @@ def test_non_nullable_have_values():
     assert ui.value == {"a": "TEST", "b": "B"}
     ui.value = {"b": "TEST"}
     assert ui.value == {"a": "A", "b": "TEST"}
+
+
+def test_shared_widgets_map():
+    class Sub(BaseModel):
+        a: int = 1
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+        b: str = "b"
+
+    ui1 = AutoObject.from_pydantic_model(Test)
+    ui2 = AutoObject.from_pydantic_model(Test)
+    assert ui1.widgets_map is ui2.widgets_map
+    assert ui1.di_widgets["sub"].widgets_map is ui1.widgets_map
+
+    ui1.widgets_map = dict(ui1.widgets_map)  # dicts are coerced to an index
+    assert ui1.widgets_map.candidates({"type": "integer"})
+
+
+def test_incremental_value_update(monkeypatch):
+    class Sub(BaseModel):
+        a: int = 1
+        b: str = "b"
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+        c: float = 1.5
+        li: list[int] = [1, 2]
+
+    ui = AutoObject.from_pydantic_model(Test, value={"li": [1, 2]})
+    calls = []
+    _get_value = AutoObject._get_value
+
+    def get_value(self):
+        calls.append(self)
+        return _get_value(self)
+
+    monkeypatch.setattr(AutoObject, "_get_value", get_value)
+    ui.di_widgets["sub"].di_widgets["a"].value = 2  # patched at each level
+    ui.di_widgets["c"].value = 2.5
+    ui.di_widgets["li"].boxes[1].widget.value = 3
+    assert ui.value == {"sub": {"a": 2, "b": "b"}, "c": 2.5, "li": [1, 3]}
+    assert ui.di_widgets["sub"].value == {"a": 2, "b": "b"}
+    assert calls == []
+
+
+def test_validation_mode_field():
+    from pydantic import model_validator
+
+    calls = []
+
+    class Test(BaseModel):
+        a: int = 1
+        b: str = Field(default="b", max_length=3)
+        c: int = 2
+
+        @model_validator(mode="after")
+        def check_a_c(self):
+            calls.append(self)
+            if self.a > self.c:
+                raise ValueError("a must be <= c")
+            return self
+
+    ui = AutoObject.from_pydantic_model(Test, validation_mode="field")
+    calls.clear()
+    ui.di_widgets["b"].value = "bbbb"  # field constraint
+    assert ui.error.startswith("b:")
+    assert not ui.is_valid.value
+    ui.di_widgets["a"].value = 3  # a valid, b invalid
+    assert calls == []  # model not validated
+    ui.di_widgets["b"].value = "bb"  # fields valid, previous error so model checked
+    assert "a must be <= c" in ui.error
+    ui.di_widgets["c"].value = 4
+    assert ui.error is None and ui.is_valid.value
+    calls.clear()
+    ui.di_widgets["a"].value = 5  # cross-field error not checked until save
+    assert ui.error is None and calls == []
+    assert not ui.validate_model()
+    assert "a must be <= c" in ui.error
+    ui.di_widgets["c"].value = 6
+    assert ui.error is None
+    ui = AutoObjectForm.from_pydantic_model(Test, validation_mode="field")
+    assert ui.savebuttonbar.fns_onsave[0] == ui.validate_model  # validate on save
+
+
+def test_value_setter_diff(monkeypatch):
+    import traitlets as tr
+
+    class Sub(BaseModel):
+        a: int = 1
+        b: str = "b"
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+        c: float = 1.5
+        li: list[int] = [1, 2]
+
+    ui = AutoObject.from_pydantic_model(Test, value={"li": [1, 2]})
+    touched = []
+    set_ = tr.TraitType.set
+
+    def set(self, obj, value):
+        if self.name == "value":
+            touched.append(obj)
+        return set_(self, obj, value)
+
+    monkeypatch.setattr(tr.TraitType, "set", set)
+    ui.value = {"sub": {"a": 2, "b": "b"}, "c": 1.5, "li": [1, 3]}
+    assert ui.value == {"sub": {"a": 2, "b": "b"}, "c": 1.5, "li": [1, 3]}
+    sub, li = ui.di_widgets["sub"], ui.di_widgets["li"]
+    assert sub.di_widgets["a"] in touched and li.boxes[1].widget in touched
+    assert sub.di_widgets["b"] not in touched
+    assert ui.di_widgets["c"] not in touched
+    assert li.boxes[0].widget not in touched
+
+
+def test_bulk_update(dummy_comm, count_sent):
+    class Sub(BaseModel):
+        a: int = 1
+        b: ty.Optional[str] = None
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+        c: float = 1.5
+        d: ty.Optional[int] = None
+
+    ui = AutoObject.from_pydantic_model(Test)
+    sent = count_sent
+    sent.clear()
+    ui.value = {"sub": {"a": 2, "b": "b"}, "c": 2.5, "d": 1}
+    assert len(sent) > 3  # values and layouts of nested and null widgets
+    assert set(sent.values()) == {1}  # 1no message per widget
+
+    sent.clear()
+    count = ui.count_sync_messages
+    with ui.bulk_update() as counter:
+        ui.disabled = True
+        ui.show_null = True
+        ui.value = {"sub": {"a": 3, "b": None}, "c": 3.5, "d": None}
+    assert set(sent.values()) == {1}
+    assert counter["messages"] == len(sent)
+    assert ui.count_sync_messages - count == len(sent)
+
+
+def test_lazy_nested():
+    from ipyautoui.autoobject import LazyWidget
+    from ipyautoui.custom.iterable import AutoArray
+
+    class Sub(BaseModel):
+        a: int = 1
+        b: str = "b"
+
+    class Sub1(BaseModel):
+        sub: Sub = Sub()
+        c: int = 2
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+        sub1: Sub1 = Sub1()
+        li: list[int] = [1, 2]
+        d: float = 1.5
+
+    value = {"sub": {"a": 1, "b": "b"}, "sub1": Sub1().model_dump(), "li": [1, 2]}
+    ui = AutoObject.from_pydantic_model(Test, lazy_nested=True)
+    assert all(isinstance(ui.di_widgets[k], LazyWidget) for k in value)
+    assert ui.value == value | {"d": 1.5}
+
+    ui.value = {"sub": {"a": 2, "b": "c"}}  # held as plain data
+    assert isinstance(ui.di_widgets["sub"], LazyWidget)
+    ui.di_boxes["sub"].tgl.value = True  # created when opened
+    sub = ui.di_widgets["sub"]
+    assert isinstance(sub, AutoObject) and sub.value == {"a": 2, "b": "c"}
+    assert ui.di_boxes["sub"].widget is sub
+    sub.di_widgets["a"].value = 3
+    assert ui.value["sub"] == {"a": 3, "b": "c"}
+
+    ui.open_nested = True
+    assert isinstance(ui.di_widgets["li"], AutoArray)
+    assert ui.di_widgets["li"].value == [1, 2]
+    assert isinstance(ui.di_widgets["sub1"].di_widgets["sub"], LazyWidget)
+
+    ui = AutoObject.from_pydantic_model(Test, lazy_nested=True, order=["li", "d"])
+    assert isinstance(ui.di_widgets["li"], AutoArray)  # created as in order
+    assert isinstance(ui.di_widgets["sub"], LazyWidget)
+
+
+def test_paged():
+    fields = {f"f{n}": (int, n) for n in range(25)} | {
+        "nullable": (ty.Optional[str], None)
+    }
+    Test = create_model("Test", **fields)
+    value = Test().model_dump()
+    ui = AutoObject.from_pydantic_model(Test, page_size=10, page_buffer=2)
+    assert ui.value == value
+    assert list(ui.di_boxes) == [f"f{n}" for n in range(10)]
+    assert set(ui.di_widgets) == {f"f{n}" for n in range(12)}  # page + buffer
+    boxes = list(ui.di_boxes.values())
+
+    ui.di_widgets["f3"].value = 30
+    ui.page = 2
+    assert list(ui.di_boxes) == [f"f{n}" for n in range(20, 25)] + ["nullable"]
+    assert list(ui.di_boxes.values()) == boxes[:6]  # boxes are recycled
+    assert "f3" not in ui.di_widgets
+    assert ui.value == value | {"f3": 30}  # value of closed widgets retained
+
+    ui.value = value | {"f3": 3, "f21": 21, "nullable": "a"}
+    assert ui.di_widgets["f21"].value == 21
+    ui.page = 0
+    assert ui.di_widgets["f3"].value == 3
+    ui.page = 10
+    assert ui.page == 2  # clipped to the last page
+
+    ui.search = "f1"
+    assert ui.page == 0
+    assert list(ui.di_boxes) == ["f1"] + [f"f{n}" for n in range(10, 19)]
+
+    ui.page_size = None
+    assert set(ui.di_widgets) == set(fields)
+    assert ui.value == value | {"f21": 21, "nullable": "a"}
+
+
+def test_paged_pooled_widgets_not_closed_with_previous_form():
+    Test = create_model("Test", **{f"f{n}": (int, n) for n in range(25)})
+    ui1 = AutoObject.from_pydantic_model(Test, page_size=10)
+    widgets = list(ui1.di_widgets.values())
+    ui1.page = 2  # the widgets of page 0 are released to the pool
+    ui2 = AutoObject.from_pydantic_model(Test, page_size=10)
+    assert ui2.di_widgets["f7"] in widgets  # got from the pool
+    ui1.close()
+    widget = ui2.di_widgets["f7"]
+    assert widget.comm is not None
+    widget.value = 70
+    assert ui2.value["f7"] == 70
+
+
+def test_update_properties():
+    class A(BaseModel):
+        a: str = "a"
+        b: int = 1
+
+    class B(BaseModel):
+        a: str = "a"
+        b: float = 2.0
+        c: int = 3
+
+    ui = AutoObject.from_jsonschema(A.model_json_schema(), value={"a": "x", "b": 5})
+    widget = ui.di_widgets["a"]
+    ui.properties = B.model_json_schema()["properties"]
+    assert ui.di_widgets["a"] is widget  # unchanged properties keep their widget
+    assert ui.value == {"a": "x", "b": 2.0, "c": 3}
+    assert list(ui.di_boxes) == ["a", "b", "c"]
+    assert [b.widget for b in ui.vbx_widget.children] == list(ui.di_widgets.values())
+    ui.di_widgets["c"].value = 4
+    assert ui.value["c"] == 4
+
+    ui.properties = A.model_json_schema()["properties"]
+    assert ui.di_widgets["a"] is widget
+    assert ui.value == {"a": "x", "b": 1}
+
+
+def test_close_leak():
+    from ipywidgets.widgets.widget import _instances
+    from ipyautoui import AutoUi
+
+    class Sub(BaseModel):
+        c: ty.Optional[float] = None
+
+    class Test(BaseModel):
+        a: int = 1
+        b: str = "b"
+        sub: Sub = Sub()
+        li: list[int] = [1]
+
+    class Small(BaseModel):
+        a: int = 1
+        b: str = "b"
+
+    def create_close(fn_create):
+        """returns the ids of the widgets opened by `fn_create`, then closes the ui"""
+        before = set(_instances)
+        ui = fn_create()
+        created = set(_instances) - before
+        ui.close()
+        return created
+
+    def create_edit():
+        ui = AutoUi(Test)
+        ui.value = {"a": 2, "b": "c", "sub": {"c": 1.5}, "li": [1, 2, 3]}
+        return ui
+
+    AutoUi(Test).close()  # module level widgets are created on first use
+    created = set()
+    for _ in range(1000):
+        created |= create_close(lambda: AutoObject.from_pydantic_model(Small))
+    assert created and created.isdisjoint(_instances)
+    created = set()
+    for _ in range(10):
+        created |= create_close(create_edit)
+    assert created and created.isdisjoint(_instances)
+
+
+def test_close_on_del_keeps_children():
+    """garbage collecting a container (`Widget.__del__`) closes only the container,
+    not the widgets it holds (which may be shown elsewhere). `close()` closes all."""
+
+    class Test(BaseModel):
+        a: int = 1
+
+    ui = AutoObject.from_pydantic_model(Test)
+    widget = ui.di_widgets["a"]
+    ui.__del__()  # as when garbage collected
+    assert ui.comm is None and widget.comm is not None
+    widget.value = 2  # still open and usable
+
+    ui = AutoObject.from_pydantic_model(Test)
+    widget = ui.di_widgets["a"]
+    ui.close()
+    assert ui.comm is None and widget.comm is None
@@ -0,0 +1,118 @@
+import json
+import typing as ty
+import pytest
+import ipywidgets as w
+from pydantic import BaseModel, Field, RootModel
+import ipyautoui.automapschema as aumap
+from ipyautoui.autoui import AutoUi
+from ipyautoui.autoobject import AutoObject
+from ipyautoui.custom.editgrid import EditGrid
+from ipyautoui.autoplan import (
+    autoobject_from_plan,
+    compile_plan,
+    get_plan,
+)
+from ipyautoui.demo_schemas import RecursiveObject
+
+
+class Sub(BaseModel):
+    a: int = 1
+    b: ty.Optional[str] = None
+
+
+class Root(BaseModel):
+    c: float = 1.5
+    sub: Sub = Field(Sub(), title="Sub")
+
+
+def test_compile_plan():
+    plan = compile_plan(Root)
+    assert json.loads(json.dumps(plan)) == plan
+    assert plan["callers"]["c"]["widget"] == "ipywidgets.widgets.widget_float.FloatText"
+    nested = plan["callers"]["sub"]["kwargs"]["plan"]["callers"]
+    assert nested["b"]["allow_none"] and not nested["a"]["allow_none"]
+    with pytest.raises(ValueError):
+        compile_plan(RecursiveObject)
+
+
+def test_ui_from_plan(monkeypatch):
+    plan = compile_plan(Root)
+    value = AutoUi(Root).value
+
+    def map_widget(*args, **kwargs):
+        raise ValueError("map_widget called")
+
+    monkeypatch.setattr(aumap, "map_widget", map_widget)
+    ui = AutoUi(Root, plan=plan)
+    assert ui.value == value
+    assert ui.model is Root
+    ui.value = {"c": 2.0, "sub": {"a": 2, "b": "b"}}
+    assert ui.di_widgets["sub"].di_widgets["b"].value == "b"
+
+    ui = autoobject_from_plan(plan, value={"c": 3.0})
+    assert isinstance(ui, AutoObject) and ui.value["c"] == 3.0
+
+
+def test_get_plan(tmp_path, monkeypatch):
+    plan = get_plan(Root, fdir=tmp_path)
+    assert (tmp_path / f"{plan['schema_hash']}.json").is_file()
+
+    def compile_plan(*args, **kwargs):
+        raise ValueError("compile_plan called")
+
+    import ipyautoui.autoplan
+
+    with monkeypatch.context() as m:
+        m.setattr(ipyautoui.autoplan, "compile_plan", compile_plan)
+        assert get_plan(Root, fdir=tmp_path) == plan  # loaded from file
+
+    class Root2(Root):  # schema changed, plan recompiled
+        d: int = 1
+
+    plan2 = get_plan(Root2, fdir=tmp_path)
+    assert plan2["schema_hash"] != plan["schema_hash"]
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_plan_schema_changed(caplog):
+    class A(BaseModel):
+        a: int = 1
+
+    plan = compile_plan(A)
+
+    class A(BaseModel):  # model changed after the plan was compiled
+        a: str = "a"
+        b: int = 1
+
+    ui = AutoUi(A, plan=plan)
+    assert "plan invalidated" in caplog.text
+    assert isinstance(ui.di_widgets["a"], w.Text) and "b" in ui.di_widgets
+    assert ui.value == {"a": "a", "b": 1}
+
+    ui = autoobject_from_plan(plan, model=A)
+    assert isinstance(ui.di_widgets["a"], w.Text) and "b" in ui.di_widgets
+
+
+def test_plan_properties_changed():
+    plan = compile_plan(Root)
+    ui = AutoUi(Root, plan=plan)
+    c = ui.di_widgets["c"]
+
+    class Root2(BaseModel):
+        c: float = 1.5
+        d: str = "d"
+
+    ui.properties = aumap._init_model_schema(Root2)[1]["properties"]
+    assert ui.plan is None
+    assert list(ui.di_widgets) == ["c", "d"] and ui.di_widgets["c"] is c
+    assert isinstance(ui.di_widgets["d"], w.Text)
+
+
+def test_plan_editgrid(caplog):
+    class Grid(RootModel):
+        root: ty.List[Sub] = Field(json_schema_extra=dict(format="dataframe"))
+
+    plan = compile_plan(Grid)
+    ui = AutoUi(Grid, plan=plan, value=[{"a": 2}])
+    assert "plans aren't supported for EditGrid" in caplog.text
+    assert isinstance(ui, EditGrid) and ui.value[0]["a"] == 2
@@ -15,6 +15,7 @@ from ipyautoui.basemodel import file
 import pytest
 from pydantic import field_validator, BaseModel
 from enum import Enum
+import typing as ty
 
 
 DIR_TEST_DATA = DIR_TESTS / "testdata"
@@ -149,3 +150,25 @@ class TestAutoUi:
     # def test_display_file(self):
     #     fpths = list(pathlib.Path(DIR_FILETYPES).glob("*"))
     #     d0 = DisplayFile(fpths[0])
+
+
+def test_get_autoui_single_pass():
+    from ipyautoui.autoui import get_autoui
+    from ipyautoui.autobox import AutoBox
+    from ipyautoui.demo_schemas import EditableGrid
+
+    class Test(BaseModel):
+        a: ty.Optional[int] = None
+        b: str = "b"
+
+    ui = get_autoui(Test)
+    ui1, ui2 = ui(), ui(value={"a": 1, "b": "c"})
+    assert ui1.value == {"a": None, "b": "b"}
+    assert ui2.value == {"a": 1, "b": "c"}
+    assert ui1.schema is not ui2.schema  # each instance gets its own schema
+    assert ui1.di_widgets["a"] is not ui2.di_widgets["a"]
+
+    ui = get_autoui(Test.model_json_schema())()
+    assert ui.model is None and ui.value == {"a": None, "b": "b"}
+    assert get_autoui(EditableGrid)().model is EditableGrid
+    assert isinstance(get_autoui(RootSimple)(), AutoBox)
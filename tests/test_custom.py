@@ -74,3 +74,54 @@ class TestCustom:
 
     def test_load_project(self):
         load_project = LoadProject()
+
+
+def test_array_keyed_rows():
+    from ipyautoui.custom.iterable import AutoArray, Dictionary
+
+    ui = AutoArray(items={"type": "integer", "default": 0}, value=[1, 2, 3])
+    keys = [bx.key for bx in ui.boxes]
+    ui.add_row(key=keys[0], new_key="new")
+    assert ui.value == [1, 0, 2, 3]
+    assert [bx.key for bx in ui.boxes] == [keys[0], "new", *keys[1:]]
+    assert [bx.index for bx in ui.boxes] == [0, 1, 2, 3]
+    assert ui.add_row(new_key="new") is None  # key exists
+    ui.di_boxes["new"].widget.value = 5
+    assert ui.value == [1, 5, 2, 3]
+    ui.remove_row(keys[1])
+    assert ui.value == [1, 5, 3]
+    assert ui.di_boxes[keys[2]].index == 2 and keys[1] not in ui.di_boxes
+    ui.value = [1]
+    assert list(ui.di_boxes) == [keys[0]]
+
+    ui = Dictionary(widgets={"b": w.IntText(1), "a": w.IntText(2)})
+    ui.add_row(new_key="c")
+    ui.add_row(new_key="aa")
+    assert [bx.key for bx in ui.boxes] == ["a", "aa", "b", "c"]  # sorted on key
+
+
+def test_array_bulk_rows(dummy_comm, count_sent):
+    from ipyautoui.custom.iterable import AutoArray
+
+    ui = AutoArray(items={"type": "integer", "default": 0}, value=[1])
+    changes = []
+    ui.observe(changes.append, "_value")
+    sent = count_sent
+    sent.clear()
+    ui.extend(range(2, 201))
+    assert ui.value == list(range(1, 201))
+    assert [bx.widget.value for bx in ui.boxes] == ui.value
+    assert sent[id(ui.bx_boxes)] == 1  # children set once
+    assert len(changes) == 1
+
+    sent.clear()
+    ui.set_rows([5, 4, 3])
+    assert ui.value == [5, 4, 3] and len(ui.boxes) == 3
+    assert sent[id(ui.bx_boxes)] == 1
+    assert len(changes) == 2
+    ui.boxes[0].widget.value = 6
+    assert ui.value == [6, 4, 3]
+
+    sent.clear()
+    ui.value = list(range(200))
+    assert sent[id(ui.bx_boxes)] == 1
@@ -1,9 +1,10 @@
 from pydantic import BaseModel, Field, RootModel
 import typing as ty
+import sqlite3
 import pandas as pd
 
 from .constants import DIR_TESTS
-from ipyautoui.custom.editgrid import EditGrid
+from ipyautoui.custom.editgrid import EditGrid, PagedDataHandler
 from ipyautoui.custom.buttonbars import CrudButtonBar
 from ipyautoui.demo_schemas.editable_datagrid import EditableGrid, DataFrameCols
 from ipyautoui import AutoUi
@@ -239,3 +240,129 @@ class TestAutoEditGrid:
         grid._save_add_to_grid()
         assert v != grid.value
         assert v != grid._value
+
+
+def test_editgrid_crud_rows_in_place():
+    class Row(BaseModel):
+        string: str = "a"
+        inty: int = 1
+
+    class Grid(RootModel):
+        root: ty.List[Row] = Field(json_schema_extra=dict(format="dataframe"))
+
+    egrid = EditGrid(schema=Grid, value=[{"string": "x", "inty": n} for n in range(3)])
+    schema = egrid.grid._data["schema"]
+
+    egrid._save_add_to_grid()  # add
+    assert egrid.value[-1] == {"string": "a", "inty": 1}
+    egrid.grid.select(row1=0, column1=0, row2=1, column2=0, clear_mode="all")
+    egrid._copy()  # copy
+    assert [v["inty"] for v in egrid.value] == [0, 1, 2, 1, 0, 1]
+    egrid.grid.select(row1=1, column1=0, row2=2, column2=0, clear_mode="all")
+    egrid._delete_selected()  # delete
+    assert [v["inty"] for v in egrid.value] == [0, 1, 0, 1]
+    assert egrid.grid._data["schema"] is schema  # not rebuilt
+    assert egrid.grid._data["data"]["ipydguuid"].tolist() == [0, 1, 2, 3]
+
+    egrid.grid.insert_rows(1, [{"string": "y", "inty": 5}])
+    assert egrid.value[1] == {"string": "y", "inty": 5}
+    assert egrid.grid.data.index.tolist() == [0, 1, 2, 3, 4]
+
+
+class SqliteRows:
+    """in-memory database stand-in for a PagedDataHandler"""
+
+    OPERATORS = {"=": "=", "<": "<", ">": ">", "<=": "<=", ">=": ">=", "!=": "!="}
+
+    def __init__(self, n_rows: int):
+        self.con = sqlite3.connect(":memory:")
+        self.con.execute("CREATE TABLE row (string TEXT, inty INTEGER)")
+        self.con.executemany(
+            "INSERT INTO row VALUES (?, ?)", [(f"s{n}", n) for n in range(n_rows)]
+        )
+        self.fetched = []
+
+    def _where(self, filter):
+        where = [f"{f['key']} {self.OPERATORS[f['operator']]} ?" for f in filter]
+        params = [f["value"] for f in filter]
+        return (" WHERE " + " AND ".join(where)) if where else "", params
+
+    def get_page(self, offset, limit, sort, filter):
+        self.fetched.append(offset // limit)
+        where, params = self._where(filter)
+        order = ", ".join(f"{k} {'DESC' if desc else 'ASC'}" for k, desc in sort)
+        sql = f"SELECT string, inty FROM row{where} ORDER BY {order or 'rowid'}"
+        rows = self.con.execute(f"{sql} LIMIT ? OFFSET ?", params + [limit, offset])
+        return [dict(string=s, inty=i) for s, i in rows]
+
+    def count(self, filter):
+        where, params = self._where(filter)
+        return self.con.execute(f"SELECT COUNT(*) FROM row{where}", params).fetchone()[
+            0
+        ]
+
+    def post(self, value):
+        self.con.execute(
+            "INSERT INTO row VALUES (?, ?)", (value["string"], value["inty"])
+        )
+
+    def delete(self, value):
+        self.con.execute("DELETE FROM row WHERE inty = ?", (value["inty"],))
+
+
+def test_editgrid_paged_datahandler():
+    class Row(BaseModel):
+        string: str = "a"
+        inty: int = -1
+
+    class Grid(RootModel):
+        root: ty.List[Row] = Field(json_schema_extra=dict(format="dataframe"))
+
+    db = SqliteRows(1005)
+    datahandler = PagedDataHandler(
+        fn_get_page=db.get_page,
+        fn_count=db.count,
+        fn_post=db.post,
+        fn_patch=lambda v: v,
+        fn_delete=db.delete,
+        fn_copy=db.post,
+        page_size=10,
+        window_pages=3,
+        cache_pages=5,
+    )
+    egrid = EditGrid(schema=Grid, datahandler=datahandler)
+    assert [v["inty"] for v in egrid.value] == list(range(30))
+    assert db.fetched == [0, 1, 2]
+    assert egrid.html_rows.value == "<i>rows 1-30 of 1005</i>"
+
+    egrid.next_page()  # sliding window, only the new page is fetched
+    assert [v["inty"] for v in egrid.value] == list(range(10, 40))
+    assert db.fetched == [0, 1, 2, 3]
+    for _ in range(4):
+        egrid.next_page()
+    assert db.fetched[-1] == 7 and len(egrid.page_cache.pages) == 5  # LRU
+    egrid.set_window(1000)  # clamped to the last window
+    assert egrid.value[-1]["inty"] == 1004
+    assert egrid.html_rows.value == "<i>rows 981-1005 of 1005</i>"
+    assert egrid.bn_next_page.disabled
+
+    db.fetched.clear()
+    egrid._post()  # post, then only the window is fetched again
+    egrid._save_add_to_grid()
+    assert db.fetched == [98, 99, 100]
+    assert egrid.value[-1] == {"string": "a", "inty": -1}
+
+    egrid.grid.transform(
+        [
+            {"type": "filter", "column": "Inty", "operator": "<", "value": 25},
+            {"type": "sort", "column": "Inty", "desc": True},
+        ]
+    )
+    assert egrid.window_page == 0
+    assert [v["inty"] for v in egrid.value][:3] == [24, 23, 22]
+    assert egrid.page_cache.count == 26
+
+    egrid.grid.select(row1=0, column1=0, row2=1, column2=0, clear_mode="all")
+    egrid._delete_selected()
+    assert [v["inty"] for v in egrid.value][:3] == [22, 21, 20]
+    assert egrid.grid._transforms[0]["type"] == "filter"  # transforms are kept
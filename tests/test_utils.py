@@ -1,6 +1,19 @@
 import pandas as pd
 import numpy as np
-from ipyautoui._utils import is_null
+import gc
+import pathlib
+import pytest
+from pytest_examples import find_examples, CodeExample, EvalExample
+import ipywidgets as w
+import traitlets as tr
+from ipyautoui._utils import is_null, remove_non_present_kwargs, _TRAIT_NAMES
+
+fpth_module = pathlib.Path(__file__).parent.parent / "src" / "ipyautoui" / "_utils.py"
+
+
+@pytest.mark.parametrize("example", find_examples(fpth_module), ids=str)
+def test_docstrings(example: CodeExample, eval_example: EvalExample):
+    eval_example.run_print_check(example)
 
 
 def test_is_null():
@@ -13,3 +26,50 @@ def test_is_null():
     assert is_null({"a": 1, "b": 2}) == False
     assert is_null(pd.Series([1, 2])) == False
     assert is_null(pd.DataFrame({"a": [1, 2]})) == False
+
+
+def test_remove_non_present_kwargs():
+    class Widget(w.VBox):
+        _value = tr.Int()
+
+        def __init__(self, a=1, **kwargs):
+            super().__init__(**kwargs)
+
+    di = {"a": 1, "value": 2, "layout": {}, "other": 3}
+    assert remove_non_present_kwargs(Widget, di) == {"a": 1, "value": 2, "layout": {}}
+    assert Widget in _TRAIT_NAMES
+    assert remove_non_present_kwargs(Widget, di) == {"a": 1, "value": 2, "layout": {}}
+
+    n = len(_TRAIT_NAMES)
+    del Widget
+    gc.collect()
+    assert len(_TRAIT_NAMES) == n - 1  # dynamically created classes are collected
+
+
+def test_resolved_schema_cache():
+    from pydantic import BaseModel
+    from ipyautoui._utils import ResolvedSchemaCache
+    from ipyautoui.demo_schemas import RecursiveObject
+
+    class Sub(BaseModel):
+        a: int = 1
+
+    class Test(BaseModel):
+        sub: Sub = Sub()
+
+    cache = ResolvedSchemaCache()
+    s1 = cache.resolve_model(Test)
+    s1["properties"]["sub"]["properties"]["a"]["default"] = 2  # copies are mutable
+    s2 = cache.resolve_model(Test)
+    assert s2["properties"]["sub"]["properties"]["a"]["default"] == 1
+    assert cache.info()["hits"] == 1 and cache.hit_rate == 0.5
+
+    s3 = cache.resolve(Test.model_json_schema())
+    assert s3 == s2 and "$defs" not in s3
+    cache.resolve(Test.model_json_schema())
+    assert cache.info()["currsize"] == 2 and cache.hits == 2
+
+    cache.resolve_model(RecursiveObject)  # recursive schemas aren't cached
+    assert cache.info()["currsize"] == 2
+    cache.clear()
+    assert cache.info() == dict(hits=0, misses=0, hit_rate=0.0, currsize=0)
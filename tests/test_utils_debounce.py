@@ -0,0 +1,120 @@
+import asyncio
+from pydantic import BaseModel
+from ipyautoui.autoobject import AutoObject
+from ipyautoui.custom.editgrid import EditGrid
+from ipyautoui.demo_schemas.editable_datagrid import EditableGrid
+from ipyautoui._utils_debounce import Debouncer
+
+WAIT = 0.02
+
+
+def test_debouncer_no_event_loop():
+    calls = []
+    debouncer = Debouncer(WAIT)
+    debouncer(calls.append, 1)  # no running loop, called immediately
+    assert calls == [1] and not debouncer.pending
+
+
+def test_debouncer():
+    calls = []
+
+    async def main():
+        debouncer = Debouncer(WAIT)
+        for n in range(5):
+            debouncer(calls.append, n)
+        assert calls == [] and debouncer.pending
+        await asyncio.sleep(WAIT * 3)
+        assert calls == [4]  # coalesced, latest args
+        debouncer(calls.append, 5)
+        debouncer.flush()
+        assert calls == [4, 5]
+        debouncer(calls.append, 6)
+        debouncer.cancel()
+        await asyncio.sleep(WAIT * 3)
+        assert calls == [4, 5]
+
+    asyncio.run(main())
+
+
+def test_throttle():
+    calls = []
+
+    async def main():
+        debouncer = Debouncer(WAIT, mode="throttle")
+        for n in range(5):
+            debouncer(calls.append, n)
+        assert calls == [0]  # leading call
+        await asyncio.sleep(WAIT * 3)
+        assert calls == [0, 4]  # trailing call
+
+    asyncio.run(main())
+
+
+class Model(BaseModel):
+    a: int = 1
+    b: str = "b"
+
+
+def test_autoobject_debounce():
+    async def main():
+        ui = AutoObject.from_pydantic_model(Model, change_policy="debounce")
+        ui.change_wait = WAIT
+        calls = []
+        ui.observe(calls.append, "_value")
+        for n in range(2, 5):
+            ui.di_widgets["a"].value = n
+        ui.di_widgets["b"].value = "c"
+        assert calls == []
+        await asyncio.sleep(WAIT * 3)
+        assert len(calls) == 1  # coalesced
+        assert ui._value == {"a": 4, "b": "c"}
+
+        ui.di_widgets["a"].value = 5
+        assert ui.value == {"a": 5, "b": "c"}  # flushed on read
+        assert len(calls) == 2
+        ui.di_widgets["a"].value = 6
+        ui.value = {"a": 7, "b": "d"}  # pending change flushed, then overwritten
+        await asyncio.sleep(WAIT * 3)
+        assert ui.value == {"a": 7, "b": "d"}
+
+    asyncio.run(main())
+
+
+def test_value_set_with_pending_changes():
+    """widgets with pending (debounced) changes are set, even if the new value equals
+    the value before the change"""
+    from ipyautoui.custom.iterable import AutoArray
+
+    async def main():
+        ui = AutoObject.from_pydantic_model(Model, change_policy="debounce")
+        ui.change_wait = WAIT
+        ui.di_widgets["a"].value = 6
+        ui.value = {"a": 1, "b": "d"}
+        assert ui.di_widgets["a"].value == 1
+        await asyncio.sleep(WAIT * 3)
+        assert ui.value == {"a": 1, "b": "d"}
+
+        ui = AutoArray(items={"type": "integer"}, value=[1, 2])
+        ui.change_policy, ui.change_wait = "debounce", WAIT
+        ui.boxes[0].widget.value = 6
+        ui.value = [1, 2]
+        assert [bx.widget.value for bx in ui.boxes] == [1, 2]
+        await asyncio.sleep(WAIT * 3)
+        assert ui.value == [1, 2]
+
+    asyncio.run(main())
+
+
+def test_editgrid_debounce():
+    async def main():
+        grid = EditGrid(schema=EditableGrid, change_policy="debounce", change_wait=WAIT)
+        calls = []
+        grid.observe(calls.append, "_value")
+        value = grid.value
+        grid.grid.data = grid.grid.data.iloc[:1]
+        grid.grid.data = grid.grid.data.iloc[:0]
+        assert calls == [] and grid._value == value
+        await asyncio.sleep(WAIT * 3)
+        assert len(calls) == 1 and grid.value == ()
+
+    asyncio.run(main())